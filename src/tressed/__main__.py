@@ -0,0 +1,75 @@
+"""
+Command line interface, for example to compile the loaders and dumpers of some types
+ahead of time:
+
+    python -m tressed compile pkg.models:Order pkg.models:Orders -o pkg/compiled.py
+"""
+
+import argparse
+import sys
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def _compile(args: argparse.Namespace, command: str) -> int:
+    from tressed.compiler import compile_module, resolve_reference
+
+    alias_fn = resolve_reference(args.alias_fn) if args.alias_fn else None
+    source = compile_module(
+        [resolve_reference(type_form) for type_form in args.type_forms],
+        alias_fn=alias_fn,
+        command=command,
+    )
+    if args.output == "-":
+        sys.stdout.write(source)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(source)
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(prog="python -m tressed")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = subparsers.add_parser(
+        "compile",
+        help="Compile the loaders and dumpers of type forms into a Python module",
+    )
+    compile_parser.add_argument(
+        "type_forms",
+        nargs="+",
+        metavar="TYPE_FORM",
+        help="Type form to compile, as module:qualname, for example pkg.models:Order",
+    )
+    compile_parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="Path of the module to write, by default standard output",
+    )
+    compile_parser.add_argument(
+        "--alias-fn",
+        metavar="ALIAS_FN",
+        help="Alias function the loader and dumper use, as module:qualname, "
+        "for example tressed.alias:to_camel",
+    )
+
+    args = parser.parse_args(argv)
+    command = " ".join(["python -m tressed", *argv])
+    try:
+        match args.command:
+            case "compile":
+                return _compile(args, command)
+    except (ImportError, AttributeError, ValueError) as e:
+        parser.error(str(e))
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
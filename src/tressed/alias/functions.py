@@ -1,6 +1,7 @@
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
+    from typing import Any, Final
 
     from tressed.alias.types import Alias, AliasFn, TypePathAliasFn
     from tressed.type_form import TypeForm
@@ -8,6 +9,7 @@ if TYPE_CHECKING:
 
 __all__ = [
     "normalize_alias_fn",
+    "is_path_aware_alias_fn",
     "make_maybe_dataclass_alias_fn",
     "compose_alias_fn",
     "to_identity",
@@ -16,12 +18,7 @@ __all__ = [
 ]
 
 
-def normalize_alias_fn[AliasT = Alias](
-    alias_fn: AliasFn[AliasT],
-) -> TypePathAliasFn[AliasT]:
-    """
-    Normalize alias fn to a type path alias fn.
-    """
+def _alias_fn_arg_count(alias_fn: AliasFn[Any]) -> int:
     # Avoid importing heavy inspect module, do some manual introspection
     if code := getattr(alias_fn, "__code__", None):
         fn = alias_fn
@@ -46,7 +43,26 @@ def normalize_alias_fn[AliasT = Alias](
     else:
         raise ValueError(f"Unsupported alias function {alias_fn!r}")
 
-    match arg_count:
+    return arg_count
+
+
+def is_path_aware_alias_fn(alias_fn: AliasFn[Any]) -> bool:
+    """
+    Whether the alias function depends on the type path.
+    Aliases of path-aware alias functions can't be shared between type paths.
+    """
+    if (path_aware := getattr(alias_fn, "path_aware", None)) is not None:
+        return path_aware
+    return _alias_fn_arg_count(alias_fn) >= 3
+
+
+def normalize_alias_fn[AliasT = Alias](
+    alias_fn: AliasFn[AliasT],
+) -> TypePathAliasFn[AliasT]:
+    """
+    Normalize alias fn to a type path alias fn.
+    """
+    match _alias_fn_arg_count(alias_fn):
         case 3:
             return alias_fn  # type: ignore[return-value]
         case 2:
@@ -124,9 +140,7 @@ def to_camel(name: str) -> str:
 
 
 def make_maybe_dataclass_alias_fn(alias_field: str) -> AliasFn[Alias | None]:
-    def _maybe_dataclass_alias_fn(
-        name: str, type_form: TypeForm, type_path: TypePath
-    ) -> Alias | None:
+    def _maybe_dataclass_alias_fn(name: str, type_form: TypeForm) -> Alias | None:
         if fields := getattr(type_form, "__dataclass_fields__", None):
             field = fields[name]
             return field.metadata.get(alias_field)
@@ -135,6 +149,26 @@ def make_maybe_dataclass_alias_fn(alias_field: str) -> AliasFn[Alias | None]:
     return _maybe_dataclass_alias_fn
 
 
+class _ComposedAliasFn:
+    __slots__ = ("alias_fns", "default_alias_fn", "path_aware")
+
+    def __init__(
+        self,
+        alias_fns: Sequence[TypePathAliasFn[Alias | None]],
+        default_alias_fn: TypePathAliasFn[Alias],
+        path_aware: bool,
+    ) -> None:
+        self.alias_fns: Final = alias_fns
+        self.default_alias_fn: Final = default_alias_fn
+        self.path_aware: Final = path_aware
+
+    def __call__(self, name: str, type_form: TypeForm, type_path: TypePath) -> Alias:
+        for alias_fn in self.alias_fns:
+            if (alias := alias_fn(name, type_form, type_path)) is not None:
+                return alias
+        return self.default_alias_fn(name, type_form, type_path)
+
+
 def compose_alias_fn(
     *alias_fns: AliasFn[Alias | None],
     default_alias_fn: AliasFn[Alias] = to_identity,
@@ -143,16 +177,14 @@ def compose_alias_fn(
     Create an alias function by composing several alias functions.
     The functions are tried in order until an alias is returned.
     If none of the function match, the alias is resolved using the default alias function.
-    """
-    normalized_alias_fns = [normalize_alias_fn(alias_fn) for alias_fn in alias_fns]
-    normalized_default_alias_fn = normalize_alias_fn(default_alias_fn)
 
-    def _composed_alias_fn(
-        name: str, type_form: TypeForm, type_path: TypePath
-    ) -> Alias:
-        for alias_fn in normalized_alias_fns:
-            if (alias := alias_fn(name, type_form, type_path)) is not None:
-                return alias
-        return normalized_default_alias_fn(name, type_form, type_path)
-
-    return _composed_alias_fn
+    The composed alias function is path-aware only if one of the alias functions is.
+    """
+    return _ComposedAliasFn(
+        [normalize_alias_fn(alias_fn) for alias_fn in alias_fns],
+        normalize_alias_fn(default_alias_fn),
+        path_aware=any(
+            is_path_aware_alias_fn(alias_fn)
+            for alias_fn in (*alias_fns, default_alias_fn)
+        ),
+    )
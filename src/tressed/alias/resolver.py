@@ -1,5 +1,10 @@
+from tressed.type_path import materialize_type_path
+
 TYPE_CHEKCING = False
 if TYPE_CHEKCING:
+    from collections import OrderedDict
+    from typing import Final
+
     from tressed.alias.types import Alias, AliasFn
     from tressed.type_form import TypeForm
     from tressed.type_path import TypePath
@@ -8,27 +13,106 @@ __all__ = ["AliasResolver"]
 
 
 class AliasResolver:
+    """
+    Resolve aliases using the given alias function, caching the resolved aliases.
+
+    If the alias function does not depend on the type path, aliases are cached per
+    (type form, name), else aliases are cached per (name, type form, type path) in a
+    least recently used cache. Both caches hold at most max_cache_size entries.
+
+    Lazy type paths are materialized before being passed to the alias function.
+    """
+
     def __init__(
-        self, alias_fn: AliasFn | None = None, cache_resolved_aliases: bool = True
+        self,
+        alias_fn: AliasFn | None = None,
+        cache_resolved_aliases: bool = True,
+        max_cache_size: int | None = 4096,
+        # Whether the alias function depends on the type path, inferred from the alias
+        # function signature by default.
+        path_aware: bool | None = None,
     ) -> None:
-        from tressed.alias.functions import normalize_alias_fn, to_identity
+        from tressed.alias.functions import (
+            is_path_aware_alias_fn,
+            normalize_alias_fn,
+            to_identity,
+        )
 
         if alias_fn is None:
             alias_fn = to_identity
+        if path_aware is None:
+            path_aware = is_path_aware_alias_fn(alias_fn)
         self._alias_fn = normalize_alias_fn(alias_fn)
-        self._cache: dict[tuple[str, TypeForm, TypePath], Alias] = {}
-        self.resolve = (
-            self._resolve_cached if cache_resolved_aliases else self._alias_fn
-        )
+        self.path_aware: Final = path_aware
+        self.max_cache_size: Final = max_cache_size
+        self.cache_resolved_aliases: Final = cache_resolved_aliases
+        self._cache: dict[tuple[TypeForm, str] | tuple[str, TypeForm, TypePath], Alias]
+        if not cache_resolved_aliases:
+            self._cache = {}
+            self.resolve = self._resolve_uncached
+        elif path_aware:
+            from collections import OrderedDict
+
+            self._lru_cache: OrderedDict[tuple[str, TypeForm, TypePath], Alias] = (
+                OrderedDict()
+            )
+            self._cache = self._lru_cache  # type: ignore[assignment]
+            self.resolve = self._resolve_cached_lru
+        else:
+            self._cache = {}
+            self.resolve = self._resolve_cached
+
+    def resolve_static(self, name: str, type_form: TypeForm) -> Alias | None:
+        """
+        Resolve an alias independently of the type path, for example to precompute
+        the aliases of the fields of a type.
+
+        Returns None if the alias depends on the type path or if aliases must not be cached.
+        """
+        if self.path_aware or not self.cache_resolved_aliases:
+            return None
+        return self.resolve(name, type_form, ())
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def _resolve_uncached(
+        self, name: str, type_form: TypeForm, type_path: TypePath
+    ) -> Alias:
+        return self._alias_fn(name, type_form, materialize_type_path(type_path))
 
     def _resolve_cached(
         self, name: str, type_form: TypeForm, type_path: TypePath
     ) -> Alias:
-        cache_key = (name, type_form, type_path)
+        cache_key = (type_form, name)
         if (alias := self._cache.get(cache_key)) is not None:
             return alias
 
+        alias = self._alias_fn(name, type_form, materialize_type_path(type_path))
+
+        cache = self._cache
+        if (max_cache_size := self.max_cache_size) is not None:
+            while len(cache) >= max_cache_size:
+                # Evict the oldest entry
+                del cache[next(iter(cache))]
+        cache[cache_key] = alias
+        return alias
+
+    def _resolve_cached_lru(
+        self, name: str, type_form: TypeForm, type_path: TypePath
+    ) -> Alias:
+        cache = self._lru_cache
+        type_path = materialize_type_path(type_path)
+        cache_key = (name, type_form, type_path)
+        if (alias := cache.get(cache_key)) is not None:
+            cache.move_to_end(cache_key)
+            return alias
+
         alias = self._alias_fn(name, type_form, type_path)
 
-        self._cache[cache_key] = alias
+        if (max_cache_size := self.max_cache_size) is not None:
+            while len(cache) >= max_cache_size:
+                # Evict the least recently used entry
+                cache.popitem(last=False)
+        cache[cache_key] = alias
         return alias
@@ -0,0 +1,99 @@
+"""
+Bounded cache of values computed per type form, for example memoized type handlers.
+
+Classes are held through weak references, so that classes created dynamically, for
+example per plugin reload, are dropped from the cache once garbage collected.
+Other type forms, like generic aliases, are usually recreated on every use and compare
+by value, they are held strongly until evicted.
+"""
+
+from weakref import ref
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import Final
+
+    from tressed.type_form import TypeForm
+
+__all__ = ["TypeFormCache"]
+
+
+class TypeFormCache[V]:
+    """
+    Cache mapping type forms to values, holding at most max_size entries.
+
+    Once full, the oldest entries are evicted first.
+    """
+
+    __slots__ = ("max_size", "_values", "_class_values", "_class_refs")
+
+    def __init__(self, max_size: int | None = 4096) -> None:
+        self.max_size: Final = max_size
+        self._values: dict[TypeForm, V] = {}
+        # Classes are keyed by their weak reference without callback, which is shared
+        # by all weak references to the class without callback.
+        self._class_values: dict[ref[type], V] = {}
+        # Weak references with a callback discarding the entry of a collected class.
+        self._class_refs: dict[ref[type], ref[type]] = {}
+
+    def __len__(self) -> int:
+        return len(self._values) + len(self._class_values)
+
+    def get(self, type_form: TypeForm) -> V | None:
+        if (value := self._values.get(type_form)) is None:
+            try:
+                return self._class_values.get(ref(type_form))  # type: ignore[arg-type]
+            except TypeError:
+                # Not weakly referenceable
+                return None
+        return value
+
+    def items(self) -> Iterator[tuple[TypeForm, V]]:
+        yield from list(self._values.items())
+        for key, value in list(self._class_values.items()):
+            if (type_form := key()) is not None:
+                yield type_form, value
+
+    def add(self, type_form: TypeForm, value: V) -> None:
+        if (max_size := self.max_size) is not None:
+            if max_size <= 0:
+                return
+            while len(self) >= max_size:
+                self._evict()
+
+        if isinstance(type_form, type):
+            try:
+                key = ref(type_form)
+            except TypeError:
+                # Classes not supporting weak references are held strongly.
+                pass
+            else:
+                class_values = self._class_values
+                class_refs = self._class_refs
+
+                def discard(_: ref[type]) -> None:
+                    # Dead weak references compare by identity
+                    class_values.pop(key, None)
+                    class_refs.pop(key, None)
+
+                class_refs[key] = ref(type_form, discard)
+                class_values[key] = value
+                return
+
+        self._values[type_form] = value
+
+    def _evict(self) -> None:
+        # Evict the oldest entry of the largest of both dicts, each dict keeps its own
+        # insertion order.
+        if len(self._values) >= len(self._class_values):
+            del self._values[next(iter(self._values))]
+        else:
+            key = next(iter(self._class_values))
+            del self._class_values[key]
+            del self._class_refs[key]
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._class_values.clear()
+        self._class_refs.clear()
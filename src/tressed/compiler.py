@@ -0,0 +1,344 @@
+"""
+Compile specialized loaders and dumpers ahead of time, into a plain Python module.
+
+The generated module defines the same functions the specializers generate at runtime,
+with the objects they refer to imported instead of bound, so that workers can import
+reviewed code instead of executing generated code, and skip the warmup.
+It exports the loaders and dumpers mappings, to pass as extra type handlers:
+
+    from tressed import Dumper, Loader
+    from pkg import compiled
+
+    loader = Loader(extra_type_handlers=compiled.loaders)
+    dumper = Dumper(extra_type_handlers=compiled.dumpers)
+
+Specializations inline the handlers and aliases of the loader and dumper they are
+compiled for, so pass the same alias function at runtime.
+
+Compile from the command line with python -m tressed compile, see tressed.__main__.
+"""
+
+import re
+import sys
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any, Final
+
+    from tressed.alias import AliasFn
+    from tressed.loader.specializers import Codegen
+    from tressed.type_form import TypeForm
+
+__all__ = ["compile_module", "resolve_reference"]
+
+
+def resolve_reference(reference: str) -> Any:
+    """
+    Import the object referenced as module:qualname, for example pkg.models:Order.
+    """
+    import importlib
+
+    module_name, sep, qualname = reference.partition(":")
+    if not sep or not module_name or not qualname:
+        raise ValueError(f"Expected a reference as module:qualname, got {reference!r}")
+
+    obj: Any = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+class _References:
+    """
+    Source expressions evaluating to the objects bound by specializations, with the
+    modules to import.
+    """
+
+    __slots__ = ("imports", "_fallbacks")
+
+    def __init__(self) -> None:
+        self.imports: set[str] = set()
+        # Expressions of objects which cannot be referenced by name, by id.
+        self._fallbacks: dict[int, tuple[Any, str]] = {}
+
+    def register(self, obj: Any, expr: str) -> None:
+        """
+        Register the expression of an object which cannot be referenced by name,
+        for example a default factory lambda.
+        """
+        self._fallbacks.setdefault(id(obj), (obj, expr))
+
+    def expr(self, obj: Any) -> str:
+        if obj is None or obj is ... or type(obj) in (bool, int, str, bytes):
+            return repr(obj)
+        if type(obj) is float:
+            if obj != obj or obj in (float("inf"), float("-inf")):
+                return f"float({repr(obj)!r})"
+            return repr(obj)
+        if obj is type(None):
+            return "type(None)"
+        if type(obj) is tuple:
+            items = ", ".join(map(self.expr, obj))
+            return f"({items}{',' if len(obj) == 1 else ''})"
+        if type(obj) is frozenset:
+            if not obj:
+                return "frozenset()"
+            return f"frozenset({{{', '.join(sorted(map(self.expr, obj)))}}})"
+
+        from enum import Enum
+        from types import UnionType
+        from typing import Union, get_args, get_origin
+
+        if isinstance(obj, Enum):
+            return f"{self.expr(type(obj))}.{obj.name}"
+
+        if (expr := self._qualified_expr(obj)) is not None:
+            return expr
+
+        if (origin := get_origin(obj)) is not None and (args := get_args(obj)):
+            if origin is Union or origin is UnionType:
+                # Both typing.Union and types.UnionType
+                self.imports.add("typing")
+                origin_expr = "typing.Union"
+            else:
+                # Generic aliases like list[int], including literals
+                origin_expr = self.expr(origin)
+            return f"{origin_expr}[{', '.join(map(self.expr, args))}]"
+
+        if (fallback := self._fallbacks.get(id(obj))) is not None:
+            return fallback[1]
+        raise ValueError(f"Cannot reference {obj!r} from a compiled module")
+
+    def _qualified_expr(self, obj: Any) -> str | None:
+        """
+        Expression of objects defined at the top level of a module, or nested in
+        classes, by qualified name.
+        """
+        module_name = getattr(obj, "__module__", None)
+        # Type aliases only have a name
+        qualname = getattr(obj, "__qualname__", None) or getattr(obj, "__name__", None)
+        if qualname is None and module_name == "typing":
+            # Special forms like Literal or Union
+            qualname = getattr(obj, "_name", None)
+        if type(module_name) is not str or type(qualname) is not str:
+            return None
+        if "<" in qualname or (module := sys.modules.get(module_name)) is None:
+            # Local objects or lambdas
+            return None
+
+        resolved: Any = module
+        for name in qualname.split("."):
+            resolved = getattr(resolved, name, None)
+        if resolved is not obj:
+            return None
+
+        if module_name == "builtins":
+            return qualname
+        self.imports.add(module_name)
+        return f"{module_name}.{qualname}"
+
+
+def _fn_name(type_form: TypeForm) -> str:
+    from tressed.type_form import type_form_repr
+
+    return re.sub(r"\W+", "_", type_form_repr(type_form)).strip("_")
+
+
+class _Stub:
+    """
+    Placeholder handler of a compiled type form, so that specializations of other type
+    forms bind it and call the compiled function directly, see _ModuleCompiler.add.
+
+    Never called, it is only named after the compiled function so that it is bound
+    under the same identifier by every specialization.
+    """
+
+    __slots__ = ("__name__",)
+
+    def __init__(self, fn_name: str) -> None:
+        self.__name__ = fn_name
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__name__!r})"
+
+
+class _ModuleCompiler:
+    __slots__ = ("references", "parts", "stub_idents", "loaders", "dumpers")
+
+    def __init__(self) -> None:
+        self.references: Final = _References()
+        self.parts: Final[list[str]] = []
+        # Identifiers of the compiled functions called by other compiled functions.
+        self.stub_idents: Final[dict[str, str]] = {}
+        self.loaders: Final[list[tuple[TypeForm, str]]] = []
+        self.dumpers: Final[list[tuple[TypeForm, str]]] = []
+
+    def add(
+        self,
+        codegen: Codegen,
+        fn_name: str,
+        args: str,
+        stubs: dict[int, str],
+    ) -> None:
+        """
+        Add the function generated by the codegen, created by a factory binding its
+        namespace, and named fn_name with the given arguments.
+        """
+        part = [f"def _make_{fn_name}():\n"]
+        for ident, obj in codegen.namespace.items():
+            if (stub_fn_name := stubs.get(id(obj))) is not None:
+                # Resolved globally once all the compiled functions are defined
+                if self.stub_idents.setdefault(ident, stub_fn_name) != stub_fn_name:
+                    raise ValueError(f"Conflicting identifiers {ident!r} in {fn_name}")
+                continue
+            part.append(f"    {ident} = {self.references.expr(obj)}\n")
+        part.append("\n")
+
+        # Rename the function and accept the arguments of the handler it stands for
+        _, body = codegen.code().split("\n", 1)
+        part.append(f"    def {fn_name}({args}):\n")
+        part.extend(f"    {line}\n" if line else "\n" for line in body.splitlines())
+        part.append(f"    return {fn_name}\n\n\n")
+        part.append(f"{fn_name} = _make_{fn_name}()\n")
+        self.parts.append("".join(part))
+
+    def source(self, command: str | None) -> str:
+        from tressed.loader.specializers import exec_globals
+
+        references = self.references
+        globals_ = [
+            f"{name} = {references.expr(obj)}\n" for name, obj in exec_globals().items()
+        ]
+        loaders = [
+            f"    {references.expr(type_form)}: {fn_name},\n"
+            for type_form, fn_name in self.loaders
+        ]
+        dumpers = [
+            f"    {references.expr(type_)}: {fn_name},\n"
+            for type_, fn_name in self.dumpers
+        ]
+
+        header = ['"""\n', "Loaders and dumpers compiled by tressed, do not edit.\n"]
+        if command is not None:
+            header.append(f"\nGenerated with: {command}\n")
+        header.append('"""\n\n')
+        imports = [f"import {module}\n" for module in sorted(references.imports)]
+
+        return "".join(
+            [
+                *header,
+                *imports,
+                "\n",
+                *globals_,
+                "\n",
+                '__all__ = ["loaders", "dumpers"]\n',
+                *(f"\n\n{part}" for part in self.parts),
+                "\n",
+                *(
+                    f"{ident} = {fn_name}\n"
+                    for ident, fn_name in sorted(self.stub_idents.items())
+                ),
+                "\nloaders = {\n",
+                *loaders,
+                "}\n",
+                "dumpers = {\n",
+                *dumpers,
+                "}\n",
+            ]
+        )
+
+
+def compile_module(
+    type_forms: Iterable[TypeForm],
+    *,
+    alias_fn: AliasFn | None = None,
+    command: str | None = None,
+) -> str:
+    """
+    Compile the source of a module with the specialized loaders of the given type forms,
+    and the specialized dumpers of the dataclasses among them.
+
+    Type forms must be importable, type aliases are compiled from their value, for
+    example to compile a loader for `type Orders = list[Order]`.
+    Raises ValueError if a type form cannot be specialized, or if an object its
+    specialization refers to cannot be imported.
+    """
+    from dataclasses import MISSING, fields
+    from typing import TypeAliasType
+
+    from tressed.dumper.dumper import Dumper
+    from tressed.dumper.specializers import specialize_dump_dataclass
+    from tressed.loader.loader import Loader
+    from tressed.loader.specializers import (
+        specialize_load_dataclass,
+        specialize_load_tree,
+    )
+    from tressed.predicates import is_dataclass_type
+
+    type_forms = list(dict.fromkeys(type_forms))
+    compiler = _ModuleCompiler()
+    references = compiler.references
+
+    fn_names: dict[TypeForm, str] = {}
+    for type_form in type_forms:
+        fn_name = base_name = _fn_name(type_form)
+        count = 0
+        while fn_name in fn_names.values():
+            fn_name = f"{base_name}_{count}"
+            count += 1
+        fn_names[type_form] = fn_name
+
+    # Nested dataclasses which are compiled too are loaded by their compiled function.
+    stubs: dict[TypeForm, Any] = {
+        type_form: _Stub(f"load_{fn_names[type_form]}")
+        for type_form in type_forms
+        if is_dataclass_type(type_form)
+    }
+    stub_names = {id(stub): stub.__name__ for stub in stubs.values()}
+    loader = Loader(alias_fn=alias_fn, extra_type_handlers=stubs)
+    dumper = Dumper(alias_fn=alias_fn)
+
+    for type_form in type_forms:
+        if is_dataclass_type(type_form):
+            # Defaults and default factories may not be importable, like lambdas
+            type_expr = references.expr(type_form)
+            for field in fields(type_form):  # type: ignore[arg-type]
+                field_expr = f"{type_expr}.__dataclass_fields__[{field.name!r}]"
+                if field.default is not MISSING:
+                    references.register(field.default, f"{field_expr}.default")
+                if field.default_factory is not MISSING:
+                    references.register(
+                        field.default_factory, f"{field_expr}.default_factory"
+                    )
+
+    for type_form in type_forms:
+        fn_name = fn_names[type_form]
+        value_type_form = type_form
+        if isinstance(type_form, TypeAliasType):
+            value_type_form = type_form.evaluate_value()
+
+        if is_dataclass_type(value_type_form):
+            codegen = specialize_load_dataclass(value_type_form, loader)
+        else:
+            codegen = specialize_load_tree(value_type_form, loader)
+        if codegen is None:
+            raise ValueError(f"Cannot compile a loader for {type_form!r}")
+        compiler.add(
+            codegen,
+            f"load_{fn_name}",
+            "value, type_form, type_path, loader",
+            stub_names,
+        )
+        compiler.loaders.append((type_form, f"load_{fn_name}"))
+
+        if is_dataclass_type(type_form):
+            compiler.add(
+                specialize_dump_dataclass(type_form, dumper),  # type: ignore[arg-type]
+                f"dump_{fn_name}",
+                "value, type_path, dumper",
+                stub_names,
+            )
+            compiler.dumpers.append((type_form, f"dump_{fn_name}"))
+
+    return compiler.source(command)
@@ -1,6 +1,6 @@
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterable, Sequence
     from typing import Any, Final, Literal
 
     from tressed.type_form import TypeForm
@@ -15,16 +15,71 @@ if TYPE_CHECKING:
     __all__ += ["MatchFn", "MatchStrategy"]
 
 
+class _FieldMatch:
+    """
+    Match mappings whose value at the given key is one of the values of the Literal
+    annotation of the field of the same name.
+
+    The key is the field name, loaders match the alias of the field instead, see
+    Discriminator.match_field.
+    """
+
+    __slots__ = ("name", "_tags")
+
+    def __init__(self, name: str) -> None:
+        from tressed.cache import TypeFormCache
+
+        self.name: Final = name
+        # Values of the Literal annotation of the field by type form, empty if the field
+        # is missing or not annotated as a Literal.
+        self._tags: Final[TypeFormCache[tuple[Any, ...]]] = TypeFormCache()
+
+    def tags(self, type_form: TypeForm) -> tuple[Any, ...]:
+        if (tags := self._tags.get(type_form)) is None:
+            from typing import get_type_hints
+
+            from tressed.type_info import get_type_info
+
+            tags = ()
+            if (field_type := get_type_hints(type_form).get(self.name)) is not None:
+                type_info = get_type_info(field_type)
+                if type_info.kind == "literal":
+                    tags = type_info.args
+            self._tags.add(type_form, tags)
+        return tags
+
+    def matches(self, value: Any, type_form: TypeForm, key: str) -> bool:
+        if type(value) is not dict or key not in value:
+            return False
+        return value[key] in self.tags(type_form)
+
+    def __call__(self, value: Any, type_form: TypeForm) -> bool:
+        return self.matches(value, type_form, self.name)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and self.name == other.name
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.name))
+
+
 class Discriminator:
-    __slots__ = ("match_fn", "strategy", "match")
+    __slots__ = ("match_fn", "strategy", "field", "match")
 
     def __init__(
         self,
         match_fn: MatchFn,
         strategy: MatchStrategy = "first-match",
+        *,
+        # Name of the field tagging the arms, see by_field.
+        field: str | None = None,
     ) -> None:
         self.match_fn: Final = match_fn
         self.strategy: Final = strategy
+        self.field: Final = field
         match strategy:
             case "first-match":
                 self.match = self.first_match
@@ -33,6 +88,44 @@ class Discriminator:
             case _:
                 assert False, f"Invalid match strategy {strategy}"
 
+    @classmethod
+    def by_field(
+        cls, name: str, strategy: MatchStrategy = "first-match"
+    ) -> Discriminator:
+        """
+        Discriminate the arms of the union by the value of their field of the given
+        name, annotated as a Literal in each arm, for example `kind: Literal["circle"]`.
+
+        Loaders look up the arm by tag in a table built once per union, using the alias
+        of the field, instead of matching every arm. If no table can be built, for
+        example if the alias depends on the type path, they match every arm using the
+        alias of the field in that arm, see match_field.
+        """
+        return cls(_FieldMatch(name), strategy, field=name)
+
+    def match_field(
+        self, value: Any, arms: Iterable[tuple[TypeForm, str]]
+    ) -> TypeForm | None:
+        """
+        Match the value against the arms of a discriminator by field, given with the
+        alias of the field in each arm, following the match strategy.
+        """
+        field_match = self.match_fn
+        assert isinstance(field_match, _FieldMatch), "not a discriminator by field"
+        matches = (
+            type_form
+            for type_form, alias in arms
+            if field_match.matches(value, type_form, alias)
+        )
+        if self.strategy == "first-match":
+            return next(matches, None)
+        match tuple(matches):
+            case [type_form]:
+                return type_form
+            case _:
+                # No or ambiguous match
+                return None
+
     def best_match(self, value: Any, *type_forms: TypeForm) -> TypeForm | None:
         best_matches: Sequence[TypeForm] = ()
         best_score = 0
@@ -65,7 +158,12 @@ class Discriminator:
         return f"{self.__class__.__name__}({self.match_fn=!r})"
 
     def __eq__(self, other: Any) -> bool:
-        return type(self) is type(other) and self.match == other.match_fn
+        return (
+            type(self) is type(other)
+            and self.match_fn == other.match_fn
+            and self.strategy == other.strategy
+            and self.field == other.field
+        )
 
     def __hash__(self) -> int:
         return id(type(self)) + hash(self.match_fn) + hash(self.strategy)
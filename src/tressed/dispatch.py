@@ -0,0 +1,118 @@
+"""
+Type mapper dispatch index.
+
+Instead of evaluating every type predicate in order for every new type form, the
+candidate type mappers are narrowed down using dispatch keys computed from the type
+form, see get_dispatch_keys:
+
+- The type of the type form, for example its metaclass for classes.
+- The `type` builtin if the type form is a class.
+- The origin of a generic type form and the type of that origin.
+- `typing.Annotated` for annotated type forms.
+
+Type predicates declare the dispatch keys they can match using
+tressed.predicates.dispatch_on. Predicates without dispatch keys are candidates for all
+type forms. The candidates are computed once per distinct dispatch keys, preserving the
+priority order of the type mappers, and at most max_size distinct dispatch keys are
+kept, the oldest are evicted first.
+"""
+
+import sys
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import Final
+
+    from tressed.predicates import TypePredicate
+    from tressed.type_form import TypeForm
+
+__all__ = [
+    "DispatchIndex",
+    "get_dispatch_keys",
+]
+
+
+def get_dispatch_keys(type_form: TypeForm) -> tuple[object, ...]:
+    if hasattr(type_form, "__metadata__"):
+        # Annotated type forms proxy their origin, do not dispatch on it.
+        return (type(type_form), sys.modules["typing"].Annotated)
+
+    if isinstance(type_form, type):
+        return (type(type_form), type)
+
+    if (origin := getattr(type_form, "__origin__", None)) is not None:
+        if isinstance(origin, type):
+            return (type(type_form), origin)
+        return (type(type_form), origin, type(origin))
+
+    return (type(type_form),)
+
+
+def _resolve_dispatch_key(dispatch_key: object) -> object | None:
+    if type(dispatch_key) is not str:
+        return dispatch_key
+
+    module_name, _, name = dispatch_key.rpartition(".")
+    if module := sys.modules.get(module_name):
+        return getattr(module, name, None)
+    return None
+
+
+class DispatchIndex[H]:
+    __slots__ = ("type_mappers", "max_size", "_candidates")
+
+    def __init__(
+        self, type_mappers: Mapping[TypePredicate, H], max_size: int | None = 4096
+    ) -> None:
+        self.type_mappers: Final = type_mappers
+        self.max_size: Final = max_size
+        self._candidates: dict[
+            tuple[object, ...], tuple[tuple[TypePredicate, H], ...]
+        ] = {}
+
+    def candidates(
+        self, dispatch_keys: tuple[object, ...]
+    ) -> tuple[tuple[TypePredicate, H], ...]:
+        """
+        Type mappers whose predicate may match a type form with the given dispatch keys.
+        """
+        if (candidates := self._candidates.get(dispatch_keys)) is None:
+            selected = []
+            for type_predicate, handler in self.type_mappers.items():
+                if (
+                    predicate_keys := getattr(type_predicate, "dispatch_keys", None)
+                ) is not None:
+                    # Resolving names now is fine, any object part of the dispatch keys
+                    # of a type form comes from an already imported module.
+                    resolved_keys = tuple(map(_resolve_dispatch_key, predicate_keys))
+                    if not any(
+                        dispatch_key is resolved_key
+                        for dispatch_key in dispatch_keys
+                        for resolved_key in resolved_keys
+                    ):
+                        continue
+                selected.append((type_predicate, handler))
+            candidates = tuple(selected)
+
+            cache = self._candidates
+            if (max_size := self.max_size) is not None:
+                if max_size <= 0:
+                    return candidates
+                while len(cache) >= max_size:
+                    # Evict the oldest entry
+                    del cache[next(iter(cache))]
+            cache[dispatch_keys] = candidates
+        return candidates
+
+    def lookup(self, type_form: TypeForm) -> H | None:
+        from tressed.type_info import get_type_info
+
+        dispatch_keys = get_type_info(type_form).dispatch_keys
+        for type_predicate, handler in self.candidates(dispatch_keys):
+            if type_predicate(type_form):
+                return handler
+        return None
+
+    def clear(self) -> None:
+        self._candidates.clear()
@@ -0,0 +1,52 @@
+"""
+Specializations composed from closures instead of generated source, for environments
+where exec is not allowed, see tressed.dumper.specializers.
+"""
+
+from tressed.type_path import TypePathNode
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from tressed.dumper.types import Dumped, DumperFn, DumperProtocol
+    from tressed.type_path import TypePath
+
+__all__ = ["compose_dump_dataclass"]
+
+
+def compose_dump_dataclass(type_: type, dumper: DumperProtocol) -> DumperFn:
+    """
+    Compose a specialized function dumping dataclasses of the given type, like
+    tressed.dumper.specializers.specialize_dump_dataclass but from a closure.
+    """
+    from tressed.dumper.plans import make_dataclass_dump_plan
+    from tressed.dumper.specializers import identity_types
+
+    identity_types_ = identity_types(dumper)
+    fields = tuple(
+        (field.name, field.alias, field)
+        for field in dumper._plan(type_, make_dataclass_dump_plan)
+    )
+
+    def specialized_fn(
+        value: Any, type_path: TypePath, dumper: DumperProtocol
+    ) -> Dumped:
+        dump = dumper._dump
+        hide_defaults = dumper.hide_defaults
+        dumped = {}
+        for name, alias, field in fields:
+            field_value = getattr(value, name)
+            if hide_defaults and field.is_default(field_value):
+                continue
+
+            if alias is None:
+                alias = dumper._resolve_alias(type(value), type_path, name)
+            dumped[alias] = (
+                field_value
+                if type(field_value) in identity_types_
+                else dump(field_value, TypePathNode((type_path, alias)))
+            )
+        return dumped
+
+    return specialized_fn
@@ -5,7 +5,9 @@ Note that contrarily from Loader, the Dumper operates on concrete values and typ
 Supports aliases.
 """
 
-from tressed.exceptions import TressedTypeError, TressedValueError
+import itertools
+
+from tressed.exceptions import TressedError, TressedTypeError, TressedValueError
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
@@ -13,12 +15,27 @@ if TYPE_CHECKING:
     from typing import Any
 
     from tressed.alias import Alias, AliasFn, AliasResolver
-    from tressed.dumper.types import Dumped, DumperFn
+    from tressed.dumper.types import (
+        Dumped,
+        DumperFn,
+        DumperProtocol,
+        TypeDumperSpecializer,
+    )
+    from tressed.loader.specializer import (
+        SpecializationBackend,
+        SpecializationPolicy,
+        SpecializationReport,
+    )
     from tressed.predicates import TypePredicate
     from tressed.type_path import TypePath
 
 __all__ = ["Dumper"]
 
+# Dumper versions are unique across dumpers, see Dumper._version.
+_versions = itertools.count()
+# Cached in place of plans which are None, so these are not made again.
+_NO_PLAN: Any = object()
+
 
 def _default_type_handlers() -> dict[type, DumperFn]:
     from tressed.dumper.dumpers import (
@@ -43,7 +60,11 @@ def _default_type_handlers() -> dict[type, DumperFn]:
     }
 
 
-def _default_type_mappers(specialize: bool) -> dict[TypePredicate, DumperFn]:
+def _default_type_mappers(
+    specialization_policy: SpecializationPolicy | None,
+    specialization_backend: SpecializationBackend,
+    max_cache_size: int | None,
+) -> dict[TypePredicate, DumperFn]:
     from tressed.dumper.dumpers import (
         dump_dataclass,
         dump_datetime,
@@ -64,12 +85,30 @@ def _default_type_mappers(specialize: bool) -> dict[TypePredicate, DumperFn]:
         is_uuid_type,
     )
 
+    dump_dataclass_: DumperFn = dump_dataclass
+    if (policy := specialization_policy) is not None:
+        from tressed.dumper.specializer import SpecializingDumper
+
+        dataclass_specializer: TypeDumperSpecializer
+        if specialization_backend == "closure":
+            from tressed.dumper.composers import (
+                compose_dump_dataclass as dataclass_specializer,
+            )
+        else:
+            from tressed.dumper.specializers import (
+                specialize_dump_dataclass as dataclass_specializer,
+            )
+
+        dump_dataclass_ = SpecializingDumper(
+            dump_dataclass, dataclass_specializer, policy, max_cache_size
+        )
+
     return {
         is_ipaddress_type: dump_simple_scalar,
         is_uuid_type: dump_simple_scalar,
         is_enum_type: dump_enum,
         is_datetime_type: dump_datetime,
-        is_dataclass_type: dump_dataclass,
+        is_dataclass_type: dump_dataclass_,
         is_namedtuple_type: dump_namedtuple,
         is_fspath_type: dump_fspath,
         is_re_pattern_type: dump_re_pattern,
@@ -86,6 +125,11 @@ class Dumper:
         extra_type_handlers: Mapping[type, DumperFn] | None = None,
         extra_type_mappers: Mapping[TypePredicate, DumperFn] | None = None,
         enable_specialization: bool = False,
+        # When to specialize types, implies enable_specialization.
+        specialization_policy: SpecializationPolicy | None = None,
+        # Generate the source of specializations and exec it, or compose them from
+        # closures where exec is not allowed.
+        specialization_backend: SpecializationBackend = "exec",
         # If set enables alias lookup on fields, for example for dataclasses.
         alias_field: str | None = "alias",
         # Pass custom alias function, for example mapping field names to camelCase using to_camel.
@@ -93,6 +137,13 @@ class Dumper:
         # Overriding the resolver factory allows for more advanced behavior like disablign caching,
         # or changing the alias resolution behavior entirely.
         alias_resolver_factory: Callable[[AliasFn | None], AliasResolver] | None = None,
+        # Wrap foreign exceptions once in dump instead of around every dumped value,
+        # the failing value and type path are then recovered from the traceback.
+        top_level_error_wrapping: bool = False,
+        # Maximum number of entries of each memoization cache, for example type handlers
+        # memoized from type mappers or resolved aliases, None for unbounded.
+        # Normalized type forms are cached globally, see set_type_info_cache_size.
+        max_cache_size: int | None = 4096,
     ) -> None:
         # Map a type to its dumper
         if default_type_handlers is None:
@@ -105,13 +156,33 @@ class Dumper:
 
         # Mapping of type predicate to a dumper
         if default_type_mappers is None:
-            type_mappers = _default_type_mappers(enable_specialization)
+            if specialization_policy is None and enable_specialization:
+                from tressed.loader.specializer import SpecializationPolicy
+
+                specialization_policy = SpecializationPolicy()
+            type_mappers = _default_type_mappers(
+                specialization_policy, specialization_backend, max_cache_size
+            )
         else:
             type_mappers = dict(default_type_mappers)
         if extra_type_mappers:
             type_mappers |= extra_type_mappers
         self._type_mappers: Mapping[TypePredicate, DumperFn] = type_mappers
 
+        from tressed.cache import TypeFormCache
+
+        # Type handlers memoized from type mappers, kept apart from the registered type
+        # handlers to be bounded and weakly reference classes.
+        self._handler_cache: TypeFormCache[DumperFn] = TypeFormCache(max_cache_size)
+        # Plans by plan factory and type, see _plan.
+        self._plans: dict[Callable[..., Any], TypeFormCache[Any]] = {}
+        self._max_cache_size = max_cache_size
+
+        from tressed.dispatch import DispatchIndex
+
+        # Narrow down the type mappers to try on a type handler cache miss
+        self._type_mapper_index = DispatchIndex(type_mappers, max_cache_size)
+
         from tressed.alias import (
             AliasResolver,
             compose_alias_fn,
@@ -126,37 +197,122 @@ class Dumper:
             )
 
         if alias_resolver_factory is None:
-            self._alias_resolver = AliasResolver(alias_fn)
+            self._alias_resolver = AliasResolver(
+                alias_fn, max_cache_size=max_cache_size
+            )
         else:
             self._alias_resolver = alias_resolver_factory(alias_fn)
         self.hide_defaults = hide_defaults
 
+        self.top_level_error_wrapping = top_level_error_wrapping
+        if top_level_error_wrapping:
+            self._dump = self._dump_unwrapped  # type: ignore[method-assign]
+
+        # Changed whenever handlers or aliases may have changed, specializations generated
+        # for another version are dropped.
+        self._version = next(_versions)
+
     def _resolve_alias(self, type_: type, type_path: TypePath, name: str) -> Alias:
         return self._alias_resolver.resolve(name, type_, type_path)
 
+    def _resolve_static_alias(self, type_: type, name: str) -> Alias | None:
+        return self._alias_resolver.resolve_static(name, type_)
+
+    def _plan[P](
+        self, type_: type, make_plan: Callable[[type, DumperProtocol], P]
+    ) -> P:
+        if (plans := self._plans.get(make_plan)) is None:
+            from tressed.cache import TypeFormCache
+
+            plans = self._plans[make_plan] = TypeFormCache(self._max_cache_size)
+        if (plan := plans.get(type_)) is None:
+            plan = make_plan(type_, self)
+            plans.add(type_, _NO_PLAN if plan is None else plan)
+        elif plan is _NO_PLAN:
+            return None  # type: ignore[return-value]
+        return plan
+
+    def _lookup_handler(self, type_: type) -> DumperFn | None:
+        if (type_dumper := self._type_handlers.get(type_)) is None:
+            return self._lookup_mapped_handler(type_)
+        return type_dumper
+
+    def _lookup_mapped_handler(self, type_: type) -> DumperFn | None:
+        if (type_dumper := self._handler_cache.get(type_)) is None:
+            if (type_dumper := self._type_mapper_index.lookup(type_)) is None:
+                return None
+
+            # Cache lookup for next time
+            self._handler_cache.add(type_, type_dumper)
+        return type_dumper
+
     def _dump(self, value: Any, type_path: TypePath) -> Dumped:
         type_: type = type(value)
         if (type_dumper := self._type_handlers.get(type_)) is None:
-            for type_predicate, type_dumper in self._type_mappers.items():
-                if type_predicate(type_):
-                    break
-            else:
-                type_dumper = None
-            if type_dumper is None:
+            if (type_dumper := self._lookup_mapped_handler(type_)) is None:
                 raise TressedTypeError(value, type_path)
 
-            # Cache lookup for next time
-            self._type_handlers[type_] = type_dumper
-
         try:
             return type_dumper(value, type_path, self)
         except TressedValueError:
             raise
         except Exception as e:
             # TODO: Different error for load and dump
-            error = TressedValueError(value, type_, type_path)
-            error.add_note(f"{type(e)}: {e}")
-            raise error from e
+            raise TressedValueError.from_exception(e, value, type_, type_path) from e
+
+    def _dump_unwrapped(self, value: Any, type_path: TypePath) -> Dumped:
+        type_: type = type(value)
+        if (type_dumper := self._type_handlers.get(type_)) is None:
+            if (type_dumper := self._lookup_mapped_handler(type_)) is None:
+                raise TressedTypeError(value, type_path)
+
+        return type_dumper(value, type_path, self)
+
+    def specialization_report(self) -> list[SpecializationReport]:
+        """
+        Report the specialization state of the types dumped through specialized
+        handlers so far, for example to check that hot types run specialized code.
+        """
+        reports = []
+        for type_dumper in {
+            id(type_dumper): type_dumper
+            for type_dumper in (
+                *self._type_handlers.values(),
+                *self._type_mappers.values(),
+            )
+        }.values():
+            if (report := getattr(type_dumper, "report", None)) is not None:
+                reports.extend(report())
+        return reports
+
+    def clear_caches(self) -> None:
+        """
+        Clear the memoized type handlers, plans, dispatch candidates, resolved aliases
+        and specializations, for example after unloading dynamically created types.
+
+        Registered type handlers are kept.
+        """
+        self._version = next(_versions)
+        self._handler_cache.clear()
+        self._plans.clear()
+        self._type_mapper_index.clear()
+        self._alias_resolver.clear_cache()
+        for type_dumper in (
+            *self._type_handlers.values(),
+            *self._type_mappers.values(),
+        ):
+            if (clear_cache := getattr(type_dumper, "clear_cache", None)) is not None:
+                clear_cache()
 
     def dump(self, value: Any) -> Dumped:
-        return self._dump(value, ())
+        if not self.top_level_error_wrapping:
+            return self._dump(value, ())
+
+        try:
+            return self._dump(value, ())
+        except TressedError:
+            raise
+        except Exception as e:
+            raise TressedValueError.from_traceback(
+                e, value, type(value), (), infer_type_form=True
+            ) from e
@@ -1,5 +1,6 @@
 import os
-import sys
+
+from tressed.type_path import TypePathNode
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
@@ -48,7 +49,9 @@ def dump_simple_scalar(
 def dump_simple_sequence(
     value: Any, type_path: TypePath, dumper: DumperProtocol
 ) -> Dumped:
-    return [dumper._dump(item, (*type_path, i)) for i, item in enumerate(value)]
+    return [
+        dumper._dump(item, TypePathNode((type_path, i))) for i, item in enumerate(value)
+    ]
 
 
 def dump_complex(value: Any, type_path: TypePath, dumper: DumperProtocol) -> Dumped:
@@ -56,7 +59,7 @@ def dump_complex(value: Any, type_path: TypePath, dumper: DumperProtocol) -> Dum
 
 
 def _dump_key(key: Any, type_path: TypePath, dumper: DumperProtocol) -> str:
-    key_path = (*type_path, key)
+    key_path = TypePathNode((type_path, key))
     dumped_key = dumper._dump(key, key_path)
     if type(dumped_key) is not str:
         raise TressedValueError(key, type(key), key_path, "dumped key must be a string")
@@ -68,7 +71,7 @@ def dump_simple_mapping(
 ) -> Dumped:
     return {
         _dump_key(item_key, type_path, dumper): dumper._dump(
-            item_value, (*type_path, item_key)
+            item_value, TypePathNode((type_path, item_key))
         )
         for item_key, item_value in value.items()
     }
@@ -90,42 +93,19 @@ def dump_datetime(value: Any, type_path: TypePath, dumper: DumperProtocol) -> Du
 
 
 def dump_dataclass(value: Any, type_path: TypePath, dumper: DumperProtocol) -> Dumped:
-    from dataclasses import MISSING, fields
+    from tressed.dumper.plans import make_dataclass_dump_plan
 
+    value_type = type(value)
+    hide_defaults = dumper.hide_defaults
     dumped = {}
-    for field in fields(value):
-        if not field.repr or not field.init:
+    for field in dumper._plan(value_type, make_dataclass_dump_plan):
+        field_value = getattr(value, field.name)
+        if hide_defaults and field.is_default(field_value):
             continue
 
-        field_name = field.name
-        field_value = getattr(value, field_name)
-
-        if dumper.hide_defaults:
-            if (default_value := field.default) is not MISSING:
-                if field_value == default_value:
-                    continue
-
-            elif (default_factory := field.default_factory) is not MISSING:
-                # Avoid calling the default factory function if its a known mutable type like list
-                if default_factory in frozenset({list, set, dict}) and len(value) == 0:
-                    continue
-
-                # Avoid calling default factory if we know the value can't match the default
-                cant_be_default = (
-                    uuid := sys.modules.get("uuid")
-                ) and default_factory in frozenset(
-                    {
-                        uuid.uuid1,
-                        uuid.uuid4,
-                        uuid.uuid6,
-                        uuid.uuid7,
-                    }
-                )
-                if not cant_be_default and field_value == default_factory():
-                    continue
-
-        alias = dumper._resolve_alias(type(value), type_path, field_name)
-        dumped[alias] = dumper._dump(field_value, (*type_path, alias))
+        if (alias := field.alias) is None:
+            alias = dumper._resolve_alias(value_type, type_path, field.name)
+        dumped[alias] = dumper._dump(field_value, TypePathNode((type_path, alias)))
 
     return dumped
 
@@ -143,7 +123,7 @@ def dump_namedtuple(value: Any, type_path: TypePath, dumper: DumperProtocol) ->
                     continue
 
         alias = dumper._resolve_alias(type(value), type_path, field_name)
-        dumped[alias] = dumper._dump(field_value, (*type_path, alias))
+        dumped[alias] = dumper._dump(field_value, TypePathNode((type_path, alias)))
     return dumped
 
 
@@ -0,0 +1,102 @@
+"""
+Dump plans.
+
+A dump plan holds everything that can be computed once per type, for example the fields
+of a dataclass with their aliases and how to tell their default values apart.
+Plans are cached per dumper, see Dumper._plan.
+"""
+
+import sys
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Final, Literal
+
+    from tressed.alias import Alias
+    from tressed.dumper.types import DumperProtocol
+
+    # How to tell a field value is the default, to hide it:
+    # - value: it equals the default value
+    # - empty: it is empty, for builtin container default factories
+    # - factory: it equals the value of the default factory
+    # - None: never, for fields without default or with factories of unique values
+    type DefaultKind = Literal["value", "empty", "factory"] | None
+
+__all__ = [
+    "DumpFieldPlan",
+    "make_dataclass_dump_plan",
+]
+
+
+class DumpFieldPlan:
+    __slots__ = ("name", "alias", "default_kind", "default")
+
+    def __init__(
+        self, name: str, alias: Alias | None, default_kind: DefaultKind, default: Any
+    ) -> None:
+        self.name: Final = name
+        # None if the alias depends on the type path and has to be resolved on dump.
+        self.alias: Final = alias
+        self.default_kind: Final = default_kind
+        # The default value, or default factory.
+        self.default: Final = default
+
+    def is_default(self, field_value: Any) -> bool:
+        match self.default_kind:
+            case "value":
+                return field_value == self.default
+            case "empty":
+                if type(field_value) is self.default:
+                    return not field_value
+                return field_value == self.default()
+            case "factory":
+                return field_value == self.default()
+            case _:
+                return False
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"name={self.name!r}, alias={self.alias!r}, "
+            f"default_kind={self.default_kind!r})"
+        )
+
+
+def _default_kind(field: Any) -> tuple[DefaultKind, Any]:
+    from dataclasses import MISSING
+
+    if (default_value := field.default) is not MISSING:
+        return "value", default_value
+
+    if (default_factory := field.default_factory) is not MISSING:
+        # Avoid calling the default factory function if its a known mutable type like list
+        if default_factory in frozenset({list, set, dict}):
+            return "empty", default_factory
+
+        # Avoid calling default factory if we know the value can't match the default
+        cant_be_default = (uuid := sys.modules.get("uuid")) and default_factory in (
+            frozenset({uuid.uuid1, uuid.uuid4, uuid.uuid6, uuid.uuid7})
+        )
+        if not cant_be_default:
+            return "factory", default_factory
+
+    return None, None
+
+
+def make_dataclass_dump_plan(
+    type_: type, dumper: DumperProtocol
+) -> tuple[DumpFieldPlan, ...]:
+    """
+    Plan the fields to dump for the given dataclass, skipping non-repr and non-init fields.
+    """
+    from dataclasses import fields
+
+    return tuple(
+        DumpFieldPlan(
+            field.name,
+            dumper._resolve_static_alias(type_, field.name),
+            *_default_kind(field),
+        )
+        for field in fields(type_)
+        if field.repr and field.init
+    )
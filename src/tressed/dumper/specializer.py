@@ -0,0 +1,64 @@
+from tressed.exceptions import TressedError
+from tressed.loader.specializer import _Specializations
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from tressed.dumper.types import (
+        Dumped,
+        DumperFn,
+        DumperProtocol,
+        TypeDumperSpecializer,
+    )
+    from tressed.loader.specializer import SpecializationPolicy, SpecializationReport
+    from tressed.type_path import TypePath
+
+__all__ = ["SpecializingDumper"]
+
+
+class SpecializingDumper:
+    """
+    Dump values through specializations of the generic dumper for their type, following
+    the specialization policy, like tressed.loader.specializer.SpecializingLoader.
+    """
+
+    def __init__(
+        self,
+        dumper: DumperFn,
+        specializer: TypeDumperSpecializer,
+        policy: SpecializationPolicy | None = None,
+        max_cache_size: int | None = 4096,
+    ) -> None:
+        self._dumper = dumper
+        # Specializations are keyed by the type of the dumped value.
+        self._specializations = _Specializations(
+            dumper, specializer, policy, max_cache_size
+        )
+
+    def clear_cache(self) -> None:
+        self._specializations.clear()
+
+    def report(self) -> list[SpecializationReport]:
+        """
+        Report the specialization state of each type dumped so far.
+        """
+        return self._specializations.report()
+
+    def __call__(
+        self, value: Any, type_path: TypePath, dumper: DumperProtocol
+    ) -> Dumped:
+        type_ = type(value)
+        if (specialized_dumper := self._specializations.get(type_, dumper)) is None:
+            return self._dumper(value, type_path, dumper)
+
+        try:
+            return specialized_dumper(value, type_path, dumper)
+        except TressedError:
+            raise
+        except Exception:
+            # Raises the error of the generic dumper if the value is invalid
+            dumped = self._dumper(value, type_path, dumper)
+            # Otherwise the specialization is at fault, deoptimize
+            self._specializations.deoptimize(type_)
+            return dumped
@@ -0,0 +1,88 @@
+from tressed.loader.specializers import Codegen
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from tressed.dumper.plans import DumpFieldPlan
+    from tressed.dumper.types import DumperProtocol
+
+__all__ = ["specialize_dump_dataclass", "identity_types"]
+
+
+def identity_types(dumper: DumperProtocol) -> frozenset[type]:
+    """
+    Types of the values dumped as is by the dumper, which specialized dumpers do not
+    dispatch.
+    """
+    from tressed.dumper.dumpers import dump_identity
+
+    return frozenset(
+        type_
+        for type_ in (str, int, float, bool, type(None))
+        if dumper._lookup_handler(type_) is dump_identity
+    )
+
+
+def _is_default(codegen: Codegen, field: DumpFieldPlan, ident: str) -> str | None:
+    """
+    Expression telling whether the field value is the default, None if it never is,
+    see DumpFieldPlan.is_default.
+    """
+    match field.default_kind:
+        case "value":
+            return f"{ident} == {codegen.bind(field.default, f'{field.name}_default')}"
+        case "empty":
+            factory = codegen.bind(field.default)
+            return (
+                f"(not {ident} if type({ident}) is {factory}"
+                f" else {ident} == {factory}())"
+            )
+        case "factory":
+            factory = codegen.bind(field.default, f"{field.name}_factory")
+            return f"{ident} == {factory}()"
+        case _:
+            return None
+
+
+def specialize_dump_dataclass(type_: type, dumper: DumperProtocol) -> Codegen:
+    """
+    Generate a specialized function dumping dataclasses of the given type, reading the
+    fields directly and writing their aliased keys, only dispatching field values which
+    are not dumped as is.
+
+    The type path is passed at call time.
+    """
+    from tressed.dumper.plans import make_dataclass_dump_plan
+
+    codegen = Codegen(args=("value", "type_path", "dumper"))
+    identity_types_ = codegen.bind(identity_types(dumper), "identity_types")
+    dump = codegen.allocate("dump")
+    codegen._emit_line(f"{dump} = dumper._dump")
+    hide_defaults = codegen.allocate("hide_defaults")
+    codegen._emit_line(f"{hide_defaults} = dumper.hide_defaults")
+    dumped = codegen.allocate("dumped")
+    codegen._emit_line(f"{dumped} = {{}}")
+
+    for field in dumper._plan(type_, make_dataclass_dump_plan):
+        ident = codegen.allocate(field.name)
+        codegen._emit_line(f"{ident} = value.{field.name}")
+        indent = 0
+        if (is_default := _is_default(codegen, field, ident)) is not None:
+            codegen._emit_line(f"if not ({hide_defaults} and {is_default}):")
+            indent = 1
+
+        if field.alias is None:
+            key = codegen.allocate(f"{field.name}_alias")
+            codegen._emit_line(
+                f"{key} = dumper._resolve_alias(type(value), type_path, {field.name!r})",
+                indent,
+            )
+        else:
+            key = repr(field.alias)
+        codegen._emit_line(
+            f"{dumped}[{key}] = {ident} if type({ident}) in {identity_types_}"
+            f" else {dump}({ident}, TypePathNode((type_path, {key})))",
+            indent,
+        )
+
+    codegen._emit_line(f"return {dumped}")
+    return codegen
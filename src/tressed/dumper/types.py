@@ -3,9 +3,11 @@ if TYPE_CHECKING:
     from collections.abc import Callable
     from typing import Any, Protocol
 
+    from tressed.alias import Alias
+    from tressed.loader.specializers import Codegen
     from tressed.type_path import TypePath
 
-__all__ = ["Dumped", "DumperProtocol", "DumperFn"]
+__all__ = ["Dumped", "DumperProtocol", "DumperFn", "TypeDumperSpecializer"]
 
 
 # Dumped type, representing types that can be serialized to json out of the box.
@@ -25,13 +27,29 @@ type DumperFn = Callable[[Any, TypePath, DumperProtocol], Dumped]
 if TYPE_CHECKING:
 
     class DumperProtocol(Protocol):
+        # Changed whenever handlers or aliases may have changed
+        _version: int
+
         def _dump(self, value: Any, type_path: TypePath) -> Dumped: ...
         def _resolve_alias(
             self, value_type: type, type_path: TypePath, name: str
         ) -> str: ...
+        def _resolve_static_alias(
+            self, value_type: type, name: str
+        ) -> Alias | None: ...
+        def _lookup_handler(self, type_: type) -> DumperFn | None: ...
+        def _plan[P](
+            self, type_: type, make_plan: Callable[[type, DumperProtocol], P]
+        ) -> P: ...
 
         @property
         def hide_defaults(self) -> bool: ...
+
+    # Specializers either generate the source of the specialized dumper, or return it.
+    type TypeDumperSpecializer = Callable[
+        [type, DumperProtocol], Codegen | DumperFn | None
+    ]
 else:
     # Placeholder type for runtime
     type DumperProtocol = type
+    type TypeDumperSpecializer = type
@@ -1,3 +1,5 @@
+from tressed.type_path import materialize_type_path
+
 TYPE_CHECKING = False
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -27,7 +29,7 @@ class TressedTypeError(TressedError, TypeError):
     ) -> None:
         self.value = value
         self.type = type(value)
-        self.type_path = type_path
+        self.type_path = materialize_type_path(type_path)
         self.message = message
         super(TypeError, self).__init__(self.type)
 
@@ -48,7 +50,7 @@ class TressedTypeFormError(TressedError, TypeError):
     ) -> None:
         self.value = value
         self.type_form = type_form
-        self.type_path = type_path
+        self.type_path = materialize_type_path(type_path)
         self.message = message
         super(TypeError, self).__init__(type_form)
 
@@ -74,11 +76,62 @@ class TressedValueError(TressedError, ValueError):
     ) -> None:
         self.value = value
         self.type_form = type_form
-        self.type_path = type_path
+        self.type_path = materialize_type_path(type_path)
         self.message = message
         self.exceptions = exceptions
         super(ValueError, self).__init__(value)
 
+    @classmethod
+    def from_exception(
+        cls,
+        exception: Exception,
+        value: Any,
+        type_form: TypeForm,
+        type_path: TypePath,
+    ) -> TressedValueError:
+        """
+        Wrap a foreign exception raised while loading the value at the given type path.
+        """
+        error = cls(value, type_form, type_path)
+        error.add_note(f"{type(exception)}: {exception}")
+        return error
+
+    @classmethod
+    def from_traceback(
+        cls,
+        exception: Exception,
+        value: Any,
+        type_form: TypeForm,
+        type_path: TypePath,
+        *,
+        infer_type_form: bool = False,
+    ) -> TressedValueError:
+        """
+        Wrap a foreign exception, recovering the value, type form and type path it was
+        raised at from the innermost handler frame of its traceback.
+
+        Handler frames are recognized by their value, type_form and type_path arguments.
+        If infer_type_form is set, type_form is not required and the type of the value is
+        used instead, like for dumpers.
+        Falls back to the given value, type form and type path if no frame matches.
+        """
+        traceback = exception.__traceback__
+        while traceback is not None:
+            frame_locals = traceback.tb_frame.f_locals
+            if (
+                "value" in frame_locals
+                and isinstance(frame_locals.get("type_path"), tuple)
+                and (infer_type_form or "type_form" in frame_locals)
+            ):
+                value = frame_locals["value"]
+                type_path = frame_locals["type_path"]
+                if infer_type_form:
+                    type_form = type(value)
+                else:
+                    type_form = frame_locals["type_form"]
+            traceback = traceback.tb_next
+        return cls.from_exception(exception, value, type_form, type_path)
+
     def __str__(self) -> str:
         from tressed.type_form import type_form_repr
         from tressed.type_path import type_path_repr
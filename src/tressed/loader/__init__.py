@@ -1,20 +1,34 @@
 TYPE_CHECKING = False
 if TYPE_CHECKING:
     from tressed.loader.loader import Loader
+    from tressed.loader.specializer import SpecializationPolicy, SpecializationReport
     from tressed.loader.types import LoaderFn, LoaderProtocol
 
-__all__ = ["Loader", "LoaderProtocol", "LoaderFn"]
+__all__ = [
+    "Loader",
+    "LoaderProtocol",
+    "LoaderFn",
+    "SpecializationPolicy",
+    "SpecializationReport",
+]
 
 
 if not TYPE_CHECKING:
 
-    def __getattr__(name: str) -> type[Loader]:
+    def __getattr__(
+        name: str,
+    ) -> type[Loader] | type[SpecializationPolicy] | type[SpecializationReport]:
         match name:
             case "Loader":
                 from tressed.loader.loader import Loader
 
                 return Loader
 
+            case "SpecializationPolicy" | "SpecializationReport":
+                from tressed.loader import specializer
+
+                return getattr(specializer, name)
+
             case "LoaderProtocol" | "LoaderFn":
                 from tressed.loader import types
 
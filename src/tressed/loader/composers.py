@@ -0,0 +1,297 @@
+"""
+Specializations composed from closures instead of generated source, for environments
+where exec is not allowed.
+
+Closures follow the same plans as the generated functions, see
+tressed.loader.specializers, with one closure call per inlined type form instead of
+a single expression.
+"""
+
+from tressed.exceptions import TressedError
+from tressed.type_path import TypePathNode
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    from tressed.loader.types import LoaderFn, LoaderProtocol, SpecializedLoaderFn
+    from tressed.type_form import TypeForm
+    from tressed.type_path import TypePath
+
+__all__ = [
+    "compose_load_tree",
+    "compose_load_dataclass",
+]
+
+
+# Key of closures called with the complete type path, see _Composed.
+_ROOT: Any = object()
+
+if TYPE_CHECKING:
+    # Composed closures get the type path of the parent and the key of the value,
+    # so that the type path of values on the fast path is never built.
+    type _Composed = Callable[[Any, TypePath, Any, LoaderProtocol], Any]
+
+
+def _path(type_path: TypePath, key: Any) -> TypePath:
+    return type_path if key is _ROOT else TypePathNode((type_path, key))
+
+
+def _compose(
+    type_form: TypeForm, loader: LoaderProtocol, fallback: LoaderFn | None = None
+) -> _Composed:
+    """
+    Compose the closure loading values into the type form, calling the fallback handler
+    if given instead of the loader on the slow path.
+    """
+    from tressed.loader.plans import make_inline_plan
+
+    if fallback is None:
+
+        def slow(
+            value: Any, type_path: TypePath, key: Any, loader: LoaderProtocol
+        ) -> Any:
+            return loader._load(value, type_form, _path(type_path, key))
+
+    else:
+        fallback_ = fallback
+
+        def slow(
+            value: Any, type_path: TypePath, key: Any, loader: LoaderProtocol
+        ) -> Any:
+            return fallback_(value, type_form, _path(type_path, key), loader)
+
+    plan = loader._plan(type_form, make_inline_plan)
+    match plan.kind:
+        case "identity":
+
+            def load_identity(
+                value: Any, type_path: TypePath, key: Any, loader: LoaderProtocol
+            ) -> Any:
+                if type(value) is type_form:
+                    return value
+                return slow(value, type_path, key, loader)
+
+            return load_identity
+
+        case "float":
+
+            def load_float(
+                value: Any, type_path: TypePath, key: Any, loader: LoaderProtocol
+            ) -> Any:
+                if type(value) is float:
+                    return value
+                if type(value) is int:
+                    return type_form(value)
+                return slow(value, type_path, key, loader)
+
+            return load_float
+
+        case "scalar":
+
+            def load_scalar(
+                value: Any, type_path: TypePath, key: Any, loader: LoaderProtocol
+            ) -> Any:
+                # Conversion errors are foreign exceptions, see compose_load_tree
+                return type_form(value)
+
+            return load_scalar
+
+        case "optional":
+            load_inner = _compose(plan.args[0], loader)
+
+            def load_optional(
+                value: Any, type_path: TypePath, key: Any, loader: LoaderProtocol
+            ) -> Any:
+                if value is None:
+                    return None
+                return load_inner(value, type_path, key, loader)
+
+            return load_optional
+
+        case "collection":
+            origin: Any = plan.origin
+            item_type = plan.args[0]
+            load_item = _compose(item_type, loader)
+            # Spare a closure call per item for the most common items
+            inline_item = loader._plan(item_type, make_inline_plan).kind == "identity"
+
+            def load_collection(
+                value: Any, type_path: TypePath, key: Any, loader: LoaderProtocol
+            ) -> Any:
+                if type(value) is not list and type(value) is not tuple:
+                    return slow(value, type_path, key, loader)
+                type_path = _path(type_path, key)
+                if inline_item:
+                    load = loader._load
+                    loaded = [
+                        item
+                        if type(item) is item_type
+                        else load(item, item_type, TypePathNode((type_path, pos)))
+                        for pos, item in enumerate(value)
+                    ]
+                else:
+                    loaded = [
+                        load_item(item, type_path, pos, loader)
+                        for pos, item in enumerate(value)
+                    ]
+                return loaded if origin is list else origin(loaded)
+
+            return load_collection
+
+        case "tuple":
+            load_items = tuple(_compose(arg, loader) for arg in plan.args)
+            size = len(load_items)
+            # Tuples of exact types are only checked, spare building their type path
+            item_types = plan.args
+            check_only = all(
+                loader._plan(arg, make_inline_plan).kind == "identity"
+                for arg in item_types
+            )
+
+            def load_tuple(
+                value: Any, type_path: TypePath, key: Any, loader: LoaderProtocol
+            ) -> Any:
+                if (type(value) is not list and type(value) is not tuple) or len(
+                    value
+                ) != size:
+                    return slow(value, type_path, key, loader)
+                if check_only:
+                    for item, item_type in zip(value, item_types):
+                        if type(item) is not item_type:
+                            break
+                    else:
+                        return tuple(value)
+                type_path = _path(type_path, key)
+                return tuple(
+                    [
+                        load_item(item, type_path, pos, loader)
+                        for pos, (load_item, item) in enumerate(zip(load_items, value))
+                    ]
+                )
+
+            return load_tuple
+
+        case "dict":
+            key_type, value_type = plan.args
+            load_key = _compose(key_type, loader)
+            load_value = _compose(value_type, loader)
+            # Spare a closure call per key for the most common keys
+            inline_key = loader._plan(key_type, make_inline_plan).kind == "identity"
+
+            def load_dict(
+                value: Any, type_path: TypePath, key: Any, loader: LoaderProtocol
+            ) -> Any:
+                if type(value) is not dict:
+                    return slow(value, type_path, key, loader)
+                type_path = _path(type_path, key)
+                if inline_key:
+                    return {
+                        item_key
+                        if type(item_key) is key_type
+                        else load_key(item_key, type_path, item_key, loader): (
+                            load_value(item, type_path, item_key, loader)
+                        )
+                        for item_key, item in value.items()
+                    }
+                return {
+                    load_key(item_key, type_path, item_key, loader): load_value(
+                        item, type_path, item_key, loader
+                    )
+                    for item_key, item in value.items()
+                }
+
+            return load_dict
+
+        case _:
+            return slow
+
+
+def compose_load_tree[T](
+    type_form: TypeForm[T], loader: LoaderProtocol
+) -> SpecializedLoaderFn[T] | None:
+    """
+    Compose a specialized function loading the whole type form, like
+    tressed.loader.specializers.specialize_load_tree but from closures.
+    """
+    from tressed.loader.plans import make_inline_plan
+
+    plan = loader._plan(type_form, make_inline_plan)
+    if plan.kind not in ("collection", "tuple", "dict") or plan.handler is None:
+        return None
+    from tressed.loader.specializers import load_generic
+
+    handler = plan.handler
+    load = _compose(type_form, loader, handler)
+
+    def specialized_fn(value: Any, type_path: TypePath, loader: LoaderProtocol) -> T:
+        try:
+            return load(value, type_path, _ROOT, loader)
+        except TressedError:
+            raise
+        except Exception:
+            # Report foreign exceptions at the type path of the failing value
+            return load_generic(handler, value, type_form, type_path, loader)
+
+    return specialized_fn
+
+
+def compose_load_dataclass[T](
+    type_form: TypeForm[T], loader: LoaderProtocol
+) -> SpecializedLoaderFn[T] | None:
+    """
+    Compose a specialized function loading the given dataclass, like
+    tressed.loader.specializers.specialize_load_dataclass but from closures.
+    """
+    from tressed.loader.loaders import load_dataclass
+    from tressed.loader.plans import make_dataclass_constructor_plan
+    from tressed.loader.specializers import load_generic
+
+    if (plan := loader._plan(type_form, make_dataclass_constructor_plan)) is None:
+        return None
+
+    fields = tuple(
+        (
+            arg.field.alias,
+            arg.field.name,
+            _compose(arg.field.type_form, loader, arg.field.handler),
+            arg,
+        )
+        for arg in plan
+    )
+
+    def specialized_fn(value: Any, type_path: TypePath, loader: LoaderProtocol) -> T:
+        if type(value) is not dict:
+            return load_generic(load_dataclass, value, type_form, type_path, loader)
+
+        try:
+            args = []
+            kwargs = {}
+            for key, name, load_field, arg in fields:
+                if key in value:
+                    loaded = load_field(value[key], type_path, key, loader)
+                elif arg.required:
+                    break
+                elif (default_factory := arg.default_factory) is not None:
+                    loaded = default_factory()
+                else:
+                    loaded = arg.default
+
+                if arg.keyword:
+                    kwargs[name] = loaded
+                else:
+                    args.append(loaded)
+            else:
+                return type_form(*args, **kwargs)
+        except TressedError:
+            raise
+        except Exception:
+            # Report foreign exceptions at the type path of the failing value
+            return load_generic(load_dataclass, value, type_form, type_path, loader)
+
+        # A required key is missing, reported by the generic handler outside of the try
+        # block so that it is called once.
+        return load_generic(load_dataclass, value, type_form, type_path, loader)
+
+    return specialized_fn
@@ -6,7 +6,10 @@ Supports aliases.
 
 from __future__ import annotations
 
-from tressed.exceptions import TressedTypeFormError, TressedValueError
+import itertools
+
+from tressed.exceptions import TressedError, TressedTypeFormError, TressedValueError
+from tressed.loader.trials import FAILED
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
@@ -14,7 +17,19 @@ if TYPE_CHECKING:
     from typing import Any
 
     from tressed.alias import Alias, AliasFn, AliasResolver
-    from tressed.loader.types import LoaderFn, TypePath
+    from tressed.loader.specializer import (
+        SpecializationBackend,
+        SpecializationPolicy,
+        SpecializationReport,
+    )
+    from tressed.loader.trials import Failed
+    from tressed.loader.types import (
+        LoaderFn,
+        LoaderProtocol,
+        TrialLoaderFn,
+        TypeLoaderSpecializer,
+        TypePath,
+    )
     from tressed.predicates import TypePredicate
     from tressed.type_form import TypeForm
 
@@ -23,6 +38,11 @@ __all__ = [
     "Loader",
 ]
 
+# Loader versions are unique across loaders, see Loader._version.
+_versions = itertools.count()
+# Cached in place of plans which are None, so these are not made again.
+_NO_PLAN: Any = object()
+
 
 def _default_type_handlers() -> dict[TypeForm, LoaderFn]:
     from tressed.loader.loaders import load_complex, load_float, load_identity
@@ -37,7 +57,47 @@ def _default_type_handlers() -> dict[TypeForm, LoaderFn]:
     }
 
 
-def _default_type_mappers(specialize: bool) -> dict[TypePredicate, LoaderFn]:
+def _default_trial_handlers() -> dict[LoaderFn, TrialLoaderFn]:
+    from tressed.loader.loaders import (
+        load_dataclass,
+        load_float,
+        load_identity,
+        load_literal,
+        load_optional,
+        load_tagged_union,
+        load_typeddict,
+        load_union,
+    )
+    from tressed.loader.trials import (
+        try_load_dataclass,
+        try_load_float,
+        try_load_identity,
+        try_load_literal,
+        try_load_optional,
+        try_load_tagged_union,
+        try_load_typeddict,
+        try_load_union,
+    )
+
+    return {
+        load_identity: try_load_identity,
+        load_float: try_load_float,
+        load_literal: try_load_literal,
+        load_optional: try_load_optional,
+        load_union: try_load_union,
+        load_tagged_union: try_load_tagged_union,
+        load_dataclass: try_load_dataclass,
+        load_typeddict: try_load_typeddict,
+    }
+
+
+def _default_type_mappers(
+    specialization_policy: SpecializationPolicy | None,
+    specialization_backend: SpecializationBackend,
+    namedtuple_from_array: bool,
+    infer_discriminators: bool,
+    max_cache_size: int | None,
+) -> dict[TypePredicate, LoaderFn]:
     from tressed.loader.loaders import (
         load_dataclass,
         load_datetime,
@@ -45,11 +105,13 @@ def _default_type_mappers(specialize: bool) -> dict[TypePredicate, LoaderFn]:
         load_discriminated_union,
         load_literal,
         load_namedtuple,
+        load_namedtuple_or_array,
         load_newtype,
         load_optional,
         load_re_pattern,
         load_simple_collection,
         load_simple_scalar,
+        load_tagged_union,
         load_tuple,
         load_type_alias,
         load_typeddict,
@@ -81,16 +143,42 @@ def _default_type_mappers(specialize: bool) -> dict[TypePredicate, LoaderFn]:
 
     load_tuple_ = load_tuple
     load_simple_collection_ = load_simple_collection
-    if specialize:
+    load_dict_ = load_dict
+    load_dataclass_ = load_dataclass
+    load_namedtuple_ = (
+        load_namedtuple_or_array if namedtuple_from_array else load_namedtuple
+    )
+    if (policy := specialization_policy) is not None:
         from tressed.loader.specializer import SpecializingLoader
-        from tressed.loader.specializers import (
-            specialize_load_simple_collection,
-            specialize_load_tuple,
-        )
 
-        load_tuple_ = SpecializingLoader(load_tuple, specialize_load_tuple)
+        tree_specializer: TypeLoaderSpecializer
+        dataclass_specializer: TypeLoaderSpecializer
+        if specialization_backend == "closure":
+            from tressed.loader.composers import (
+                compose_load_dataclass as dataclass_specializer,
+            )
+            from tressed.loader.composers import (
+                compose_load_tree as tree_specializer,
+            )
+        else:
+            from tressed.loader.specializers import (
+                specialize_load_dataclass as dataclass_specializer,
+            )
+            from tressed.loader.specializers import (
+                specialize_load_tree as tree_specializer,
+            )
+
+        load_tuple_ = SpecializingLoader(
+            load_tuple, tree_specializer, policy, max_cache_size
+        )
         load_simple_collection_ = SpecializingLoader(
-            load_simple_collection, specialize_load_simple_collection
+            load_simple_collection, tree_specializer, policy, max_cache_size
+        )
+        load_dict_ = SpecializingLoader(
+            load_dict, tree_specializer, policy, max_cache_size
+        )
+        load_dataclass_ = SpecializingLoader(
+            load_dataclass, dataclass_specializer, policy, max_cache_size
         )
 
     # Note that the order matters as some predicates match several types,
@@ -101,18 +189,18 @@ def _default_type_mappers(specialize: bool) -> dict[TypePredicate, LoaderFn]:
         is_generic_list_type: load_simple_collection_,
         is_generic_set_type: load_simple_collection_,
         is_generic_frozenset_type: load_simple_collection_,
-        is_dict_type: load_dict,
+        is_dict_type: load_dict_,
         is_literal_type: load_literal,
         is_type_alias_type: load_type_alias,
         is_optional_type: load_optional,
         # NOTE: Union has to be after optional, since optionals of the form T | None are also unions.
-        is_union_type: load_union,
+        is_union_type: load_tagged_union if infer_discriminators else load_union,
         is_discriminated_union: load_discriminated_union,
         is_newtype: load_newtype,
         is_typeddict: load_typeddict,
-        is_dataclass_type: load_dataclass,
+        is_dataclass_type: load_dataclass_,
         is_ipaddress_type: load_simple_scalar,
-        is_namedtuple_type: load_namedtuple,
+        is_namedtuple_type: load_namedtuple_,
         is_enum_type: load_simple_scalar,
         is_uuid_type: load_simple_scalar,
         is_fspath_type: load_simple_scalar,
@@ -130,6 +218,11 @@ class Loader:
         extra_type_handlers: Mapping[TypeForm, LoaderFn] | None = None,
         extra_type_mappers: Mapping[TypePredicate, LoaderFn] | None = None,
         enable_specialization: bool = False,
+        # When to specialize type forms, implies enable_specialization.
+        specialization_policy: SpecializationPolicy | None = None,
+        # Generate the source of specializations and exec it, or compose them from
+        # closures where exec is not allowed.
+        specialization_backend: SpecializationBackend = "exec",
         # If set enables alias lookup on fields, for example for dataclasses.
         alias_field: str | None = "alias",
         # Pass custom alias function, for example mapping field names to camelCase using to_camel.
@@ -137,6 +230,25 @@ class Loader:
         # Overriding the resolver factory allows for more advanced behavior like disablign caching,
         # or changing the alias resolution behavior entirely.
         alias_resolver_factory: Callable[[AliasFn | None], AliasResolver] | None = None,
+        # Also resolve the keys of typed dicts through the alias resolver. Note that typed
+        # dicts are plain dicts once loaded, dumpers write their keys as is.
+        alias_typeddict_keys: bool = False,
+        # Wrap foreign exceptions once in load instead of around every loaded value,
+        # the failing value and type path are then recovered from the traceback.
+        top_level_error_wrapping: bool = False,
+        # Maximum number of entries of each memoization cache, for example type handlers
+        # memoized from type mappers or plans, None for unbounded.
+        # Normalized type forms are cached globally, see set_type_info_cache_size.
+        max_cache_size: int | None = 4096,
+        # Also load named tuples from arrays of their fields in order, which are more
+        # compact than mappings.
+        namedtuple_from_array: bool = False,
+        # Dispatch mappings by tag for unions whose arms share a field annotated with
+        # disjoint Literal values, as if discriminated by that field.
+        infer_discriminators: bool = False,
+        # Trial handlers by the handler they stand for, returning FAILED instead of
+        # raising when trying the arms of unions, see tressed.loader.trials.
+        extra_trial_handlers: Mapping[LoaderFn, TrialLoaderFn] | None = None,
     ) -> None:
         # Map a type form to its loader
         if default_type_handlers is None:
@@ -149,13 +261,44 @@ class Loader:
 
         # Mapping of type predicate to a loader
         if default_type_mappers is None:
-            type_mappers = _default_type_mappers(enable_specialization)
+            if specialization_policy is None and enable_specialization:
+                from tressed.loader.specializer import SpecializationPolicy
+
+                specialization_policy = SpecializationPolicy()
+            type_mappers = _default_type_mappers(
+                specialization_policy,
+                specialization_backend,
+                namedtuple_from_array,
+                infer_discriminators,
+                max_cache_size,
+            )
         else:
             type_mappers = dict(default_type_mappers)
         if extra_type_mappers:
             type_mappers |= extra_type_mappers
         self._type_mappers: Mapping[TypePredicate, LoaderFn] = type_mappers
 
+        trial_handlers = _default_trial_handlers()
+        for type_loader in (*type_handlers.values(), *type_mappers.values()):
+            # Specializing handlers are tried like the handler they specialize
+            inner = getattr(type_loader, "_loader", None)
+            if inner is not None and (trial := trial_handlers.get(inner)) is not None:
+                trial_handlers[type_loader] = trial
+        if extra_trial_handlers:
+            trial_handlers |= extra_trial_handlers
+        self._trial_handlers: dict[LoaderFn, TrialLoaderFn] = trial_handlers
+
+        from tressed.cache import TypeFormCache
+
+        # Type handlers memoized from type mappers, kept apart from the registered type
+        # handlers to be bounded and weakly reference classes.
+        self._handler_cache: TypeFormCache[LoaderFn] = TypeFormCache(max_cache_size)
+
+        from tressed.dispatch import DispatchIndex
+
+        # Narrow down the type mappers to try on a type handler cache miss
+        self._type_mapper_index = DispatchIndex(type_mappers, max_cache_size)
+
         from tressed.alias import (
             AliasResolver,
             compose_alias_fn,
@@ -170,36 +313,275 @@ class Loader:
             )
 
         if alias_resolver_factory is None:
-            self._alias_resolver = AliasResolver(alias_fn)
+            self._alias_resolver = AliasResolver(
+                alias_fn, max_cache_size=max_cache_size
+            )
         else:
             self._alias_resolver = alias_resolver_factory(alias_fn)
+        self._alias_typeddict_keys = alias_typeddict_keys
+
+        # Plans computed once per type form by plan factory, see tressed.loader.plans
+        self._plans: dict[Callable[..., Any], TypeFormCache[Any]] = {}
+        self._max_cache_size = max_cache_size
+
+        self.top_level_error_wrapping = top_level_error_wrapping
+        if top_level_error_wrapping:
+            self._load = self._load_unwrapped  # type: ignore[method-assign]
+
+        # Changed whenever handlers or aliases may have changed, specializations generated
+        # for another version are dropped.
+        self._version = next(_versions)
 
     def _resolve_alias[T](
         self, type_form: TypeForm, type_path: TypePath, name: str
     ) -> Alias:
         return self._alias_resolver.resolve(name, type_form, type_path)
 
-    def _load[T](self, value: Any, type_form: TypeForm[T], type_path: TypePath) -> T:
+    def _resolve_static_alias(self, type_form: TypeForm, name: str) -> Alias | None:
+        return self._alias_resolver.resolve_static(name, type_form)
+
+    def _plan[P](
+        self,
+        type_form: TypeForm,
+        make_plan: Callable[[TypeForm, LoaderProtocol], P],
+    ) -> P:
+        if (plans := self._plans.get(make_plan)) is None:
+            from tressed.cache import TypeFormCache
+
+            plans = self._plans[make_plan] = TypeFormCache(self._max_cache_size)
+        if (plan := plans.get(type_form)) is None:
+            plan = make_plan(type_form, self)
+            plans.add(type_form, _NO_PLAN if plan is None else plan)
+        elif plan is _NO_PLAN:
+            return None  # type: ignore[return-value]
+        return plan
+
+    def _lookup_handler[T](self, type_form: TypeForm[T]) -> LoaderFn[T] | None:
         if (type_loader := self._type_handlers.get(type_form)) is None:
-            for type_predicate, type_loader in self._type_mappers.items():
-                if type_predicate(type_form):
-                    break
-            else:
-                type_loader = None
-            if type_loader is None:
-                raise TressedTypeFormError(value, type_form, type_path)
+            if (type_loader := self._handler_cache.get(type_form)) is None:
+                if (type_loader := self._type_mapper_index.lookup(type_form)) is None:
+                    return None
 
-            # Cache lookup for next time
-            self._type_handlers[type_form] = type_loader
+                # Cache lookup for next time
+                self._handler_cache.add(type_form, type_loader)
+        return type_loader
+
+    def _load[T](self, value: Any, type_form: TypeForm[T], type_path: TypePath) -> T:
+        if (type_loader := self._type_handlers.get(type_form)) is None:
+            if (type_loader := self._handler_cache.get(type_form)) is None:
+                if (type_loader := self._lookup_handler(type_form)) is None:
+                    raise TressedTypeFormError(value, type_form, type_path)
 
         try:
             return type_loader(value, type_form, type_path, self)
         except TressedValueError:
             raise
         except Exception as e:
-            error = TressedValueError(value, type_form, type_path)
-            error.add_note(f"{type(e)}: {e}")
-            raise error from e
+            raise TressedValueError.from_exception(
+                e, value, type_form, type_path
+            ) from e
+
+    def _try_load[T](
+        self, value: Any, type_form: TypeForm[T], type_path: TypePath
+    ) -> T | Failed:
+        """
+        Load the value like _load, but return FAILED instead of raising value errors.
+
+        Type form errors are still raised, as they do not depend on the value.
+        """
+        if (type_loader := self._type_handlers.get(type_form)) is None:
+            if (type_loader := self._handler_cache.get(type_form)) is None:
+                if (type_loader := self._lookup_handler(type_form)) is None:
+                    raise TressedTypeFormError(value, type_form, type_path)
+
+        if (trial_loader := self._trial_handlers.get(type_loader)) is not None:
+            return trial_loader(value, type_form, type_path, self)
+
+        try:
+            return type_loader(value, type_form, type_path, self)
+        except TressedValueError:
+            return FAILED
+        except TressedError:
+            raise
+        except Exception:
+            return FAILED
+
+    def _load_unwrapped[T](
+        self, value: Any, type_form: TypeForm[T], type_path: TypePath
+    ) -> T:
+        if (type_loader := self._type_handlers.get(type_form)) is None:
+            if (type_loader := self._handler_cache.get(type_form)) is None:
+                if (type_loader := self._lookup_handler(type_form)) is None:
+                    raise TressedTypeFormError(value, type_form, type_path)
+
+        return type_loader(value, type_form, type_path, self)
+
+    def add_type_handlers(self, type_handlers: Mapping[TypeForm, LoaderFn]) -> None:
+        """
+        Register type handlers after construction, taking precedence over type mappers.
+
+        Memoized handlers, plans and specializations are dropped, since they might refer
+        to previous handlers.
+        """
+        self._type_handlers |= type_handlers
+        self.clear_caches()
+
+    def specialization_report(self) -> list[SpecializationReport]:
+        """
+        Report the specialization state of the type forms loaded through specialized
+        handlers so far, for example to check that hot type forms run specialized code.
+        """
+        reports = []
+        for type_loader in {
+            id(type_loader): type_loader
+            for type_loader in (
+                *self._type_handlers.values(),
+                *self._type_mappers.values(),
+            )
+        }.values():
+            if (report := getattr(type_loader, "report", None)) is not None:
+                reports.extend(report())
+        return reports
+
+    def clear_caches(self) -> None:
+        """
+        Clear the memoized type handlers, plans, dispatch candidates, resolved aliases
+        and specializations, for example after unloading dynamically created types.
+
+        Registered type handlers are kept. Note that normalized type forms are cached
+        globally, see tressed.type_info.clear_type_info_cache.
+        """
+        self._version = next(_versions)
+        self._handler_cache.clear()
+        self._plans.clear()
+        self._type_mapper_index.clear()
+        self._alias_resolver.clear_cache()
+        for type_loader in (
+            *self._type_handlers.values(),
+            *self._type_mappers.values(),
+        ):
+            if (clear_cache := getattr(type_loader, "clear_cache", None)) is not None:
+                clear_cache()
+
+    def _prewarm(self, type_form: TypeForm, seen: set[TypeForm]) -> None:
+        """
+        Resolve the handlers, plans, aliases and specializations of the given type form
+        and of the type forms it is made of.
+        """
+        if type_form in seen:
+            return
+        seen.add(type_form)
+
+        if (type_loader := self._lookup_handler(type_form)) is None:
+            return
+
+        from tressed.loader.loaders import (
+            load_dataclass,
+            load_namedtuple,
+            load_namedtuple_or_array,
+            load_type_alias,
+            load_typeddict,
+        )
+        from tressed.loader.plans import (
+            make_dataclass_plan,
+            make_namedtuple_plan,
+            make_type_alias_plan,
+            make_typeddict_plan,
+        )
+        from tressed.loader.specializer import SpecializingLoader
+        from tressed.type_info import get_type_info
+
+        specializing_loader = None
+        if isinstance(type_loader, SpecializingLoader):
+            specializing_loader = type_loader
+            type_loader = type_loader._loader
+
+        if type_loader in (load_dataclass, load_namedtuple, load_namedtuple_or_array):
+            make_plan = (
+                make_dataclass_plan
+                if type_loader is load_dataclass
+                else make_namedtuple_plan
+            )
+            for field in self._plan(type_form, make_plan):
+                self._prewarm(field.type_form, seen)
+        elif type_loader is load_typeddict:
+            typeddict_plan = self._plan(type_form, make_typeddict_plan)
+            for field in typeddict_plan.fields:
+                self._prewarm(field.type_form, seen)
+            if (extra_items := typeddict_plan.extra_items) is not None:
+                self._prewarm(extra_items[0], seen)
+        elif type_loader is load_type_alias:
+            self._prewarm(self._plan(type_form, make_type_alias_plan).type_form, seen)
+        else:
+            type_info = get_type_info(type_form)
+            if type_info.kind != "literal":
+                for arg in type_info.args:
+                    self._prewarm(arg, seen)
+            # NewTypes load through their direct supertype
+            if (inner := type_info.supertype or type_info.inner) is not None:
+                self._prewarm(inner, seen)
+
+        # Specialize once the type forms it is made of are resolved
+        if specializing_loader is not None:
+            specializing_loader.specialize(type_form, self)
+
+    def _compile_handler[T](self, type_form: TypeForm[T]) -> LoaderFn[T]:
+        self._prewarm(type_form, set())
+
+        if (type_loader := self._lookup_handler(type_form)) is None:
+            raise TressedTypeFormError(
+                None, type_form, (), "no handler to compile a loader with"
+            )
+        return type_loader
+
+    def compile[T](self, type_form: TypeForm[T]) -> Callable[[Any], T]:
+        """
+        Resolve everything needed to load the given type form up front, and return a
+        function loading values into it.
+
+        The handlers of the type form and of the type forms it is made of are looked up
+        and memoized, and their plans and specializations are computed. The returned
+        function calls the handler of the type form directly. Nested values are loaded
+        by the specializations of their parent if any, which call the handlers they are
+        made of directly, otherwise through the memoized handlers.
+
+        Raises TressedTypeFormError if the type form has no handler. The handler is
+        resolved again when the loader changes, for example on add_type_handlers.
+        """
+        type_loader = self._compile_handler(type_form)
+        version = self._version
+
+        loader = self
+        wrap: Callable[[Exception, Any, TypeForm, TypePath], TressedValueError]
+        if self.top_level_error_wrapping:
+            passthrough: type[Exception] = TressedError
+            wrap = TressedValueError.from_traceback
+        else:
+            passthrough = TressedValueError
+            wrap = TressedValueError.from_exception
+
+        def load(value: Any) -> T:
+            nonlocal type_loader, version
+            if loader._version != version:
+                type_loader = loader._compile_handler(type_form)
+                version = loader._version
+
+            try:
+                return type_loader(value, type_form, (), loader)
+            except passthrough:
+                raise
+            except Exception as e:
+                raise wrap(e, value, type_form, ()) from e
+
+        return load
 
     def load[T](self, value: Any, type_form: TypeForm[T]) -> T:
-        return self._load(value, type_form, ())
+        if not self.top_level_error_wrapping:
+            return self._load(value, type_form, ())
+
+        try:
+            return self._load(value, type_form, ())
+        except TressedError:
+            raise
+        except Exception as e:
+            raise TressedValueError.from_traceback(e, value, type_form, ()) from e
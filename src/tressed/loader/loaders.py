@@ -1,8 +1,10 @@
 import sys
 
-from tressed.exceptions import TressedValueError
-from tressed.predicates import get_args, get_origin, is_union_type
+from tressed.exceptions import TressedError, TressedTypeFormError, TressedValueError
+from tressed.loader.trials import FAILED
 from tressed.type_form import type_form_repr
+from tressed.type_info import get_type_info
+from tressed.type_path import TypePathNode
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
@@ -24,13 +26,16 @@ __all__ = [
     "load_newtype",
     "load_typeddict",
     "load_namedtuple",
+    "load_namedtuple_or_array",
     "load_literal",
     "load_type_alias",
     "load_optional",
     "load_union",
+    "load_tagged_union",
     "load_datetime",
     "load_discriminated_union",
     "load_re_pattern",
+    "load_unhandled",
 ]
 
 if TYPE_CHECKING:
@@ -55,6 +60,25 @@ def _items(value: Any) -> Iterator[tuple[Any, Any]]:
         return value.items()
 
 
+def _mapping(value: Any) -> Any:
+    type_ = type(value)
+    if type_ is dict:
+        return value
+    elif (argparse := sys.modules.get("argparse")) and type_ is argparse.Namespace:
+        return vars(value)
+    else:
+        return value
+
+
+def load_unhandled[T](
+    value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
+) -> T:
+    """
+    Placeholder handler for type forms without handler.
+    """
+    raise TressedTypeFormError(value, type_form, type_path)
+
+
 def load_identity[T](
     value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
 ) -> T:
@@ -103,24 +127,34 @@ def load_complex[T](
     """
     Load complex from a sequence a pair of floats.
     """
-    real = loader._load(value[0], float, (*type_path, 0))
-    imag = loader._load(value[1], float, (*type_path, 1))
+    real = loader._load(value[0], float, TypePathNode((type_path, 0)))
+    imag = loader._load(value[1], float, TypePathNode((type_path, 1)))
     return type_form(real, imag)  # type: ignore[call-arg]
 
 
 def load_dict[T](
     value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
 ) -> T:
-    args = get_args(type_form)
-
-    assert args is not None
+    args = get_type_info(type_form).args
     assert len(args) == 2
 
     key_type, value_type = args
+    load = loader._load
+    if key_type is str and loader._lookup_handler(str) is load_identity:
+        # Keys are most often strings already, skip their dispatch
+        return {  # type: ignore[return-value]
+            item_key
+            if type(item_key) is str
+            else load_identity(
+                item_key, str, TypePathNode((type_path, item_key)), loader
+            ): (load(item_value, value_type, TypePathNode((type_path, item_key))))
+            for item_key, item_value in _items(value)
+        }
+
     return {  # type: ignore[return-value]
-        loader._load(
-            item_key, key_type, (item_path := (*type_path, item_key))
-        ): loader._load(item_value, value_type, item_path)
+        load(
+            item_key, key_type, (item_path := TypePathNode((type_path, item_key)))
+        ): load(item_value, value_type, item_path)
         for item_key, item_value in _items(value)
     }
 
@@ -128,10 +162,11 @@ def load_dict[T](
 def load_simple_collection[T](
     value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
 ) -> T:
-    origin = get_origin(type_form)
+    type_info = get_type_info(type_form)
+    origin = type_info.origin
     num_expected_args = 2 if origin is tuple else 1
-    args = get_args(type_form)
-    if origin is None or args is None or len(args) != num_expected_args:
+    args = type_info.args
+    if origin is None or len(args) != num_expected_args:
         raise TressedValueError(
             value,
             type_form,
@@ -141,7 +176,7 @@ def load_simple_collection[T](
 
     item_type = args[0]
     return origin(
-        loader._load(item, item_type, (*type_path, pos))
+        loader._load(item, item_type, TypePathNode((type_path, pos)))
         for pos, item in enumerate(value)
     )
 
@@ -149,9 +184,9 @@ def load_simple_collection[T](
 def load_tuple[T](
     value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
 ) -> T:
-    origin = get_origin(type_form)
-    args = get_args(type_form)
-    if origin is None or args is None:
+    type_info = get_type_info(type_form)
+    args = type_info.args
+    if type_info.origin is None:
         raise TressedValueError(
             value,
             type_form,
@@ -160,7 +195,7 @@ def load_tuple[T](
         )
 
     return tuple(  # type: ignore[return-value]
-        loader._load(item, args[pos], (*type_path, pos))
+        loader._load(item, args[pos], TypePathNode((type_path, pos)))
         for pos, item in enumerate(value)
     )
 
@@ -168,113 +203,221 @@ def load_tuple[T](
 def load_dataclass[T](
     value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
 ) -> T:
-    from dataclasses import fields
-    from typing import get_type_hints
+    from tressed.loader.plans import make_dataclass_plan
 
     loaded = {}
 
-    type_hints = get_type_hints(type_form)
-    for field in fields(type_form):  # type: ignore[arg-type]
-        field_name = field.name
-        alias = loader._resolve_alias(type_form, type_path, field_name)
-        if not field.init:
-            continue
-
-        if (field_type := type_hints.get(field_name)) is None:
-            continue
-
-        if (field_value := value.get(alias, _MISSING)) is not _MISSING:
-            loaded[field_name] = loader._load(
-                field_value, field_type, (*type_path, alias)
-            )
+    mapping = _mapping(value)
+    for field in loader._plan(type_form, make_dataclass_plan):
+        if (alias := field.alias) is None:
+            alias = loader._resolve_alias(type_form, type_path, field.name)
+
+        if (field_value := mapping.get(alias, _MISSING)) is not _MISSING:
+            field_type = field.type_form
+            field_path = TypePathNode((type_path, alias))
+            try:
+                loaded[field.name] = field.handler(
+                    field_value, field_type, field_path, loader
+                )
+            except TressedError:
+                raise
+            except Exception as e:
+                raise TressedValueError.from_exception(
+                    e, field_value, field_type, field_path
+                ) from e
     return type_form(**loaded)
 
 
 def load_newtype[T: TypeForm](
     value: Any, type_form: T, type_path: TypePath, loader: LoaderProtocol
 ) -> T:
-    supertype = getattr(type_form, "__supertype__")
+    supertype = get_type_info(type_form).supertype
+    assert supertype is not None
     return loader._load(value, supertype, type_path)
 
 
-def _is_extra_items_sentinel(value: Any) -> bool:
-    if (typing := sys.modules.get("typing")) and hasattr(typing, "NoExtraItems"):
-        if value is getattr(typing, "NoExtraItems"):
-            return True
-    if typing_extensions := sys.modules.get("typing_extensions"):
-        if value is typing_extensions.NoExtraItems:
-            return True
-    return False
-
-
 def load_typeddict[T](
     value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
 ) -> T:
-    values: dict[str, Any] = {}
-    required_keys = getattr(type_form, "__required_keys__")
-    optional_keys = getattr(type_form, "__optional_keys__")
-    valid_keys = required_keys | optional_keys
+    from tressed.loader.plans import make_typeddict_plan
+
+    plan = loader._plan(type_form, make_typeddict_plan)
+    if (fields_by_alias := plan.fields_by_alias) is None:
+        fields_by_alias = {
+            loader._resolve_alias(type_form, type_path, field.name)
+            if field.alias is None
+            else field.alias: field
+            for field in plan.fields
+        }
+        required_aliases = frozenset(
+            alias
+            for alias, field in fields_by_alias.items()
+            if field.name in plan.required_names
+        )
+    else:
+        required_aliases = plan.required_aliases  # type: ignore[assignment]
 
-    closed = getattr(type_form, "__closed__", None)
-    extra_items = getattr(type_form, "__extra_items__", _MISSING)
-    if _is_extra_items_sentinel(extra_items):
-        extra_items = _MISSING
+    mapping = _mapping(value)
+    if missing_keys := (required_aliases - mapping.keys()):
+        raise TressedValueError(
+            value,
+            type_form,
+            type_path,
+            f"missing required keys {', '.join(map(repr, missing_keys))}: {value}",
+        )
 
+    values: dict[str, Any] = {}
+    extra_items = plan.extra_items
     extra_keys: set[str] | None = None
     for item_key, item_value in _items(value):
-        if extra_items is not _MISSING:
-            if item_key not in valid_keys:
-                values[item_key] = loader._load(
-                    item_value, extra_items, (*type_path, item_key)
+        if (field := fields_by_alias.get(item_key)) is not None:
+            field_type = field.type_form
+            field_path = TypePathNode((type_path, item_key))
+            try:
+                values[field.name] = field.handler(
+                    item_value, field_type, field_path, loader
                 )
-                continue
+            except TressedError:
+                raise
+            except Exception as e:
+                raise TressedValueError.from_exception(
+                    e, item_value, field_type, field_path
+                ) from e
+
+        elif extra_items is not None:
+            extra_items_type, extra_items_handler = extra_items
+            values[item_key] = extra_items_handler(
+                item_value,
+                extra_items_type,
+                TypePathNode((type_path, item_key)),
+                loader,
+            )
 
-        elif closed:
-            if item_key not in valid_keys:
-                if extra_keys is None:
-                    extra_keys = set()
-                extra_keys.add(item_key)
-                continue
+        elif plan.closed:
+            if extra_keys is None:
+                extra_keys = set()
+            extra_keys.add(item_key)
 
-        values[item_key] = item_value
+        else:
+            values[item_key] = item_value
 
-    if missing_keys := (required_keys - values.keys()):
+    if extra_keys:
         raise TressedValueError(
             value,
             type_form,
             type_path,
-            f"missing required keys {', '.join(map(repr, missing_keys))}: {value}",
+            f"extra keys {', '.join(sorted(map(repr, extra_keys)))}: {value}",
         )
 
-    if extra_keys:
+    return values  # type: ignore[return-value]
+
+
+def load_namedtuple[T](
+    value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
+) -> T:
+    from tressed.loader.plans import make_namedtuple_plan
+
+    loaded = []
+    found = 0
+
+    mapping = _mapping(value)
+    fields = loader._plan(type_form, make_namedtuple_plan)
+    defaults = getattr(type_form, "_field_defaults")
+    for field in fields:
+        if (alias := field.alias) is None:
+            alias = loader._resolve_alias(type_form, type_path, field.name)
+
+        if (field_value := mapping.get(alias, _MISSING)) is not _MISSING:
+            field_type = field.type_form
+            field_path = TypePathNode((type_path, alias))
+            try:
+                loaded.append(
+                    field.handler(field_value, field_type, field_path, loader)
+                )
+            except TressedError:
+                raise
+            except Exception as e:
+                raise TressedValueError.from_exception(
+                    e, field_value, field_type, field_path
+                ) from e
+            found += 1
+        elif (default := defaults.get(field.name, _MISSING)) is not _MISSING:
+            loaded.append(default)
+        else:
+            raise TressedValueError(
+                value, type_form, type_path, f"missing required key {alias!r}"
+            )
+
+    if found != len(mapping):
+        unexpected_keys = mapping.keys() - {
+            loader._resolve_alias(type_form, type_path, field.name)
+            if field.alias is None
+            else field.alias
+            for field in fields
+        }
         raise TressedValueError(
             value,
             type_form,
             type_path,
-            f"extra keys {', '.join(sorted(map(repr, extra_keys)))}: {value}",
+            f"unexpected keys {', '.join(sorted(map(repr, unexpected_keys)))}",
         )
-
-    return values  # type: ignore[return-value]
+    return type_form(*loaded)
 
 
-def load_namedtuple[T](
+def load_namedtuple_or_array[T](
     value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
 ) -> T:
-    from typing import get_type_hints
+    """
+    Load named tuple from a mapping, or from an array of its fields in order.
+    """
+    type_ = type(value)
+    if type_ is not list and type_ is not tuple:
+        return load_namedtuple(value, type_form, type_path, loader)
 
-    type_hints = get_type_hints(type_form)
-    values: dict[str, Any] = {
-        key: loader._load(field_value, type_hints[key], (*type_path, key))
-        for key, field_value in _items(value)
-    }
-    return type_form(**values)
+    from tressed.loader.plans import make_namedtuple_plan
+
+    fields = loader._plan(type_form, make_namedtuple_plan)
+    if len(value) > len(fields):
+        raise TressedValueError(
+            value,
+            type_form,
+            type_path,
+            f"expected at most {len(fields)} items, got {len(value)}",
+        )
+
+    loaded = []
+    for pos, field_value in enumerate(value):
+        field = fields[pos]
+        field_type = field.type_form
+        field_path = TypePathNode((type_path, pos))
+        try:
+            loaded.append(field.handler(field_value, field_type, field_path, loader))
+        except TressedError:
+            raise
+        except Exception as e:
+            raise TressedValueError.from_exception(
+                e, field_value, field_type, field_path
+            ) from e
+
+    if len(loaded) < len(fields):
+        # Trailing fields take their default
+        defaults = getattr(type_form, "_field_defaults")
+        for field in fields[len(loaded) :]:
+            if (default := defaults.get(field.name, _MISSING)) is _MISSING:
+                raise TressedValueError(
+                    value,
+                    type_form,
+                    type_path,
+                    f"missing required item {field.name!r}",
+                )
+            loaded.append(default)
+    return type_form(*loaded)
 
 
 def load_literal[T](
     value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
 ) -> T:
-    args = get_args(type_form)
-    assert args is not None
+    args = get_type_info(type_form).args
     if value in args:
         return value
     raise TressedValueError(
@@ -288,20 +431,21 @@ def load_literal[T](
 def load_type_alias[T](
     value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
 ) -> T:
-    evaluated_type = type_form.evaluate_value()  # type: ignore[attr-defined]
-    if (num_params := len(type_form.__type_params__)) > 0:
-        args = get_args(type_form)
-        if args is None or len(args) < num_params:
-            raise TressedValueError(
-                value,
-                type_form,
-                type_path,
-                "type form should have only concrete type parameters",
-            )
+    from tressed.loader.plans import make_type_alias_plan
 
-        evaluated_type = evaluated_type[*args]
+    plan = loader._plan(type_form, make_type_alias_plan)
+    if (handler := plan.handler) is None:
+        raise TressedValueError(value, type_form, type_path, plan.message)
 
-    return loader._load(value, evaluated_type, type_path)
+    resolved_type_form = plan.type_form
+    try:
+        return handler(value, resolved_type_form, type_path, loader)
+    except TressedError:
+        raise
+    except Exception as e:
+        raise TressedValueError.from_exception(
+            e, value, resolved_type_form, type_path
+        ) from e
 
 
 def load_optional[T](
@@ -310,7 +454,7 @@ def load_optional[T](
     if value is None:
         return value  # type: ignore[return-value]
 
-    args = get_args(type_form)
+    args = get_type_info(type_form).args
     match args:
         case [T, NoneType] if NoneType is type(None):
             return loader._load(value, T, type_path)
@@ -325,9 +469,20 @@ def load_optional[T](
 def load_union[T](
     value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
 ) -> T:
-    args = get_args(type_form)
+    from tressed.loader.plans import make_union_plan
+
+    plan = loader._plan(type_form, make_union_plan)
+    args = plan.args
     assert args, "unreachable"
 
+    # Only try the arms which may load values of this type and keys, failing without
+    # building errors, see tressed.loader.trials
+    try_load = loader._try_load
+    for arg in plan.arms(value):
+        if (loaded := try_load(value, arg, type_path)) is not FAILED:
+            return loaded
+
+    # Try every arm to report why each of them failed
     errors = None
     for arg in args:
         try:
@@ -336,6 +491,13 @@ def load_union[T](
             if errors is None:
                 errors = []
             errors.append(error)
+        except TressedError:
+            raise
+        except Exception as e:
+            # Foreign exceptions are only raised here with top-level error wrapping
+            if errors is None:
+                errors = []
+            errors.append(TressedValueError.from_traceback(e, value, arg, type_path))
 
     assert args, "unreachable"
     raise TressedValueError(
@@ -346,6 +508,39 @@ def load_union[T](
     )
 
 
+def load_tagged_union[T](
+    value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
+) -> T:
+    """
+    Load a union, dispatching mappings by tag like discriminated unions if the arms
+    share a field annotated with disjoint Literal values, see
+    Loader(infer_discriminators=True).
+
+    Values not matching a single arm by tag are loaded like any union, so that the
+    same arm loads them and errors report every arm.
+    """
+    from tressed.loader.plans import make_inferred_discriminated_union_plan
+
+    if (
+        type(value) is dict
+        and (plan := loader._plan(type_form, make_inferred_discriminated_union_plan))
+        is not None
+    ):
+        # Always tabled for inferred discriminators
+        tags: dict[Any, TypeForm] = plan.tags  # type: ignore[assignment]
+        try:
+            matched_type_form = tags.get(value.get(plan.tag_alias, _MISSING))
+        except TypeError:
+            # Unhashable tag values
+            matched_type_form = None
+        if matched_type_form is not None and (
+            (loaded := loader._try_load(value, matched_type_form, type_path))
+            is not FAILED
+        ):
+            return loaded
+    return load_union(value, type_form, type_path, loader)
+
+
 def load_datetime[T](
     value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
 ) -> T:
@@ -366,22 +561,38 @@ def load_re_pattern[T](
 def load_discriminated_union[T](
     value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
 ) -> T:
-    from tressed.discriminated_union import Discriminator
-
-    args = get_args(type_form)
-    assert args is not None, "unreachable"
-
-    union_type = next(arg for arg in args if is_union_type(arg))
-    union_args = get_args(union_type)
-    assert union_args
-
-    discriminator = next(
-        metadata
-        for metadata in type_form.__metadata__  # type: ignore[attr-defined]
-        if isinstance(metadata, Discriminator)
-    )
+    from tressed.loader.plans import make_discriminated_union_plan
+
+    plan = loader._plan(type_form, make_discriminated_union_plan)
+    if (tags := plan.tags) is None:
+        discriminator = plan.discriminator
+        if (arm_tag_aliases := plan.arm_tag_aliases) is None:
+            matched_type_form = discriminator.match(value, *plan.args)
+        else:
+            # Not tabled, match the alias of the tag field in each arm
+            name = discriminator.field
+            assert name is not None
+            matched_type_form = discriminator.match_field(
+                value,
+                (
+                    (
+                        arm,
+                        loader._resolve_alias(arm, type_path, name)
+                        if alias is None
+                        else alias,
+                    )
+                    for arm, alias in zip(plan.args, arm_tag_aliases)
+                ),
+            )
+    elif type(value) is dict:
+        try:
+            matched_type_form = tags.get(value.get(plan.tag_alias, _MISSING))
+        except TypeError:
+            # Unhashable tag values
+            matched_type_form = None
+    else:
+        matched_type_form = None
 
-    matched_type_form = discriminator.match(value, *union_args)
     if matched_type_form is None:
         raise TressedValueError(
             value,
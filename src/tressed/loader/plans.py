@@ -0,0 +1,863 @@
+"""
+Load plans.
+
+A load plan holds everything that can be computed once per type form, for example
+the fields of a dataclass with their aliases, types and handlers.
+Plans are cached per loader, see Loader._plan.
+"""
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any, Final, Literal
+
+    from tressed.alias import Alias
+    from tressed.discriminated_union import Discriminator
+    from tressed.loader.types import LoaderFn, LoaderProtocol
+    from tressed.type_form import TypeForm
+
+__all__ = [
+    "ConstructorArgPlan",
+    "DataclassTrialPlan",
+    "DiscriminatedUnionPlan",
+    "FieldPlan",
+    "InlinePlan",
+    "TypeAliasPlan",
+    "TypedDictPlan",
+    "UnionPlan",
+    "make_dataclass_constructor_plan",
+    "make_dataclass_plan",
+    "make_dataclass_trial_plan",
+    "make_discriminated_union_plan",
+    "make_inferred_discriminated_union_plan",
+    "make_inline_plan",
+    "make_namedtuple_plan",
+    "make_type_alias_plan",
+    "make_typeddict_plan",
+    "make_union_plan",
+]
+
+
+class FieldPlan:
+    __slots__ = ("name", "alias", "type_form", "handler")
+
+    def __init__(
+        self,
+        name: str,
+        alias: Alias | None,
+        type_form: TypeForm,
+        handler: LoaderFn,
+    ) -> None:
+        self.name: Final = name
+        # None if the alias depends on the type path and has to be resolved on load.
+        self.alias: Final = alias
+        self.type_form: Final = type_form
+        self.handler: Final = handler
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"name={self.name!r}, alias={self.alias!r}, type_form={self.type_form!r})"
+        )
+
+
+def _field_plan(
+    type_form: TypeForm,
+    name: str,
+    field_type: TypeForm,
+    loader: LoaderProtocol,
+    aliased: bool = True,
+) -> FieldPlan:
+    if (handler := loader._lookup_handler(field_type)) is None:
+        # Do not fail eagerly, the field might never be loaded.
+        from tressed.loader.loaders import load_unhandled
+
+        handler = load_unhandled
+    return FieldPlan(
+        name,
+        loader._resolve_static_alias(type_form, name) if aliased else name,
+        field_type,
+        handler,
+    )
+
+
+def make_dataclass_plan(
+    type_form: TypeForm, loader: LoaderProtocol
+) -> tuple[FieldPlan, ...]:
+    """
+    Plan the fields to load for the given dataclass, skipping non-init fields.
+    """
+    from dataclasses import fields
+    from typing import get_type_hints
+
+    type_hints = get_type_hints(type_form)
+    return tuple(
+        _field_plan(type_form, field.name, field_type, loader)
+        for field in fields(type_form)  # type: ignore[arg-type]
+        if field.init and (field_type := type_hints.get(field.name)) is not None
+    )
+
+
+def make_namedtuple_plan(
+    type_form: TypeForm, loader: LoaderProtocol
+) -> tuple[FieldPlan, ...]:
+    """
+    Plan the fields to load for the given named tuple, in field order.
+    """
+    from typing import get_type_hints
+
+    type_hints = get_type_hints(type_form)
+    return tuple(
+        _field_plan(type_form, name, type_hints[name], loader)
+        for name in type_form._fields
+    )
+
+
+class TypedDictPlan:
+    __slots__ = (
+        "fields",
+        "required_names",
+        "fields_by_alias",
+        "required_aliases",
+        "closed",
+        "extra_items",
+    )
+
+    def __init__(
+        self,
+        fields: tuple[FieldPlan, ...],
+        required_names: frozenset[str],
+        closed: bool,
+        extra_items: tuple[TypeForm, LoaderFn] | None,
+    ) -> None:
+        self.fields: Final = fields
+        self.required_names: Final = required_names
+        # None if some aliases depend on the type path and have to be resolved on load.
+        self.fields_by_alias: Final[dict[Alias, FieldPlan] | None] = (
+            None
+            if any(field.alias is None for field in fields)
+            else {field.alias: field for field in fields}  # type: ignore[misc]
+        )
+        self.required_aliases: Final[frozenset[Alias] | None] = (
+            None
+            if self.fields_by_alias is None
+            else frozenset(
+                field.alias  # type: ignore[misc]
+                for field in fields
+                if field.name in required_names
+            )
+        )
+        self.closed: Final = closed
+        # Type form and handler of the items of undeclared keys, if any.
+        self.extra_items: Final = extra_items
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"fields={self.fields!r}, closed={self.closed!r}, "
+            f"extra_items={self.extra_items!r})"
+        )
+
+
+def _is_extra_items_sentinel(value: Any) -> bool:
+    import sys
+
+    if (typing := sys.modules.get("typing")) and hasattr(typing, "NoExtraItems"):
+        if value is getattr(typing, "NoExtraItems"):
+            return True
+    if typing_extensions := sys.modules.get("typing_extensions"):
+        if value is typing_extensions.NoExtraItems:
+            return True
+    return False
+
+
+def make_typeddict_plan(type_form: TypeForm, loader: LoaderProtocol) -> TypedDictPlan:
+    """
+    Plan loading the given typed dict, with the declared keys, their aliases, types and
+    handlers, the required keys and the type of extra items.
+
+    Keys are only resolved through the alias resolver if the loader aliases typed dict
+    keys, otherwise their alias is the key itself.
+    """
+    from typing import get_type_hints
+
+    type_hints = get_type_hints(type_form)
+    aliased = loader._alias_typeddict_keys
+    fields = tuple(
+        _field_plan(type_form, name, field_type, loader, aliased)
+        for name, field_type in type_hints.items()
+    )
+
+    extra_items = None
+    missing: Any = object()
+    extra_items_type: TypeForm = getattr(type_form, "__extra_items__", missing)
+    if extra_items_type is not missing and not _is_extra_items_sentinel(
+        extra_items_type
+    ):
+        if (handler := loader._lookup_handler(extra_items_type)) is None:
+            from tressed.loader.loaders import load_unhandled
+
+            handler = load_unhandled
+        extra_items = (extra_items_type, handler)
+
+    return TypedDictPlan(
+        fields,
+        frozenset(getattr(type_form, "__required_keys__")),
+        bool(getattr(type_form, "__closed__", None)),
+        extra_items,
+    )
+
+
+class TypeAliasPlan:
+    __slots__ = ("type_form", "handler", "message")
+
+    def __init__(
+        self,
+        type_form: TypeForm,
+        handler: LoaderFn | None,
+        message: str = "",
+    ) -> None:
+        # The type form the type alias stands for, after following aliases of aliases.
+        self.type_form: Final = type_form
+        # None if the type alias cannot be loaded, see message.
+        self.handler: Final = handler
+        self.message: Final = message
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"type_form={self.type_form!r}, handler={self.handler!r})"
+        )
+
+
+def make_type_alias_plan(type_form: TypeForm, loader: LoaderProtocol) -> TypeAliasPlan:
+    """
+    Plan loading the given type alias by evaluating it once, with its type parameters
+    substituted, and following aliases of aliases.
+    """
+    from tressed.type_info import evaluate_type_alias, get_type_info
+
+    seen = set()
+    resolved = type_form
+    while (type_info := get_type_info(resolved)).kind == "type_alias":
+        if resolved in seen:
+            return TypeAliasPlan(type_form, None, "type alias refers to itself")
+        seen.add(resolved)
+
+        if (inner := type_info.inner) is None:
+            # Evaluated again for the error, the names the type alias refers to may
+            # also have been defined since its type info was made.
+            try:
+                inner = evaluate_type_alias(resolved)
+            except Exception as e:
+                return TypeAliasPlan(
+                    type_form, None, f"failed to evaluate type alias: {type(e)}: {e}"
+                )
+            if inner is None:
+                return TypeAliasPlan(
+                    type_form,
+                    None,
+                    "type form should have only concrete type parameters",
+                )
+        resolved = inner
+
+    if (handler := loader._lookup_handler(resolved)) is None:
+        from tressed.loader.loaders import load_unhandled
+
+        handler = load_unhandled
+    return TypeAliasPlan(resolved, handler)
+
+
+if TYPE_CHECKING:
+    type InlineKind = Literal[
+        "identity",
+        "float",
+        "scalar",
+        "optional",
+        "collection",
+        "tuple",
+        "dict",
+        "opaque",
+    ]
+
+
+class InlinePlan:
+    """
+    How a type form is loaded once inlined in a specialization, shared by the
+    specialization backends.
+    """
+
+    __slots__ = ("kind", "handler", "origin", "args")
+
+    def __init__(
+        self,
+        kind: InlineKind,
+        handler: LoaderFn | None,
+        origin: TypeForm | None = None,
+        args: tuple[TypeForm, ...] = (),
+    ) -> None:
+        self.kind: Final = kind
+        # The generic handler, not its specialization. None if there is no handler.
+        self.handler: Final = handler
+        self.origin: Final = origin
+        # The type forms to inline, for example the item type of collections.
+        self.args: Final = args
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"kind={self.kind!r}, origin={self.origin!r}, args={self.args!r})"
+        )
+
+
+def make_inline_plan(type_form: TypeForm, loader: LoaderProtocol) -> InlinePlan:
+    """
+    Plan inlining the handler of the given type form, only the default handlers of
+    scalars, optionals and collections can be inlined.
+    """
+    from tressed.loader.loaders import (
+        load_dict,
+        load_float,
+        load_identity,
+        load_optional,
+        load_simple_collection,
+        load_simple_scalar,
+        load_tuple,
+    )
+    from tressed.loader.specializer import SpecializingLoader
+    from tressed.type_info import get_type_info
+
+    handler = loader._lookup_handler(type_form)
+    if isinstance(handler, SpecializingLoader):
+        # Inline the generic handler the specialization stands for
+        handler = handler._loader
+
+    type_info = get_type_info(type_form)
+    origin = type_info.origin
+    args = type_info.args
+
+    if handler is load_identity:
+        return InlinePlan("identity", handler)
+    if handler is load_float:
+        return InlinePlan("float", handler)
+    if handler is load_simple_scalar:
+        return InlinePlan("scalar", handler)
+
+    if handler is load_optional:
+        inner_args = tuple(arg for arg in args if arg is not type(None))
+        if len(inner_args) == 1:
+            return InlinePlan("optional", handler, origin, inner_args)
+
+    if handler is load_simple_collection and origin is not None and args:
+        if len(args) == (2 if origin is tuple else 1):
+            return InlinePlan("collection", handler, origin, args[:1])
+
+    if handler is load_tuple and origin is not None:
+        return InlinePlan("tuple", handler, origin, args)
+
+    if handler is load_dict and len(args) == 2:
+        return InlinePlan("dict", handler, origin, args)
+
+    # Including user handlers
+    return InlinePlan("opaque", handler)
+
+
+class ConstructorArgPlan:
+    __slots__ = ("field", "keyword", "required", "default", "default_factory")
+
+    def __init__(
+        self,
+        field: FieldPlan,
+        keyword: bool,
+        required: bool,
+        default: Any = None,
+        default_factory: Callable[[], Any] | None = None,
+    ) -> None:
+        self.field: Final = field
+        # Passed by keyword instead of positionally.
+        self.keyword: Final = keyword
+        # Otherwise a missing value takes the default, or the default factory if set.
+        self.required: Final = required
+        self.default: Final = default
+        self.default_factory: Final = default_factory
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"field={self.field!r}, keyword={self.keyword!r}, required={self.required!r})"
+        )
+
+
+def make_dataclass_constructor_plan(
+    type_form: TypeForm, loader: LoaderProtocol
+) -> tuple[ConstructorArgPlan, ...] | None:
+    """
+    Plan calling the constructor of the given dataclass with its fields, mostly
+    positionally, and with the defaults of missing fields.
+
+    None if the constructor is user defined, or if aliases depend on the type path.
+    """
+    import dataclasses
+
+    params = getattr(type_form, "__dataclass_params__", None)
+    if params is None or not params.init:
+        return None
+
+    plan = loader._plan(type_form, make_dataclass_plan)
+    if any(field.alias is None for field in plan):
+        return None
+
+    dataclass_fields = {
+        field.name: field
+        for field in dataclasses.fields(type_form)  # type: ignore[arg-type]
+    }
+    # Init only variables are positional arguments too, in declaration order
+    positional = len(dataclass_fields) == len(
+        getattr(type_form, "__dataclass_fields__")
+    )
+
+    args = []
+    for field_plan in plan:
+        field = dataclass_fields[field_plan.name]
+        keyword = not positional or field.kw_only is True
+        if field.default is not dataclasses.MISSING:
+            args.append(ConstructorArgPlan(field_plan, keyword, False, field.default))
+        elif field.default_factory is not dataclasses.MISSING:
+            args.append(
+                ConstructorArgPlan(
+                    field_plan, keyword, False, default_factory=field.default_factory
+                )
+            )
+        else:
+            args.append(ConstructorArgPlan(field_plan, keyword, True))
+    return tuple(args)
+
+
+# Types of the values union arms are dispatched on, the others try every arm.
+_DISPATCH_TYPES = (dict, list, tuple, str, int, float, bool, type(None))
+
+
+class UnionPlan:
+    """
+    The arms of a union to try by type of the loaded value, in declaration order.
+
+    Arms are only left out for a type when their handler cannot load any value of it,
+    so the arm loading a value is the same as when trying every arm.
+    """
+
+    __slots__ = ("args", "arms_by_type", "required_keys")
+
+    def __init__(
+        self,
+        args: tuple[TypeForm, ...],
+        arms_by_type: dict[type, tuple[TypeForm, ...]],
+        required_keys: tuple[tuple[TypeForm, frozenset[Alias] | None], ...] | None,
+    ) -> None:
+        self.args: Final = args
+        self.arms_by_type: Final = arms_by_type
+        # The arms to try for dicts with the aliases each of them requires, None if
+        # any key set is accepted. None if no arm requires keys.
+        self.required_keys: Final = required_keys
+
+    def arms(self, value: Any) -> tuple[TypeForm, ...]:
+        """
+        The arms which may load the given value, narrowing down dicts by their keys.
+        """
+        if (arms := self.arms_by_type.get(type(value))) is None:
+            return self.args
+        if type(value) is dict and (required_keys := self.required_keys) is not None:
+            keys = value.keys()
+            return tuple(
+                [
+                    arg
+                    for arg, required in required_keys
+                    if required is None or keys >= required
+                ]
+            )
+        return arms
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"args={self.args!r}, arms_by_type={self.arms_by_type!r}, "
+            f"required_keys={self.required_keys!r})"
+        )
+
+
+def _accepted_types(
+    type_form: TypeForm, loader: LoaderProtocol, seen: frozenset[int] = frozenset()
+) -> frozenset[type] | None:
+    """
+    Types of the values the handler of the type form may load, None for any type.
+    """
+    from tressed.loader.loaders import (
+        load_complex,
+        load_dataclass,
+        load_datetime,
+        load_dict,
+        load_float,
+        load_identity,
+        load_literal,
+        load_namedtuple,
+        load_namedtuple_or_array,
+        load_newtype,
+        load_optional,
+        load_re_pattern,
+        load_simple_collection,
+        load_tagged_union,
+        load_tuple,
+        load_type_alias,
+        load_typeddict,
+        load_union,
+    )
+    from tressed.loader.specializer import SpecializingLoader
+    from tressed.type_info import get_type_info
+
+    if id(type_form) in seen:
+        # Recursive type aliases
+        return None
+    seen |= {id(type_form)}
+
+    handler = loader._lookup_handler(type_form)
+    if isinstance(handler, SpecializingLoader):
+        handler = handler._loader
+    type_info = get_type_info(type_form)
+
+    def accepted_by_all(
+        type_forms: tuple[TypeForm, ...],
+    ) -> frozenset[type] | None:
+        accepted: frozenset[type] = frozenset()
+        for arg in type_forms:
+            if (arg_accepted := _accepted_types(arg, loader, seen)) is None:
+                return None
+            accepted |= arg_accepted
+        return accepted
+
+    if handler is load_identity:
+        return frozenset({type_form})  # type: ignore[arg-type]
+    if handler is load_float:
+        return frozenset({int, float})
+    if handler is load_datetime or handler is load_re_pattern:
+        return frozenset({str})
+    if (
+        handler is load_simple_collection
+        or handler is load_tuple
+        or handler is load_complex
+    ):
+        # Any iterable or sequence, including strings and the keys of dicts
+        return frozenset({dict, list, tuple, str})
+    if handler is load_dict or handler is load_typeddict:
+        return frozenset({dict})
+    if handler is load_dataclass:
+        # Dataclasses without fields to load are constructed from any value
+        return (
+            frozenset({dict}) if loader._plan(type_form, make_dataclass_plan) else None
+        )
+    if handler is load_namedtuple or handler is load_namedtuple_or_array:
+        if not loader._plan(type_form, make_namedtuple_plan):
+            return None
+        if handler is load_namedtuple_or_array:
+            return frozenset({dict, list, tuple})
+        return frozenset({dict})
+    if handler is load_literal:
+        literal_types: set[type] = set()
+        for arg in type_info.args:
+            if type(arg) is str or arg is None:
+                literal_types.add(type(arg))
+            elif type(arg) in (bool, int, float):
+                # Compared by equality, for example True == 1 == 1.0
+                literal_types |= {bool, int, float}
+            else:
+                return None
+        return frozenset(literal_types)
+    if handler is load_optional:
+        if (accepted := accepted_by_all(type_info.args)) is None:
+            return None
+        return accepted | {type(None)}
+    if handler is load_union or handler is load_tagged_union:
+        return accepted_by_all(type_info.args)
+    if handler is load_newtype and (supertype := type_info.supertype) is not None:
+        return _accepted_types(supertype, loader, seen)
+    if handler is load_type_alias:
+        alias_plan = loader._plan(type_form, make_type_alias_plan)
+        if alias_plan.handler is None:
+            return None
+        return _accepted_types(alias_plan.type_form, loader, seen)
+
+    # Including user handlers and constructors like enums
+    return None
+
+
+def _required_keys(
+    type_form: TypeForm, loader: LoaderProtocol
+) -> frozenset[Alias] | None:
+    """
+    The aliases required to load a dict into a dataclass or typed dict, None for other
+    type forms or if aliases depend on the type path.
+    """
+    from tressed.loader.loaders import load_dataclass, load_typeddict
+    from tressed.loader.specializer import SpecializingLoader
+
+    handler = loader._lookup_handler(type_form)
+    if isinstance(handler, SpecializingLoader):
+        handler = handler._loader
+
+    if handler is load_dataclass:
+        if (trial_plan := loader._plan(type_form, make_dataclass_trial_plan)) is None:
+            return None
+        return frozenset(trial_plan.required_aliases)
+    if handler is load_typeddict:
+        return loader._plan(type_form, make_typeddict_plan).required_aliases
+    return None
+
+
+def make_union_plan(type_form: TypeForm, loader: LoaderProtocol) -> UnionPlan:
+    """
+    Plan which arms of the given union to try by type of the loaded value, and by keys
+    for dicts.
+    """
+    from tressed.type_info import get_type_info
+
+    args = get_type_info(type_form).args
+    accepted = [_accepted_types(arg, loader) for arg in args]
+    arms_by_type = {
+        type_: tuple(
+            arg
+            for arg, arg_accepted in zip(args, accepted)
+            if arg_accepted is None or type_ in arg_accepted
+        )
+        for type_ in _DISPATCH_TYPES
+    }
+
+    required_keys = tuple(
+        (arg, _required_keys(arg, loader)) for arg in arms_by_type[dict]
+    )
+    return UnionPlan(
+        args,
+        arms_by_type,
+        required_keys if any(required for _, required in required_keys) else None,
+    )
+
+
+class DataclassTrialPlan:
+    """
+    Cheap checks telling a value cannot be loaded into a dataclass, without loading it.
+    """
+
+    __slots__ = ("required_aliases", "literal_fields")
+
+    def __init__(
+        self,
+        required_aliases: tuple[Alias, ...],
+        literal_fields: tuple[tuple[Alias, tuple[Any, ...]], ...],
+    ) -> None:
+        self.required_aliases: Final = required_aliases
+        # Alias and values of literal fields, often discriminating the arms of unions.
+        self.literal_fields: Final = literal_fields
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"required_aliases={self.required_aliases!r}, "
+            f"literal_fields={self.literal_fields!r})"
+        )
+
+
+def make_dataclass_trial_plan(
+    type_form: TypeForm, loader: LoaderProtocol
+) -> DataclassTrialPlan | None:
+    """
+    Plan checking values against the given dataclass, None if aliases depend on the type
+    path or the constructor is user defined.
+    """
+    from tressed.loader.loaders import load_literal
+    from tressed.type_info import get_type_info
+
+    if (plan := loader._plan(type_form, make_dataclass_constructor_plan)) is None:
+        return None
+    return DataclassTrialPlan(
+        tuple(arg.field.alias for arg in plan if arg.required),  # type: ignore[misc]
+        tuple(
+            (arg.field.alias, get_type_info(arg.field.type_form).args)  # type: ignore[misc]
+            for arg in plan
+            if arg.field.handler is load_literal
+        ),
+    )
+
+
+class DiscriminatedUnionPlan:
+    """
+    The arms and discriminator of a discriminated union, with the arms by tag for
+    discriminators by field.
+    """
+
+    __slots__ = ("args", "discriminator", "tag_alias", "tags", "arm_tag_aliases")
+
+    def __init__(
+        self,
+        args: tuple[TypeForm, ...],
+        discriminator: Discriminator,
+        tag_alias: Alias | None,
+        tags: dict[Any, TypeForm] | None,
+        arm_tag_aliases: tuple[Alias | None, ...] | None = None,
+    ) -> None:
+        self.args: Final = args
+        self.discriminator: Final = discriminator
+        # None if the discriminator matches arms with its match function, for example
+        # if the tag field has a different alias in some arms.
+        self.tag_alias: Final = tag_alias
+        self.tags: Final = tags
+        # The alias of the tag field in each arm for discriminators by field without
+        # table, None for aliases depending on the type path, see
+        # Discriminator.match_field.
+        self.arm_tag_aliases: Final = arm_tag_aliases
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"args={self.args!r}, discriminator={self.discriminator!r}, "
+            f"tag_alias={self.tag_alias!r}, tags={self.tags!r}, "
+            f"arm_tag_aliases={self.arm_tag_aliases!r})"
+        )
+
+
+def _tag_fields(
+    type_form: TypeForm, loader: LoaderProtocol
+) -> tuple[FieldPlan, ...] | None:
+    """
+    The fields of a dataclass, named tuple or typed dict annotated as a Literal, None
+    for other type forms.
+    """
+    from tressed.loader.loaders import (
+        load_dataclass,
+        load_namedtuple,
+        load_namedtuple_or_array,
+        load_typeddict,
+    )
+    from tressed.loader.specializer import SpecializingLoader
+    from tressed.type_info import get_type_info
+
+    handler = loader._lookup_handler(type_form)
+    if isinstance(handler, SpecializingLoader):
+        handler = handler._loader
+
+    fields: tuple[FieldPlan, ...]
+    if handler is load_dataclass:
+        fields = loader._plan(type_form, make_dataclass_plan)
+    elif handler is load_namedtuple or handler is load_namedtuple_or_array:
+        fields = loader._plan(type_form, make_namedtuple_plan)
+    elif handler is load_typeddict:
+        fields = loader._plan(type_form, make_typeddict_plan).fields
+    else:
+        return None
+    return tuple(
+        field for field in fields if get_type_info(field.type_form).kind == "literal"
+    )
+
+
+def _tag_field(
+    type_form: TypeForm, name: str, loader: LoaderProtocol
+) -> FieldPlan | None:
+    """
+    The field of the given name of a dataclass, named tuple or typed dict, if annotated
+    as a Literal.
+    """
+    for field in _tag_fields(type_form, loader) or ():
+        if field.name == name:
+            return field
+    return None
+
+
+def make_discriminated_union_plan(
+    type_form: TypeForm, loader: LoaderProtocol
+) -> DiscriminatedUnionPlan:
+    """
+    Plan dispatching values of the given discriminated union to its arms.
+
+    For discriminators by field the arms are tabled by the values of their tag field,
+    if the tag field has the same static alias in every arm, otherwise the alias of the
+    tag field in each arm is planned.
+    """
+    from tressed.discriminated_union import Discriminator
+    from tressed.type_info import get_type_info
+
+    type_info = get_type_info(type_form)
+    assert type_info.inner is not None, "unreachable"
+    args = get_type_info(type_info.inner).args
+    discriminator = next(
+        metadata
+        for metadata in type_info.metadata
+        if isinstance(metadata, Discriminator)
+    )
+    if (name := discriminator.field) is None:
+        return DiscriminatedUnionPlan(args, discriminator, None, None)
+
+    if (tag_table := _tag_table(args, name, loader)) is not None:
+        tag_alias, tags, ambiguous = tag_table
+        # Ambiguous tags are left to the match strategy
+        if not ambiguous or discriminator.strategy != "best-match":
+            return DiscriminatedUnionPlan(args, discriminator, tag_alias, tags)
+
+    # Arms loaded by other handlers are matched by the field name
+    arm_tag_aliases = tuple(
+        name if (field := _tag_field(arg, name, loader)) is None else field.alias
+        for arg in args
+    )
+    return DiscriminatedUnionPlan(args, discriminator, None, None, arm_tag_aliases)
+
+
+def _tag_table(
+    args: tuple[TypeForm, ...], name: str, loader: LoaderProtocol
+) -> tuple[Alias, dict[Any, TypeForm], bool] | None:
+    """
+    The alias of the tag field of the given name and the arms by tag, the first arm
+    winning, and whether several arms share a tag.
+
+    None if some arm has no such tag field, or if its alias differs between arms or
+    depends on the type path.
+    """
+    from tressed.type_info import get_type_info
+
+    tag_aliases = set()
+    tags: dict[Any, TypeForm] = {}
+    ambiguous = False
+    for arg in args:
+        if (field := _tag_field(arg, name, loader)) is None or field.alias is None:
+            return None
+        tag_aliases.add(field.alias)
+        for tag in get_type_info(field.type_form).args:
+            if tags.setdefault(tag, arg) is not arg:
+                ambiguous = True
+
+    if len(tag_aliases) != 1:
+        return None
+    (tag_alias,) = tag_aliases
+    return tag_alias, tags, ambiguous
+
+
+def make_inferred_discriminated_union_plan(
+    type_form: TypeForm, loader: LoaderProtocol
+) -> DiscriminatedUnionPlan | None:
+    """
+    Plan dispatching values of the given union by tag, as if discriminated by field,
+    if all its arms share a field annotated with disjoint Literal values.
+
+    None if no such field exists, the first one in the order of the first arm is used
+    otherwise.
+    """
+    from tressed.discriminated_union import Discriminator
+    from tressed.type_info import get_type_info
+
+    args = get_type_info(type_form).args
+    if not args or (first_fields := _tag_fields(args[0], loader)) is None:
+        return None
+
+    for field in first_fields:
+        if (tag_table := _tag_table(args, field.name, loader)) is None:
+            continue
+        tag_alias, tags, ambiguous = tag_table
+        if not ambiguous:
+            return DiscriminatedUnionPlan(
+                args, Discriminator.by_field(field.name), tag_alias, tags
+            )
+    return None
@@ -1,6 +1,12 @@
+import time
+
+from tressed.exceptions import TressedError
+from tressed.loader.specializers import Codegen
+
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from typing import Any
+    from collections.abc import Callable, Iterable, Iterator
+    from typing import Any, Final, Literal
 
     from tressed.loader.types import (
         LoaderFn,
@@ -10,15 +16,282 @@ if TYPE_CHECKING:
     )
     from tressed.type_form import TypeForm
 
-__all__ = ["SpecializingLoader"]
+    type SpecializationMode = Literal["tiered", "eager", "never"]
+    # Generate the source of specialized functions, or compose them from closures.
+    type SpecializationBackend = Literal["exec", "closure"]
+    # Counting calls until the threshold, running the specialized function, or running
+    # the generic handler for good, see SpecializationReport.reason.
+    type SpecializationState = Literal["counting", "compiled", "unspecializable"]
+    type UnspecializableReason = Literal["denied", "unsupported", "deoptimized"]
+
+__all__ = ["SpecializationPolicy", "SpecializationReport", "SpecializingLoader"]
+
+
+class SpecializationPolicy:
+    """
+    Decide when type forms are specialized, trading compile time for steady-state speed.
+
+    In the tiered mode a type form is specialized once loaded more than threshold times,
+    in the eager mode on its first load, and never in the never mode.
+    Allow and deny lists match type forms or the origin of generic type forms,
+    for example denying list denies specializing any list[T].
+    """
+
+    __slots__ = ("mode", "threshold", "allow", "deny")
+
+    def __init__(
+        self,
+        mode: SpecializationMode = "tiered",
+        *,
+        threshold: int = 3,
+        allow: Iterable[TypeForm] | None = None,
+        deny: Iterable[TypeForm] = (),
+    ) -> None:
+        self.mode: Final = mode
+        self.threshold: Final = 0 if mode == "eager" else threshold
+        # None allows all type forms which are not denied.
+        self.allow: Final = None if allow is None else frozenset(allow)
+        self.deny: Final = frozenset(deny)
+
+    def allows(self, type_form: TypeForm) -> bool:
+        if self.mode == "never":
+            return False
+
+        from tressed.type_info import get_type_info
+
+        origin = get_type_info(type_form).origin
+        if type_form in self.deny or origin in self.deny:
+            return False
+        if (allow := self.allow) is not None:
+            return type_form in allow or origin in allow
+        return True
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"{self.mode!r}, threshold={self.threshold!r}, "
+            f"allow={self.allow!r}, deny={self.deny!r})"
+        )
+
+
+class SpecializationReport:
+    """
+    State of the specialization of a type form, or of a type for dumpers.
+
+    Calls are counted since the specializations were last dropped, the compile time
+    is in seconds, and the source is only generated by the exec backend.
+    """
+
+    __slots__ = ("key", "handler", "state", "calls", "compile_time", "source", "reason")
+
+    def __init__(
+        self,
+        key: Any,
+        handler: str,
+        state: SpecializationState,
+        calls: int,
+        compile_time: float | None = None,
+        source: str | None = None,
+        reason: UnspecializableReason | None = None,
+    ) -> None:
+        self.key: Final = key
+        # Name of the generic handler being specialized
+        self.handler: Final = handler
+        self.state: Final = state
+        self.calls: Final = calls
+        self.compile_time: Final = compile_time
+        self.source: Final = source
+        self.reason: Final = reason
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"key={self.key!r}, handler={self.handler!r}, state={self.state!r}, "
+            f"calls={self.calls!r}, compile_time={self.compile_time!r}, "
+            f"reason={self.reason!r})"
+        )
+
+
+class _Specialization:
+    """
+    The specialization of one key, with the number of calls and how it was compiled,
+    or why it was not.
+    """
+
+    __slots__ = ("fn", "calls", "compile_time", "source", "reason")
+
+    def __init__(self) -> None:
+        # The specialized function once compiled
+        self.fn: Any = None
+        self.calls = 0
+        self.compile_time: float | None = None
+        self.source: str | None = None
+        # Set if the key is not to be specialized
+        self.reason: UnspecializableReason | None = None
+
+    @property
+    def state(self) -> SpecializationState:
+        if self.fn is not None:
+            return "compiled"
+        if self.reason is not None:
+            return "unspecializable"
+        return "counting"
+
+
+class _Specializations:
+    """
+    Specializations of a generic handler by key, type forms for loaders and types for
+    dumpers, specialized following the policy once called often enough.
+
+    Specializations inline the handlers and aliases of the loader or dumper they are
+    generated for, and are dropped whenever its version changes. At most max_size keys
+    are tracked, the oldest are evicted first. Keys are held strongly, as specialized
+    functions reference their key anyway.
+    """
+
+    __slots__ = ("handler", "specializer", "policy", "max_size", "version", "_entries")
+
+    def __init__(
+        self,
+        handler: Any,
+        specializer: Callable[[Any, Any], Any],
+        policy: SpecializationPolicy | None,
+        max_size: int | None,
+    ) -> None:
+        self.handler: Final = handler
+        self.specializer: Final = specializer
+        self.policy: Final = policy if policy is not None else SpecializationPolicy()
+        self.max_size: Final = max_size
+        self.version: int | None = None
+        self._entries: dict[Any, _Specialization] = {}
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def items(self) -> Iterator[tuple[Any, _Specialization]]:
+        yield from self._entries.items()
+
+    def report(self) -> list[SpecializationReport]:
+        handler_name = getattr(self.handler, "__name__", type(self.handler).__name__)
+        return [
+            SpecializationReport(
+                key,
+                handler_name,
+                entry.state,
+                entry.calls,
+                entry.compile_time,
+                entry.source,
+                entry.reason,
+            )
+            for key, entry in self.items()
+        ]
+
+    def _entry(self, key: Any, target: Any) -> _Specialization:
+        if target._version != self.version:
+            self.clear()
+            self.version = target._version
+
+        if (entry := self._entries.get(key)) is None:
+            entry = _Specialization()
+            if not self.policy.allows(key):
+                entry.reason = "denied"
+
+            entries = self._entries
+            if (max_size := self.max_size) is not None:
+                if max_size <= 0:
+                    return entry
+                while len(entries) >= max_size:
+                    # Evict the oldest entry
+                    del entries[next(iter(entries))]
+            entries[key] = entry
+        return entry
+
+    def get(self, key: Any, target: Any) -> Any:
+        """
+        Count a call of the key, and return its specialized function if any, compiling
+        it once called more than the policy threshold.
+        """
+        entry = self._entry(key, target)
+        entry.calls += 1
+        if (fn := entry.fn) is not None:
+            return fn
+        if entry.reason is None and entry.calls > self.policy.threshold:
+            return self._compile(key, entry, target)
+        return None
+
+    def specialize(self, key: Any, target: Any) -> bool:
+        """
+        Specialize the key now regardless of the number of calls, if allowed by the
+        policy. Returns whether the key could be specialized.
+        """
+        entry = self._entry(key, target)
+        if entry.fn is not None:
+            return True
+        if entry.reason is not None:
+            return False
+        return self._compile(key, entry, target) is not None
+
+    def deoptimize(self, key: Any) -> None:
+        """
+        Drop the specialization of the key for good, as it failed on a valid value.
+        """
+        if (entry := self._entries.get(key)) is not None:
+            entry.fn = None
+            entry.reason = "deoptimized"
+
+    def _compile(self, key: Any, entry: _Specialization, target: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            fn = self.specializer(key, target)
+            if isinstance(fn, Codegen):
+                entry.source = fn.code()
+                fn = fn.exec()
+        except Exception:
+            # A failing specializer leaves the key to the generic handler, like keys it
+            # does not support.
+            fn = None
+        if fn is None:
+            entry.reason = "unsupported"
+            return None
+
+        entry.fn = fn
+        entry.compile_time = time.perf_counter() - start
+        return fn
 
 
 class SpecializingLoader:
-    def __init__(self, loader: LoaderFn, specializer: TypeLoaderSpecializer) -> None:
+    def __init__(
+        self,
+        loader: LoaderFn,
+        specializer: TypeLoaderSpecializer,
+        policy: SpecializationPolicy | None = None,
+        max_cache_size: int | None = 4096,
+    ) -> None:
         self._loader = loader
-        self._specialized_loaders: dict[tuple[TypeForm, TypePath], Any] = {}
-        self._specializer = specializer
-        self._threshold: int = 3
+        # Specializations are keyed by type form only, the type path is passed to the
+        # specialized function at call time. This way all the items of a collection share
+        # the same counter, and the number of entries is bounded by the number of type forms.
+        self._specializations = _Specializations(
+            loader, specializer, policy, max_cache_size
+        )
+
+    def clear_cache(self) -> None:
+        self._specializations.clear()
+
+    def report(self) -> list[SpecializationReport]:
+        """
+        Report the specialization state of each type form loaded so far.
+        """
+        return self._specializations.report()
+
+    def specialize(self, type_form: TypeForm, loader: LoaderProtocol) -> bool:
+        """
+        Specialize the given type form now regardless of the number of calls, if allowed
+        by the policy.
+
+        Returns whether the type form could be specialized.
+        """
+        return self._specializations.specialize(type_form, loader)
 
     def __call__[T](
         self,
@@ -27,32 +300,16 @@ class SpecializingLoader:
         type_path: TypePath,
         loader: LoaderProtocol,
     ) -> T:
-        key = (type_form, type_path)
-        specialized_loader = self._specialized_loaders.get(key)
-        if type(specialized_loader) is type(None) or type(specialized_loader) is int:
-            if type(specialized_loader) is int and specialized_loader > 0:
-                count = specialized_loader + 1
-            else:
-                count = 1
-            self._specialized_loaders[key] = count
-            specialized_loader = None
-
-            # Specialize!
-            if count > self._threshold:
-                specializer_fn_code = self._specializer(*key)
-                if specializer_fn_code is None:
-                    # zero means we can't specialize this
-                    self._specialized_loaders[key] = 0
-                else:
-                    globals_: dict[str, Any] = {}
-                    locals_: dict[str, Any] = {}
-
-                    exec(specializer_fn_code, globals_, locals_)
-
-                    specialized_loader = locals_["__specialized_fn"]
-                    self._specialized_loaders[key] = specialized_loader
-
-        if specialized_loader is None:
+        if (specialized_loader := self._specializations.get(type_form, loader)) is None:
             return self._loader(value, type_form, type_path, loader)
-        else:
-            return specialized_loader(value, loader)
+
+        try:
+            return specialized_loader(value, type_path, loader)
+        except TressedError:
+            raise
+        except Exception:
+            # Raises the error of the generic handler if the value is invalid
+            loaded = self._loader(value, type_form, type_path, loader)
+            # Otherwise the specialization is at fault, deoptimize
+            self._specializations.deoptimize(type_form)
+            return loaded
@@ -1,35 +1,131 @@
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Iterable
     from typing import Any, Final
 
-    from tressed.loader.types import LoaderFn
+    from tressed.loader.types import LoaderFn, LoaderProtocol
     from tressed.type_form import TypeForm
-    from tressed.type_path import TypePath, TypePathItem
+    from tressed.type_path import TypePath
 
 __all__ = [
-    "specialize_load_tuple",
-    "specialize_load_simple_collection",
+    "Codegen",
+    "load_generic",
+    "specialize_load_tree",
+    "specialize_load_dataclass",
 ]
 
 
+def exec_globals() -> dict[str, Any]:
+    """
+    Globals the generated code is executed with, in addition to the bound namespace.
+    """
+    from tressed.type_path import TypePathNode
+
+    return {"TypePathNode": TypePathNode}
+
+
+def load_generic[T](
+    handler: LoaderFn[T],
+    value: Any,
+    type_form: TypeForm[T],
+    type_path: TypePath,
+    loader: LoaderProtocol,
+) -> T:
+    """
+    Load the value with the generic handler a specialized function falls back to,
+    wrapping foreign exceptions like Loader._load does.
+
+    The specializing loader loads values again with the generic handler on foreign
+    exceptions, to tell invalid values from faulty specializations, wrapping them
+    spares that second load once the generic handler already failed.
+    """
+    from tressed.exceptions import TressedError, TressedValueError
+
+    try:
+        return handler(value, type_form, type_path, loader)
+    except TressedError:
+        raise
+    except Exception as e:
+        raise TressedValueError.from_exception(e, value, type_form, type_path) from e
+
+
+def _ident_hint(obj: Any) -> str:
+    name = getattr(obj, "__name__", None)
+    if type(name) is not str or not name.isidentifier():
+        # For example instances of callable classes
+        return type(obj).__name__
+    return name
+
+
 class Codegen:
-    __slots__ = ("fn_name", "indent", "_parts", "_cached_code")
+    """
+    Generate the source of a specialized function taking the value, type path and loader,
+    or other arguments, for example the dumper.
+
+    Objects like type forms and helpers are never written in the source, they are bound
+    in a namespace the function is executed with instead, under allocated identifiers.
+    """
 
-    def __init__(self, fn_name: str = "__specialized_fn") -> None:
+    __slots__ = (
+        "fn_name",
+        "args",
+        "indent",
+        "namespace",
+        "_idents",
+        "_bound_idents",
+        "_parts",
+        "_cached_code",
+    )
+
+    def __init__(
+        self,
+        fn_name: str = "__specialized_fn",
+        args: tuple[str, ...] = ("value", "type_path", "loader"),
+    ) -> None:
         self.fn_name: Final = fn_name
+        self.args: Final = args
         self.indent: Final = "    "
+        # Objects bound by identifier, see bind.
+        self.namespace: Final[dict[str, Any]] = {}
 
+        # Identifiers in use, including the function arguments and globals.
+        self._idents: set[str] = {fn_name, *args, *exec_globals()}
+        # Identifier of bound objects by id, to bind each object once.
+        self._bound_idents: dict[int, str] = {}
         self._parts: list[str] = []
         self._cached_code: str | None = None
 
+    def allocate(self, hint: str) -> str:
+        """
+        Allocate an unused identifier, derived from the given hint.
+        """
+        ident = hint if hint.startswith("_") else f"_{hint}"
+        if ident in self._idents:
+            count = 0
+            while (ident_ := f"{ident}_{count}") in self._idents:
+                count += 1
+            ident = ident_
+        self._idents.add(ident)
+        return ident
+
+    def bind(self, obj: Any, hint: str | None = None) -> str:
+        """
+        Bind the given object in the namespace of the generated function, returning its
+        identifier.
+        """
+        if (ident := self._bound_idents.get(id(obj))) is None:
+            ident = self._bound_idents[id(obj)] = self.allocate(
+                hint if hint is not None else _ident_hint(obj)
+            )
+            self.namespace[ident] = obj
+        return ident
+
     def code(self) -> str:
         if cached_code := self._cached_code:
             return cached_code
         import io
 
         builder = io.StringIO()
-        builder.write(f"def {self.fn_name}(value, loader):\n")
+        builder.write(f"def {self.fn_name}({', '.join(self.args)}):\n")
         for line in self._parts:
             builder.write(line)
         builder.write("\n")
@@ -39,9 +135,9 @@ class Codegen:
         self._parts.clear()
         return cached_code
 
-    def exec(self) -> LoaderFn:
+    def exec(self) -> Any:
         # NOTE: This relies on the source being executed being only trusted and validated inputs.
-        globals_: dict[str, Any] = {}
+        globals_ = exec_globals() | self.namespace
         locals_: dict[str, Any] = {}
         exec(self.code(), globals_, locals_)
         return locals_[self.fn_name]
@@ -60,162 +156,256 @@ class Codegen:
         self._emit(line)
         self._emit_newline()
 
-    def emit_unpack_args(
-        self, ident: str, args: tuple[TypeForm, ...]
-    ) -> tuple[tuple[str, TypeForm], ...]:
-        # TODO: Allocate identifiers!
-        items = tuple((f"_item_{pos}", type_form) for pos, type_form in enumerate(args))
-        match items:
-            case []:
-                pass
-            case [(item_ident, _)]:
-                self._emit_line(f"{item_ident}, = {ident}")
-            case [*_]:
-                self._emit_line(
-                    f"{', '.join(item_ident for item_ident, _ in items)} = {ident}"
-                )
-        return items
-
-    def emit_load_fn(self, ident: str = "_load") -> str:
+    def emit_load_fn(self, hint: str = "load") -> str:
+        ident = self.allocate(hint)
         self._emit_line(f"{ident} = loader._load")
         return ident
 
-    def emit_load(
-        self,
-        loader_ident: str,
-        ident: str,
-        type_form: TypeForm,
-        type_path: TypePath,
-        type_path_item: TypePathItem,
-    ) -> str:
-        # TODO: Allocate identifiers!
-        loaded_ident = f"{ident}_loaded"
-        # TODO: Handle type forms!
-        self._emit_line(
-            f"{loaded_ident} = _load({ident}, {type_form.__qualname__}, {_type_path_repr(*type_path, type_path_item)})"
-        )
-        return loaded_ident
-
-    def emit_tuple(self, idents: Iterable[str], *, compact: bool = False) -> None:
-        self._emit("(")
-        if not compact:
-            self._emit_newline()
-        for ident in idents:
-            if not compact:
-                self._emit_indent(indent=1)
-            self._emit(f"{ident},")
-            if not compact:
-                self._emit_newline()
-        if not compact:
-            self._emit_indent()
-        self._emit(")")
-        self._emit_newline()
-
     def emit_return(self) -> None:
         self._emit_indent()
         self._emit("return ")
 
+    def emit_try(self) -> None:
+        self._emit_line("try:")
+
+    def emit_except_fallback(self, fallback: str, type_form: TypeForm) -> None:
+        """
+        Close the try block, loading the value again with the generic handler on foreign
+        exceptions, for example from scalar conversions, to report them at the type path
+        of the failing value.
+        """
+        from tressed.exceptions import TressedError
+
+        self._emit_line(f"except {self.bind(TressedError)}:")
+        self._emit_line("raise", indent=1)
+        self._emit_line("except Exception:")
+        self._emit_line(f"return {self.fallback_call(fallback, type_form)}", indent=1)
+
+    def fallback_call(self, fallback: str, type_form: TypeForm) -> str:
+        """
+        Expression loading the value with the fallback handler, see load_generic.
+        """
+        load_generic_ident = self.bind(load_generic)
+        type_ident = self.bind(type_form)
+        return (
+            f"{load_generic_ident}({fallback}, value, {type_ident}, type_path, loader)"
+        )
 
-def specialize_load_tuple[T](
-    type_form: TypeForm[T],
-    type_path: TypePath,
-) -> str | None:
+
+def _extend_type_path(type_path: str, item: str) -> str:
     """
-    Generate specialized function for given type at given path.
+    Extend the type path expression by the item expression.
     """
-    from tressed.predicates import get_args
+    return f"TypePathNode(({type_path}, {item}))"
 
-    args = get_args(type_form)
-    assert args is not None
-
-    codegen = Codegen()
-    items = codegen.emit_unpack_args("value", args)
-    load_fn = codegen.emit_load_fn()
-    loaded = []
-    for pos, (item, arg_type_form) in enumerate(items):
-        loaded.append(codegen.emit_load(load_fn, item, arg_type_form, type_path, pos))
-    codegen.emit_return()
-    codegen.emit_tuple(loaded)
-    return codegen.code()
 
+class _Inliner:
+    """
+    Build the expression loading a value into a type form, with the handlers of the
+    type forms it is made of inlined.
 
-def _type_form_repr(type_form) -> str:
-    from tressed.predicates import get_args, get_origin
-
-    origin = get_origin(type_form)
-    if origin is not None:
-        args = get_args(type_form)
-        assert args is not None
-        return _generic_type_repr(origin, args)
-
-    return type_form.__qualname__
+    Inlined code only takes a fast path on values of the exact expected types, other
+    values go through the slow path, which is the loader for nested type forms, so that
+    errors and less common inputs are handled exactly as without inlining.
+    """
 
+    __slots__ = ("codegen", "loader", "load_fn")
 
-def _generic_type_repr(origin: TypeForm, args: tuple[TypeForm, ...]) -> str:
-    if len(args) == 0:
-        args_str = "()"
-    else:
-        args_str = ", ".join(map(_type_form_repr, args))
-    return f"{origin.__qualname__}[{args_str}]"
+    def __init__(self, codegen: Codegen, loader: LoaderProtocol, load_fn: str) -> None:
+        self.codegen: Final = codegen
+        self.loader: Final = loader
+        self.load_fn: Final = load_fn
 
+    def inline(
+        self,
+        type_form: TypeForm,
+        value: str,
+        type_path: str,
+        fallback: LoaderFn | None = None,
+    ) -> str:
+        """
+        Expression loading the value expression, evaluated several times so it must be
+        a name or a subscript, at the type path expression, only evaluated on the slow path.
+
+        The slow path calls the fallback handler if given instead of the loader.
+        """
+        from tressed.loader.plans import make_inline_plan
+
+        codegen = self.codegen
+
+        def slow() -> str:
+            type_ident = codegen.bind(type_form)
+            if fallback is None:
+                return f"{self.load_fn}({value}, {type_ident}, {type_path})"
+            fallback_ident = codegen.bind(fallback)
+            return f"{fallback_ident}({value}, {type_ident}, {type_path}, loader)"
+
+        plan = self.loader._plan(type_form, make_inline_plan)
+        match plan.kind:
+            case "identity":
+                type_ident = codegen.bind(type_form)
+                return f"({value} if type({value}) is {type_ident} else {slow()})"
+
+            case "float":
+                type_ident = codegen.bind(type_form)
+                return (
+                    f"({value} if type({value}) is float"
+                    f" else {type_ident}({value}) if type({value}) is int"
+                    f" else {slow()})"
+                )
 
-class Ident:
-    __slots__ = ("name",)
+            case "scalar":
+                # Conversion errors are foreign exceptions, see specialize_load_tree
+                return f"{codegen.bind(type_form)}({value})"
+
+            case "optional":
+                inner = self.inline(plan.args[0], value, type_path)
+                return f"(None if {value} is None else {inner})"
+
+            case "collection":
+                item = codegen.allocate("item")
+                pos = codegen.allocate("pos")
+                item_path = _extend_type_path(type_path, pos)
+                loaded = (
+                    f"{self.inline(plan.args[0], item, item_path)}"
+                    f" for {pos}, {item} in enumerate({value})"
+                )
+                if (origin := plan.origin) is list:
+                    loaded = f"[{loaded}]"
+                elif origin is set:
+                    loaded = f"{{{loaded}}}"
+                else:
+                    loaded = f"{codegen.bind(origin)}([{loaded}])"
+                return (
+                    f"({loaded} if type({value}) is list or type({value}) is tuple"
+                    f" else {slow()})"
+                )
 
-    def __init__(self, name: str) -> None:
-        self.name = name
+            case "tuple":
+                items = [
+                    self.inline(
+                        arg, f"{value}[{pos}]", _extend_type_path(type_path, repr(pos))
+                    )
+                    for pos, arg in enumerate(plan.args)
+                ]
+                loaded = f"({', '.join(items)}{',' if len(items) == 1 else ''})"
+                return (
+                    f"({loaded} if (type({value}) is list or type({value}) is tuple)"
+                    f" and len({value}) == {len(items)} else {slow()})"
+                )
 
+            case "dict":
+                key_type, value_type = plan.args
+                key = codegen.allocate("key")
+                item = codegen.allocate("item")
+                item_path = _extend_type_path(type_path, key)
+                loaded_key = self.inline(key_type, key, item_path)
+                loaded_item = self.inline(value_type, item, item_path)
+                return (
+                    f"({{{loaded_key}: {loaded_item}"
+                    f" for {key}, {item} in {value}.items()}}"
+                    f" if type({value}) is dict else {slow()})"
+                )
 
-def _type_path_repr(*args: TypePathItem | Ident) -> str:
-    items = []
-    for arg in args:
-        match arg:
-            case Ident():
-                items.append(arg.name)
             case _:
-                items.append(repr(arg))
+                return slow()
 
-    match items:
-        case [item]:
-            # Special case for single item tuple
-            return f"({item},)"
-        case _:
-            return f"({', '.join(items)})"
 
+def specialize_load_tree[T](
+    type_form: TypeForm[T], loader: LoaderProtocol
+) -> Codegen | None:
+    """
+    Generate a specialized function loading the whole type form at once, with the nested
+    collections, optionals and scalars inlined. Only other type forms, like dataclasses or
+    user handlers, go back through the loader.
 
-def specialize_load_simple_collection[T](
-    type_form: TypeForm[T],
-    type_path: TypePath,
-) -> str | None:
+    The type path is passed at call time.
     """
-    Generate specialized function for given type at given path.
+    from tressed.loader.plans import make_inline_plan
+
+    plan = loader._plan(type_form, make_inline_plan)
+    if plan.kind not in ("collection", "tuple", "dict"):
+        return None
+    handler = plan.handler
+
+    codegen = Codegen()
+    fallback = codegen.bind(handler, "fallback")
+    inliner = _Inliner(codegen, loader, codegen.emit_load_fn())
+    loaded = inliner.inline(type_form, "value", "type_path", fallback=handler)
+    codegen.emit_try()
+    codegen._emit_line(f"return {loaded}", indent=1)
+    codegen.emit_except_fallback(fallback, type_form)
+    return codegen
+
+
+def specialize_load_dataclass[T](
+    type_form: TypeForm[T], loader: LoaderProtocol
+) -> Codegen | None:
     """
-    from tressed.predicates import get_args, get_origin
+    Generate a specialized function loading the given dataclass from a dict, reading
+    the aliased keys directly and calling the constructor with positional arguments.
 
-    origin = get_origin(type_form)
-    assert origin is not None
+    Fields are loaded through their inlined or prebound handler, and missing keys take
+    the default value or factory of their field. Other inputs, and missing required
+    keys, go through the generic handler, see load_generic.
 
-    args = get_args(type_form)
-    assert args is not None
-    arg_type_form = args[0]
+    The type path is passed at call time.
+    """
+    from tressed.loader.loaders import load_dataclass
+    from tressed.loader.plans import make_dataclass_constructor_plan
+
+    if (plan := loader._plan(type_form, make_dataclass_constructor_plan)) is None:
+        return None
 
     codegen = Codegen()
+    fallback = codegen.bind(load_dataclass, "fallback")
+    type_ident = codegen.bind(type_form)
+    # Missing required keys are checked up front, so that the generic handler reporting
+    # them is called outside of the try block, and once.
+    conditions = ["type(value) is not dict"]
+    conditions.extend(
+        f"{arg.field.alias!r} not in value" for arg in plan if arg.required
+    )
+    codegen._emit_line(f"if {' or '.join(conditions)}:")
+    codegen._emit_line(f"return {codegen.fallback_call(fallback, type_form)}", indent=1)
+    inliner = _Inliner(codegen, loader, codegen.emit_load_fn())
+
+    codegen.emit_try()
+    args = []
+    # Keyword arguments are passed last, as keyword only fields may come first
+    keyword_args = []
+    for arg in plan:
+        field = arg.field
+        ident = codegen.allocate(field.name)
+        key = repr(field.alias)
+        loaded = inliner.inline(
+            field.type_form,
+            ident,
+            _extend_type_path("type_path", key),
+            fallback=field.handler,
+        )
 
-    load_fn = codegen.emit_load_fn()
-    codegen.emit_return()
-    if origin is list:
-        open, close = "[", "]"
-    elif origin is set:
-        open, close = "{", "}"
-    elif origin is frozenset:
-        open, close = "({", "})"
-    else:
-        open, close = f"{origin.__qualname__}([", "])"
-
-    codegen._emit(f"""{open}
-        {load_fn}(item, {_type_form_repr(arg_type_form)}, {_type_path_repr(*type_path, Ident("pos"))})
-        for pos, item
-        in enumerate(value)
-    {close}
-""")
-    return codegen.code()
+        if arg.required:
+            codegen._emit_line(f"{ident} = value[{key}]", indent=1)
+            codegen._emit_line(f"{ident} = {loaded}", indent=1)
+        else:
+            if (factory := arg.default_factory) is not None:
+                default = f"{codegen.bind(factory, f'{field.name}_factory')}()"
+            else:
+                default = codegen.bind(arg.default, f"{field.name}_default")
+            codegen._emit_line(f"if {key} in value:", indent=1)
+            codegen._emit_line(f"{ident} = value[{key}]", indent=2)
+            codegen._emit_line(f"{ident} = {loaded}", indent=2)
+            codegen._emit_line("else:", indent=1)
+            codegen._emit_line(f"{ident} = {default}", indent=2)
+
+        if arg.keyword:
+            keyword_args.append(f"{field.name}={ident}")
+        else:
+            args.append(ident)
+
+    codegen._emit_line(
+        f"return {type_ident}({', '.join([*args, *keyword_args])})", indent=1
+    )
+    codegen.emit_except_fallback(fallback, type_form)
+    return codegen
@@ -0,0 +1,167 @@
+"""
+Trial handlers, loading a value like their handler but returning FAILED instead of
+raising when the value cannot be loaded, so that failed speculative loads like the arms
+of unions are cheap.
+
+Trial handlers are registered by the handler they stand for, see Loader._try_load.
+They only need to be cheaper than the handler on failure, so they may check the value
+then load it with the handler.
+"""
+
+from tressed.exceptions import TressedError, TressedValueError
+from tressed.loader.plans import (
+    make_dataclass_trial_plan,
+    make_inferred_discriminated_union_plan,
+    make_typeddict_plan,
+    make_union_plan,
+)
+from tressed.type_info import get_type_info
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from tressed.loader.types import LoaderProtocol, TypePath
+    from tressed.type_form import TypeForm
+
+__all__ = [
+    "FAILED",
+    "try_load_identity",
+    "try_load_float",
+    "try_load_literal",
+    "try_load_optional",
+    "try_load_union",
+    "try_load_tagged_union",
+    "try_load_dataclass",
+    "try_load_typeddict",
+]
+
+if TYPE_CHECKING:
+    from enum import Enum, auto
+
+    class _FailedType(Enum):
+        FAILED = auto()
+
+    FAILED = _FailedType.FAILED
+
+    type Failed = _FailedType
+
+else:
+    FAILED = object()
+
+
+def _try_load_with_handler[T](
+    value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
+) -> T | Failed:
+    try:
+        return loader._load(value, type_form, type_path)
+    except TressedValueError:
+        return FAILED
+    except TressedError:
+        raise
+    except Exception:
+        # Foreign exceptions are only raised here with top-level error wrapping
+        return FAILED
+
+
+def try_load_identity[T](
+    value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
+) -> T | Failed:
+    if type(value) is type_form:
+        return value
+    return FAILED
+
+
+def try_load_float[T](
+    value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
+) -> T | Failed:
+    type_ = type(value)
+    if type_ is float:
+        return value
+    if type_ is int:
+        return type_form(value)  # type: ignore[call-arg]
+    return FAILED
+
+
+def try_load_literal[T](
+    value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
+) -> T | Failed:
+    if value in get_type_info(type_form).args:
+        return value
+    return FAILED
+
+
+def try_load_optional[T](
+    value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
+) -> T | Failed:
+    if value is None:
+        return value  # type: ignore[return-value]
+    args = [arg for arg in get_type_info(type_form).args if arg is not type(None)]
+    if len(args) != 1:
+        return _try_load_with_handler(value, type_form, type_path, loader)
+    return loader._try_load(value, args[0], type_path)
+
+
+def try_load_union[T](
+    value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
+) -> T | Failed:
+    try_load = loader._try_load
+    for arg in loader._plan(type_form, make_union_plan).arms(value):
+        if (loaded := try_load(value, arg, type_path)) is not FAILED:
+            return loaded
+    return FAILED
+
+
+def try_load_tagged_union[T](
+    value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
+) -> T | Failed:
+    if (
+        type(value) is dict
+        and (plan := loader._plan(type_form, make_inferred_discriminated_union_plan))
+        is not None
+    ):
+        tags: dict[Any, TypeForm] = plan.tags  # type: ignore[assignment]
+        try:
+            matched_type_form = tags.get(value.get(plan.tag_alias, FAILED))
+        except TypeError:
+            matched_type_form = None
+        if matched_type_form is not None and (
+            (loaded := loader._try_load(value, matched_type_form, type_path))
+            is not FAILED
+        ):
+            return loaded
+    return try_load_union(value, type_form, type_path, loader)
+
+
+def try_load_dataclass[T](
+    value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
+) -> T | Failed:
+    """
+    Check the required keys and the literal fields before loading the dataclass.
+    """
+    if (
+        type(value) is dict
+        and (plan := loader._plan(type_form, make_dataclass_trial_plan)) is not None
+    ):
+        for alias in plan.required_aliases:
+            if alias not in value:
+                return FAILED
+        for alias, literal_values in plan.literal_fields:
+            if alias in value and value[alias] not in literal_values:
+                return FAILED
+    return _try_load_with_handler(value, type_form, type_path, loader)
+
+
+def try_load_typeddict[T](
+    value: Any, type_form: TypeForm[T], type_path: TypePath, loader: LoaderProtocol
+) -> T | Failed:
+    """
+    Check the required keys before loading the typed dict.
+    """
+    if type(value) is dict:
+        plan = loader._plan(type_form, make_typeddict_plan)
+        if (required_aliases := plan.required_aliases) is not None:
+            for alias in required_aliases:
+                if alias not in value:
+                    return FAILED
+    return _try_load_with_handler(value, type_form, type_path, loader)
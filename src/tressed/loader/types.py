@@ -5,22 +5,52 @@ if TYPE_CHECKING:
     from collections.abc import Callable
     from typing import Any, Protocol
 
+    from tressed.loader.specializers import Codegen
+    from tressed.loader.trials import Failed
     from tressed.type_form import TypeForm
     from tressed.type_path import TypePath
 
     class LoaderProtocol(Protocol):
+        # Changed whenever handlers or aliases may have changed
+        _version: int
+        # Whether the keys of typed dicts are resolved through the alias resolver
+        _alias_typeddict_keys: bool
+
         def _load[T](
             self, value: Any, type_form: TypeForm[T], type_path: TypePath
         ) -> T: ...
+        def _try_load[T](
+            self, value: Any, type_form: TypeForm[T], type_path: TypePath
+        ) -> T | Failed: ...
         def _resolve_alias[T](
             self, type_form: TypeForm[T], type_path: TypePath, name: str
         ) -> str: ...
+        def _resolve_static_alias[T](
+            self, type_form: TypeForm[T], name: str
+        ) -> str | None: ...
+        def _lookup_handler[T](self, type_form: TypeForm[T]) -> LoaderFn[T] | None: ...
+        def _plan[P](
+            self,
+            type_form: TypeForm,
+            make_plan: Callable[[TypeForm, LoaderProtocol], P],
+        ) -> P: ...
 
     type LoaderFn[T] = Callable[[Any, TypeForm[T], TypePath, LoaderProtocol], T]
-    type TypeLoaderSpecializer[T] = Callable[[TypeForm[T], TypePath], str | None]
+    # Trial functions return FAILED instead of raising if the value cannot be loaded.
+    type TrialLoaderFn[T] = Callable[
+        [Any, TypeForm[T], TypePath, LoaderProtocol], T | Failed
+    ]
+    # Specialized functions get the type path at call time, and no type form.
+    type SpecializedLoaderFn[T] = Callable[[Any, TypePath, LoaderProtocol], T]
+    # Specializers either generate the source of the specialized function, or return it.
+    type TypeLoaderSpecializer[T] = Callable[
+        [TypeForm[T], LoaderProtocol], Codegen | SpecializedLoaderFn[T] | None
+    ]
 
     __all__ += [
         "LoaderProtocol",
         "LoaderFn",
+        "SpecializedLoaderFn",
+        "TrialLoaderFn",
         "TypeLoaderSpecializer",
     ]
@@ -34,6 +34,7 @@ if TYPE_CHECKING:
     from tressed.type_form import TypeForm
 
 __all__ = [
+    "dispatch_on",
     "get_origin",
     "get_args",
     "is_generic_tuple_type",
@@ -67,6 +68,24 @@ if TYPE_CHECKING:
     ]
 
 
+def dispatch_on[P: Callable[..., bool]](*dispatch_keys: object) -> Callable[[P], P]:
+    """
+    Declare the dispatch keys a type predicate can match, see tressed.dispatch.
+
+    A dispatch key is either an object or the qualified name of an object as a string,
+    for example "typing.List". Names are resolved lazily, a name in a module which is not
+    imported can't be part of a type form.
+
+    Predicates without dispatch keys are tried for every type form.
+    """
+
+    def _dispatch_on(type_predicate: P) -> P:
+        setattr(type_predicate, "dispatch_keys", dispatch_keys)
+        return type_predicate
+
+    return _dispatch_on
+
+
 def get_origin(type_form: TypeForm) -> TypeForm | None:
     # Avoid importing typing module if possible.
     # TODO: Handle annotated, generic etc...
@@ -79,6 +98,7 @@ def get_args(type_form: TypeForm) -> tuple[TypeForm, ...] | None:
     return getattr(type_form, "__args__", None)
 
 
+@dispatch_on("builtins.tuple", "typing.Tuple")
 def is_generic_homogeneous_tuple_type(type_form: TypeForm) -> bool:
     """
     The given type form matches tuple[T, ...] or typing.Tuple[T, ...]
@@ -96,6 +116,7 @@ def is_generic_homogeneous_tuple_type(type_form: TypeForm) -> bool:
     return False
 
 
+@dispatch_on("builtins.tuple", "typing.Tuple")
 def is_generic_tuple_type(type_form: TypeForm) -> bool:
     origin = get_origin(type_form)
     if origin is None:
@@ -113,6 +134,7 @@ def is_generic_tuple_type(type_form: TypeForm) -> bool:
     return False
 
 
+@dispatch_on("builtins.list", "typing.List")
 def is_generic_list_type(type_form: TypeForm) -> bool:
     origin = get_origin(type_form)
     if origin is None:
@@ -130,6 +152,7 @@ def is_generic_list_type(type_form: TypeForm) -> bool:
     return False
 
 
+@dispatch_on("builtins.set", "typing.Set")
 def is_generic_set_type(type_form: TypeForm) -> bool:
     origin = get_origin(type_form)
     if origin is None:
@@ -147,6 +170,7 @@ def is_generic_set_type(type_form: TypeForm) -> bool:
     return False
 
 
+@dispatch_on("builtins.frozenset", "typing.FrozenSet")
 def is_generic_frozenset_type(type_form: TypeForm) -> bool:
     origin = get_origin(type_form)
     if origin is None:
@@ -164,6 +188,7 @@ def is_generic_frozenset_type(type_form: TypeForm) -> bool:
     return False
 
 
+@dispatch_on("builtins.type")
 def is_dataclass_type(type_form: TypeForm) -> bool:
     if dataclasses := sys.modules.get("dataclasses"):
         # We want to match only dataclass types, not instances
@@ -173,6 +198,7 @@ def is_dataclass_type(type_form: TypeForm) -> bool:
 
 if sys.version_info >= (3, 10):
 
+    @dispatch_on("typing.NewType")
     def is_newtype(type_form: TypeForm) -> bool:
         if typing := sys.modules.get("typing"):
             return type(type_form) is typing.NewType
@@ -184,6 +210,7 @@ else:
         return hasattr(type_form, "__supertype__")
 
 
+@dispatch_on("builtins.type")
 def is_ipaddress_type(type_form: TypeForm) -> bool:
     if ipaddress := sys.modules.get("ipaddress"):
         return type_form in {
@@ -197,6 +224,7 @@ def is_ipaddress_type(type_form: TypeForm) -> bool:
     return False
 
 
+@dispatch_on("builtins.type")
 def is_typeddict(type_form: TypeForm) -> bool:
     if typing := sys.modules.get("typing"):
         if typing.is_typeddict(type_form):
@@ -207,6 +235,7 @@ def is_typeddict(type_form: TypeForm) -> bool:
     return False
 
 
+@dispatch_on("builtins.dict", "typing.Dict")
 def is_dict_type(type_form: TypeForm) -> bool:
     origin = get_origin(type_form)
     if origin is dict:
@@ -216,6 +245,7 @@ def is_dict_type(type_form: TypeForm) -> bool:
     return False
 
 
+@dispatch_on("builtins.type")
 def is_namedtuple_type(type_form: TypeForm) -> bool:
     if (typing := sys.modules.get("typing")) and (
         orig_bases := getattr(type_form, "__orig_bases__", None)
@@ -224,30 +254,35 @@ def is_namedtuple_type(type_form: TypeForm) -> bool:
     return False
 
 
+@dispatch_on("builtins.type")
 def is_uuid_type(type_form: TypeForm) -> bool:
     if uuid := sys.modules.get("uuid"):
         return type_form is uuid.UUID
     return False
 
 
+@dispatch_on("enum.EnumType")
 def is_enum_type(type_form: TypeForm) -> bool:
     if enum := sys.modules.get("enum"):
         return type(type_form) is enum.EnumType
     return False
 
 
+@dispatch_on("typing.Literal")
 def is_literal_type(type_form: TypeForm) -> bool:
     if typing := sys.modules.get("typing"):
         return get_origin(type_form) is typing.Literal
     return False
 
 
+@dispatch_on("typing.TypeAliasType")
 def is_type_alias_type(type_form: TypeForm) -> bool:
     return hasattr(type_form, "__type_params__") and hasattr(
         type_form, "evaluate_value"
     )
 
 
+@dispatch_on("types.UnionType", "typing.Union", "typing.Optional")
 def is_optional_type(type_form: TypeForm) -> bool:
     """
     One of:
@@ -279,6 +314,7 @@ def is_optional_type(type_form: TypeForm) -> bool:
     return False
 
 
+@dispatch_on("types.UnionType", "typing.Union")
 def is_union_type(type_form: TypeForm) -> bool:
     origin = get_origin(type_form)
     args = get_args(type_form)
@@ -296,16 +332,19 @@ def is_union_type(type_form: TypeForm) -> bool:
     return False
 
 
+@dispatch_on("builtins.type")
 def is_fspath_type(type_form: TypeForm) -> bool:
     return hasattr(type_form, "__fspath__")
 
 
+@dispatch_on("builtins.type")
 def is_datetime_type(type_form: TypeForm) -> bool:
     if datetime := sys.modules.get("datetime"):
         return type_form in frozenset({datetime.datetime, datetime.date, datetime.time})
     return False
 
 
+@dispatch_on("typing.Annotated")
 def is_discriminated_union(type_form: TypeForm) -> bool:
     """
     A discriminated union is a union annotated by one discriminator.
@@ -329,6 +368,7 @@ def is_discriminated_union(type_form: TypeForm) -> bool:
     return False
 
 
+@dispatch_on("builtins.type")
 def is_re_pattern_type(type_form: TypeForm) -> bool:
     """
     Check if the type form is a compiled regular expression pattern (re.Pattern).
@@ -27,15 +27,13 @@ def type_form_repr(type_form: TypeForm) -> str:
             # C[T1=V1, .., Tn=?]
             params = []
 
-            if args := get_args(type_form):
-                num_args = len(args)
-                for i, arg in enumerate(args):
-                    params.append(
-                        f"{type_form_repr(type_params[i])}={type_form_repr(arg)}"
-                    )
-            else:
-                num_args = 0
-            for type_param in type_params[num_args:]:
+            type_args = get_args(type_form) or ()
+            for type_param, arg in zip(type_params, type_args):
+                params.append(f"{type_form_repr(type_param)}={type_form_repr(arg)}")
+            # Arguments in excess, which the type alias fails to evaluate with
+            for arg in type_args[len(type_params) :]:
+                params.append(type_form_repr(arg))
+            for type_param in type_params[len(type_args) :]:
                 params.append(f"{type_form_repr(type_param)}=?")
             return f"{name}[{', '.join(params)}]"
 
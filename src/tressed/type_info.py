@@ -0,0 +1,202 @@
+"""
+Normalized representation of type forms.
+
+Type forms are introspected once and the result is cached, so that handlers do not
+have to repeatedly probe `__origin__`, `__args__`, `__metadata__`, `__supertype__` or
+evaluate type aliases.
+
+The cache is bounded, and does not hold classes which are cheap to introspect, so that
+dynamically created classes can be garbage collected.
+"""
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Final, Literal
+
+    from tressed.type_form import TypeForm
+
+__all__ = [
+    "TypeInfo",
+    "get_type_info",
+    "evaluate_type_alias",
+    "clear_type_info_cache",
+    "set_type_info_cache_size",
+]
+
+if TYPE_CHECKING:
+    type TypeKind = Literal[
+        "class",
+        "generic",
+        "union",
+        "literal",
+        "annotated",
+        "newtype",
+        "type_alias",
+        "other",
+    ]
+
+    __all__ += ["TypeKind"]
+
+
+class TypeInfo:
+    __slots__ = (
+        "type_form",
+        "kind",
+        "origin",
+        "args",
+        "metadata",
+        "inner",
+        "supertype",
+        "dispatch_keys",
+    )
+
+    def __init__(
+        self,
+        type_form: TypeForm,
+        kind: TypeKind,
+        origin: Any,
+        args: tuple[Any, ...],
+        metadata: tuple[Any, ...],
+        inner: TypeForm | None,
+        supertype: TypeForm | None,
+        dispatch_keys: tuple[object, ...],
+    ) -> None:
+        self.type_form: Final = type_form
+        self.kind: Final = kind
+        # The origin of generic type forms, for example list for list[int]
+        self.origin: Final = origin
+        # The arguments of generic type forms, empty if none
+        self.args: Final = args
+        # The metadata of annotated type forms, empty if none
+        self.metadata: Final = metadata
+        # The type form this type form stands for:
+        # - annotated: The annotated type form.
+        # - newtype: The first supertype which is not a NewType.
+        # - type_alias: The evaluated type alias value, with the type parameters substituted.
+        #   None if the type alias has unbound type parameters.
+        self.inner: Final = inner
+        # The direct supertype of NewTypes, which may be a NewType, None otherwise.
+        # Loading goes through each NewType of the chain, as they may have handlers.
+        self.supertype: Final = supertype
+        # See tressed.dispatch.get_dispatch_keys
+        self.dispatch_keys: Final = dispatch_keys
+
+    def __repr__(self) -> str:
+        from tressed.type_form import type_form_repr
+
+        return (
+            f"{self.__class__.__name__}("
+            f"{type_form_repr(self.type_form)}, kind={self.kind!r})"
+        )
+
+
+def _make_type_info(type_form: TypeForm) -> TypeInfo:
+    from tressed.dispatch import get_dispatch_keys
+    from tressed.predicates import (
+        is_literal_type,
+        is_newtype,
+        is_type_alias_type,
+        is_union_type,
+    )
+
+    origin = getattr(type_form, "__origin__", None)
+    args = getattr(type_form, "__args__", None) or ()
+    metadata: tuple[Any, ...] = ()
+    inner = None
+    supertype = None
+
+    kind: TypeKind
+    if (type_metadata := getattr(type_form, "__metadata__", None)) is not None:
+        kind = "annotated"
+        metadata = tuple(type_metadata)
+        inner = origin
+        origin = None
+    elif isinstance(type_form, type):
+        kind = "class"
+    elif is_newtype(type_form):
+        kind = "newtype"
+        inner = supertype = type_form.__supertype__
+        while is_newtype(inner):
+            inner = inner.__supertype__
+    elif is_type_alias_type(type_form):
+        kind = "type_alias"
+        try:
+            inner = evaluate_type_alias(type_form)
+        except Exception:
+            # Dispatching does not need the value, loading reports the error, see
+            # tressed.loader.plans.make_type_alias_plan.
+            inner = None
+    elif is_union_type(type_form):
+        kind = "union"
+    elif is_literal_type(type_form):
+        kind = "literal"
+    elif origin is not None:
+        kind = "generic"
+    else:
+        kind = "other"
+
+    return TypeInfo(
+        type_form,
+        kind,
+        origin,
+        tuple(args),
+        metadata,
+        inner,
+        supertype,
+        get_dispatch_keys(type_form),
+    )
+
+
+def evaluate_type_alias(type_form: TypeForm) -> TypeForm | None:
+    """
+    Evaluate the value of the given type alias, with its type parameters substituted.
+
+    None if the type alias has unbound type parameters, and raises if evaluating it
+    fails, for example on undefined names.
+    """
+    inner = type_form.evaluate_value()
+    if (num_params := len(type_form.__type_params__)) > 0:
+        if len(args := getattr(type_form, "__args__", None) or ()) < num_params:
+            return None
+        inner = inner[*args]
+    return inner
+
+
+_type_infos: dict[TypeForm, TypeInfo] = {}
+_max_type_infos: int | None = 4096
+
+
+def get_type_info(type_form: TypeForm) -> TypeInfo:
+    """
+    Get the normalized representation of the given type form, computed once per type form.
+    """
+    if (type_info := _type_infos.get(type_form)) is None:
+        type_info = _make_type_info(type_form)
+        if type_info.kind != "class" and (max_size := _max_type_infos) != 0:
+            if max_size is not None:
+                _evict_type_infos(max_size - 1)
+            _type_infos[type_form] = type_info
+    return type_info
+
+
+def _evict_type_infos(max_size: int) -> None:
+    while _type_infos and len(_type_infos) > max_size:
+        # Evict the oldest entry
+        del _type_infos[next(iter(_type_infos))]
+
+
+def clear_type_info_cache() -> None:
+    _type_infos.clear()
+
+
+def set_type_info_cache_size(max_size: int | None) -> None:
+    """
+    Set the maximum number of type infos cached, None for unbounded.
+
+    The cache is shared by all loaders and dumpers, it is not bounded by their
+    max_cache_size.
+    """
+    global _max_type_infos
+    _max_type_infos = max_size
+    if max_size is not None:
+        _evict_type_infos(max_size)
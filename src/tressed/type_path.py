@@ -1,12 +1,118 @@
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import Any, SupportsIndex
+
 __all__ = [
     "TypePathItem",
     "TypePath",
+    "TypePathNode",
     "type_path_repr",
+    "materialize_type_path",
 ]
 
 type TypePathItem = str | int
 type TypePath = tuple[TypePathItem, ...]
 
 
+class TypePathNode(tuple):
+    """
+    Type path extended lazily by one item, created with TypePathNode((parent, item)).
+
+    Extending a type path tuple copies it, which is O(depth) for every loaded or dumped
+    value, while the type path is only needed on errors or by path-aware alias functions.
+    A node only links to its parent path, and behaves as the materialized type path
+    when iterated, indexed, compared or hashed.
+
+    Nodes are tuple subclasses holding the (parent, item) pair, so that they are created
+    without running any python code.
+    """
+
+    __slots__ = ()
+
+    def materialize(self) -> TypePath:
+        items = []
+        type_path: TypePath = self
+        while type(type_path) is TypePathNode:
+            type_path, item = tuple.__iter__(type_path)
+            items.append(item)
+        items.reverse()
+        return (*type_path, *items)
+
+    def __iter__(self) -> Iterator[TypePathItem]:
+        return iter(self.materialize())
+
+    def __reversed__(self) -> Iterator[TypePathItem]:
+        return reversed(self.materialize())
+
+    def __len__(self) -> int:
+        size = 0
+        type_path: TypePath = self
+        while type(type_path) is TypePathNode:
+            type_path = tuple.__getitem__(type_path, 0)
+            size += 1
+        return size + len(type_path)
+
+    def __getitem__(self, index: SupportsIndex | slice) -> Any:
+        return self.materialize()[index]
+
+    def __contains__(self, item: object) -> bool:
+        return item in self.materialize()
+
+    def __add__(self, other: tuple[Any, ...]) -> tuple[Any, ...]:
+        return self.materialize() + other
+
+    def __radd__(self, other: tuple[Any, ...]) -> tuple[Any, ...]:
+        return other + self.materialize()
+
+    def __mul__(self, count: SupportsIndex) -> tuple[Any, ...]:
+        return self.materialize() * count
+
+    def __rmul__(self, count: SupportsIndex) -> tuple[Any, ...]:
+        return count * self.materialize()
+
+    def __eq__(self, other: object) -> bool:
+        return self.materialize() == other
+
+    def __ne__(self, other: object) -> bool:
+        return self.materialize() != other
+
+    def __lt__(self, other: tuple[Any, ...]) -> bool:
+        return self.materialize() < other
+
+    def __le__(self, other: tuple[Any, ...]) -> bool:
+        return self.materialize() <= other
+
+    def __gt__(self, other: tuple[Any, ...]) -> bool:
+        return self.materialize() > other
+
+    def __ge__(self, other: tuple[Any, ...]) -> bool:
+        return self.materialize() >= other
+
+    def __hash__(self) -> int:
+        return hash(self.materialize())
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (tuple, (self.materialize(),))
+
+    def __repr__(self) -> str:
+        return repr(self.materialize())
+
+    def count(self, value: Any) -> int:
+        return self.materialize().count(value)
+
+    def index(self, value: Any, *args: Any) -> int:
+        return self.materialize().index(value, *args)
+
+
+def materialize_type_path(type_path: TypePath) -> TypePath:
+    """
+    Get the type path as a plain tuple.
+    """
+    if type(type_path) is TypePathNode:
+        return type_path.materialize()
+    return type_path
+
+
 def type_path_repr(type_path: TypePath) -> str:
     return f".{'.'.join(map(str, type_path))}"
@@ -91,8 +91,40 @@ def test_alias_resolver_caching_enabled() -> None:
     assert alias_resolver.resolve("foo", int, ("abc", 1)) == "1"
     assert alias_resolver.resolve("foo", str, ("abc", 1)) == "2"
     assert alias_resolver.resolve("foo", str, ("abc", 1)) == "2"
-    assert alias_resolver.resolve("foo", str, ("abc", 2)) == "3"
-    assert alias_resolver.resolve("foo", str, ("abc", 2)) == "3"
+    # The alias function ignores the type path, the alias is shared between paths
+    assert alias_resolver.resolve("foo", str, ("abc", 2)) == "2"
+    assert alias_resolver.resolve("bar", str, ("abc", 2)) == "3"
+    assert alias_resolver._cache == {
+        (int, "foo"): "1",
+        (str, "foo"): "2",
+        (str, "bar"): "3",
+    }
+
+
+def test_alias_resolver_caching_path_aware() -> None:
+    from tressed.alias import AliasResolver
+    from tressed.type_form import TypeForm
+    from tressed.type_path import TypePath
+
+    count = 0
+
+    def count_alias(name: str, type_form: TypeForm, type_path: TypePath) -> str:
+        nonlocal count
+        count += 1
+        return str(count)
+
+    alias_resolver = AliasResolver(alias_fn=count_alias, max_cache_size=2)
+    assert alias_resolver.resolve("foo", str, ("abc", 1)) == "1"
+    assert alias_resolver.resolve("foo", str, ("abc", 2)) == "2"
+    assert alias_resolver.resolve("foo", str, ("abc", 1)) == "1"
+
+    # Least recently used entry is evicted
+    assert alias_resolver.resolve("foo", str, ("abc", 3)) == "3"
+    assert list(alias_resolver._cache) == [
+        ("foo", str, ("abc", 1)),
+        ("foo", str, ("abc", 3)),
+    ]
+    assert alias_resolver.resolve("foo", str, ("abc", 2)) == "4"
 
 
 def test_alias_resolver_caching_disabled() -> None:
@@ -137,3 +169,37 @@ def test_method_descriptor_alias_fn() -> None:
 
     alias_resolver = AliasResolver(alias_fn=str.title)
     assert alias_resolver.resolve("foobar", int, ()) == "Foobar"
+
+
+def test_is_path_aware_alias_fn() -> None:
+    from tressed.alias import compose_alias_fn, make_maybe_dataclass_alias_fn, to_camel
+    from tressed.alias.functions import is_path_aware_alias_fn
+
+    assert not is_path_aware_alias_fn(to_camel)
+    assert not is_path_aware_alias_fn(str.upper)
+    assert not is_path_aware_alias_fn(lambda name, type_form: name)
+    assert is_path_aware_alias_fn(lambda name, type_form, type_path: name)
+
+    maybe_dataclass_alias_fn = make_maybe_dataclass_alias_fn("alias")
+    assert not is_path_aware_alias_fn(
+        compose_alias_fn(maybe_dataclass_alias_fn, default_alias_fn=to_camel)
+    )
+    assert is_path_aware_alias_fn(
+        compose_alias_fn(
+            maybe_dataclass_alias_fn,
+            default_alias_fn=lambda name, type_form, type_path: name,
+        )
+    )
+
+
+def test_alias_resolver_resolve_static() -> None:
+    from tressed.alias import AliasResolver
+
+    alias_resolver = AliasResolver(alias_fn=str.upper)
+    assert alias_resolver.resolve_static("foo", int) == "FOO"
+
+    alias_resolver = AliasResolver(alias_fn=str.upper, cache_resolved_aliases=False)
+    assert alias_resolver.resolve_static("foo", int) is None
+
+    alias_resolver = AliasResolver(alias_fn=lambda name, type_form, type_path: name)
+    assert alias_resolver.resolve_static("foo", int) is None
@@ -0,0 +1,59 @@
+def test_type_form_cache() -> None:
+    from tressed.cache import TypeFormCache
+
+    class SomeClass:
+        pass
+
+    cache: TypeFormCache[str] = TypeFormCache()
+    cache.add(SomeClass, "some class")
+    cache.add(list[int], "list of int")
+    cache.add(int | None, "optional int")
+
+    assert len(cache) == 3
+    assert cache.get(SomeClass) == "some class"
+    assert cache.get(list[int]) == "list of int"
+    assert cache.get(int | None) == "optional int"
+    assert cache.get(list[str]) is None
+    assert cache.get("SomeClass") is None
+    assert cache.get(None) is None
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get(SomeClass) is None
+
+
+def test_type_form_cache_weak_classes() -> None:
+    import gc
+
+    from tressed.cache import TypeFormCache
+
+    cache: TypeFormCache[str] = TypeFormCache()
+    cache.add(type("SomeClass", (), {}), "some class")
+    cache.add(tuple[int, ...], "tuple of int")
+    gc.collect()
+
+    assert len(cache) == 1
+    assert cache.get(tuple[int, ...]) == "tuple of int"
+
+
+def test_type_form_cache_max_size() -> None:
+    from tressed.cache import TypeFormCache
+
+    classes = [type(f"SomeClass{i}", (), {}) for i in range(3)]
+
+    cache: TypeFormCache[int] = TypeFormCache(max_size=2)
+    for i, cls in enumerate(classes):
+        cache.add(cls, i)
+    cache.add(list[int], 3)
+
+    assert len(cache) == 2
+    assert [cache.get(cls) for cls in classes] == [None, None, 2]
+    assert cache.get(list[int]) == 3
+    assert sorted(cache.items(), key=lambda item: item[1]) == [
+        (classes[2], 2),
+        (list[int], 3),
+    ]
+
+    cache = TypeFormCache(max_size=0)
+    cache.add(int, 0)
+    assert len(cache) == 0
@@ -0,0 +1,114 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+MODELS = """\
+from dataclasses import dataclass, field
+from enum import Enum
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclass
+class Item:
+    sku: str
+    quantity: int = 1
+    color: Color = Color.RED
+    tags: list[str] = field(default_factory=list)
+    sizes: dict[str, float] = field(default_factory=lambda: {"default": 1.0})
+
+
+@dataclass
+class Order:
+    order_id: int
+    items: list[Item]
+    main_item: Item
+
+
+type Orders = list[Order]
+"""
+
+
+@pytest.fixture
+def models_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    import importlib
+
+    (tmp_path / "compiled_models.py").write_text(MODELS)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield importlib.import_module("compiled_models")
+    for name in ("compiled_models", "compiled_handlers"):
+        sys.modules.pop(name, None)
+
+
+def test_compile_module(tmp_path: Path, models_module) -> None:
+    import importlib
+
+    from tressed import Dumper, Loader
+    from tressed.alias import to_camel
+    from tressed.compiler import compile_module
+
+    source = compile_module(
+        [models_module.Item, models_module.Order, models_module.Orders],
+        alias_fn=to_camel,
+    )
+    # Objects are imported, including default factory lambdas
+    assert "import compiled_models\n" in source
+    assert (
+        "compiled_models.Item.__dataclass_fields__['sizes'].default_factory" in source
+    )
+    # Nested compiled dataclasses call each other directly
+    assert "_load_Item = load_Item\n" in source
+
+    (tmp_path / "compiled_handlers.py").write_text(source)
+    compiled = importlib.import_module("compiled_handlers")
+    assert compiled.loaders.keys() == {
+        models_module.Item,
+        models_module.Order,
+        models_module.Orders,
+    }
+    assert compiled.dumpers.keys() == {models_module.Item, models_module.Order}
+
+    loader = Loader(alias_fn=to_camel, extra_type_handlers=compiled.loaders)
+    generic_loader = Loader(alias_fn=to_camel)
+    value = [
+        {
+            "orderId": i,
+            "items": [{"sku": "a", "quantity": 2, "color": "blue", "tags": ["x"]}],
+            "mainItem": {"sku": "b", "sizes": {"small": 2}},
+        }
+        for i in range(3)
+    ]
+    loaded = loader.load(value, models_module.Orders)
+    assert loaded == generic_loader.load(value, list[models_module.Order])
+    assert loaded[0].main_item.sizes == {"small": 2.0}
+
+    dumper = Dumper(alias_fn=to_camel, extra_type_handlers=compiled.dumpers)
+    generic_dumper = Dumper(alias_fn=to_camel)
+    for hide_defaults in (False, True):
+        dumper.hide_defaults = generic_dumper.hide_defaults = hide_defaults
+        assert dumper.dump(loaded) == generic_dumper.dump(loaded)
+
+
+def test_compile_module_unsupported(models_module) -> None:
+    from tressed.compiler import compile_module
+
+    with pytest.raises(ValueError, match="Cannot compile a loader for <class 'int'>"):
+        compile_module([int])
+
+
+def test_main_compile(tmp_path: Path, models_module) -> None:
+    from tressed.__main__ import main
+
+    output = tmp_path / "compiled_handlers.py"
+    assert main(["compile", "compiled_models:Order", "-o", str(output)]) == 0
+    source = output.read_text()
+    assert "Generated with: python -m tressed compile compiled_models:Order" in source
+    assert "def load_Order(value, type_form, type_path, loader):" in source
+    assert "def dump_Order(value, type_path, dumper):" in source
+
+    with pytest.raises(SystemExit):
+        main(["compile", "compiled_models.Order"])
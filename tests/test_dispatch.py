@@ -0,0 +1,87 @@
+from tressed.dispatch import DispatchIndex, get_dispatch_keys
+from tressed.predicates import (
+    dispatch_on,
+    is_dataclass_type,
+    is_generic_list_type,
+    is_generic_set_type,
+    is_literal_type,
+)
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from tressed import TypeForm
+
+
+def test_get_dispatch_keys() -> None:
+    import types
+    import typing
+
+    assert get_dispatch_keys(int) == (type, type)
+    assert get_dispatch_keys(list[int]) == (types.GenericAlias, list)
+    assert get_dispatch_keys(typing.List[int]) == (type(typing.List[int]), list)
+
+    literal = typing.Literal[1, 2]
+    assert get_dispatch_keys(literal) == (
+        type(literal),
+        typing.Literal,
+        type(typing.Literal),
+    )
+
+    annotated = typing.Annotated[int, "metadata"]
+    assert get_dispatch_keys(annotated) == (type(annotated), typing.Annotated)
+
+
+def test_dispatch_index() -> None:
+    from typing import Literal
+
+    def is_anything(type_form: TypeForm) -> bool:
+        return type_form is bool
+
+    @dispatch_on(frozenset)
+    def is_frozenset_anything(type_form: TypeForm) -> bool:
+        return True
+
+    index = DispatchIndex(
+        {
+            is_generic_list_type: "list",
+            is_anything: "anything",
+            is_generic_set_type: "set",
+            is_frozenset_anything: "frozenset",
+            is_literal_type: "literal",
+            is_dataclass_type: "dataclass",
+        }
+    )
+
+    assert index.lookup(list[int]) == "list"
+    assert index.lookup(set[int]) == "set"
+    assert index.lookup(frozenset[int]) == "frozenset"
+    assert index.lookup(Literal["foo"]) == "literal"
+    assert index.lookup(bool) == "anything"
+    assert index.lookup(int) is None
+    assert index.lookup(dict[str, int]) is None
+
+    # Predicates without dispatch keys are candidates for all type forms, in order
+    assert index.candidates(get_dispatch_keys(list[int])) == (
+        (is_generic_list_type, "list"),
+        (is_anything, "anything"),
+    )
+    assert index.candidates(get_dispatch_keys(int)) == (
+        (is_anything, "anything"),
+        (is_dataclass_type, "dataclass"),
+    )
+
+
+def test_dispatch_index_max_size() -> None:
+    index = DispatchIndex(
+        {is_generic_list_type: "list", is_generic_set_type: "set"}, max_size=1
+    )
+
+    assert index.lookup(list[int]) == "list"
+    assert index.lookup(set[int]) == "set"
+    assert list(index._candidates) == [get_dispatch_keys(set[int])]
+    assert index.lookup(list[int]) == "list"
+    assert list(index._candidates) == [get_dispatch_keys(list[int])]
+
+    index = DispatchIndex({is_generic_list_type: "list"}, max_size=0)
+    assert index.lookup(list[int]) == "list"
+    assert not index._candidates
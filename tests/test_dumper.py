@@ -1,7 +1,7 @@
 import pytest
 
 from tressed.dumper import Dumper
-from tressed.exceptions import TressedTypeError
+from tressed.exceptions import TressedTypeError, TressedValueError
 
 
 def test_dump_basic_types() -> None:
@@ -143,6 +143,23 @@ def test_dump_dataclass() -> None:
     }
 
 
+def test_dump_dataclass_hide_empty_default_factories() -> None:
+    from dataclasses import dataclass, field
+
+    @dataclass
+    class SomeDataclass:
+        tags: list[str] = field(default_factory=list)
+        scores: dict[str, int] = field(default_factory=dict)
+        ids: set[int] = field(default_factory=set)
+
+    dumper = Dumper(hide_defaults=True)
+    assert dumper.dump(SomeDataclass()) == {}
+    assert dumper.dump(SomeDataclass(tags=["foo"], ids={1})) == {
+        "tags": ["foo"],
+        "ids": [1],
+    }
+
+
 def test_dump_namedtuple() -> None:
     from typing import NamedTuple
 
@@ -220,6 +237,25 @@ def test_barebones_dumper() -> None:
     assert str(exc_info.value) == "Unhandled type str at path . for value 'foo'"
 
 
+def test_dump_top_level_error_wrapping() -> None:
+    class Unprintable:
+        def __str__(self) -> str:
+            raise RuntimeError("unprintable")
+
+    def _is_unprintable(type_form: type) -> bool:
+        return type_form is Unprintable
+
+    for top_level_error_wrapping in (False, True):
+        dumper = Dumper(
+            extra_type_mappers={_is_unprintable: lambda v, _, __: str(v)},
+            top_level_error_wrapping=top_level_error_wrapping,
+        )
+        with pytest.raises(TressedValueError) as exc_info:
+            dumper.dump({"foo": [1, Unprintable()]})
+        assert exc_info.value.type_path == ("foo", 1)
+        assert exc_info.value.type_form is Unprintable
+
+
 def test_dump_path() -> None:
     from pathlib import Path
 
@@ -234,3 +270,63 @@ def test_dump_path() -> None:
             return "/".join(["foo"] * self.value)
 
     assert dumper.dump(CustomPath(3)) == "foo/foo/foo"
+
+
+def test_dump_dataclass_specialization() -> None:
+    from dataclasses import dataclass, field
+
+    from tressed.alias import to_camel
+    from tressed.dumper.specializer import SpecializingDumper
+    from tressed.loader.specializer import SpecializationPolicy
+
+    @dataclass
+    class Inner:
+        some_value: float
+        some_tags: list[str] = field(default_factory=list)
+
+    @dataclass
+    class Outer:
+        some_name: str
+        inner: Inner
+        some_items: list[int] = field(default_factory=lambda: [1, 2])
+        some_flag: bool | None = None
+
+    for specialization_backend in ("exec", "closure"):
+        dumper = Dumper(
+            alias_fn=to_camel,
+            specialization_policy=SpecializationPolicy("eager"),
+            specialization_backend=specialization_backend,
+        )
+        generic_dumper = Dumper(alias_fn=to_camel)
+        values = [
+            Outer("foo", Inner(1.5)),
+            Outer("bar", Inner(2, ["a"]), [3], some_flag=True),
+        ]
+        for _ in range(2):
+            for value in values:
+                assert dumper.dump(value) == generic_dumper.dump(value)
+            dumper.hide_defaults = generic_dumper.hide_defaults = True
+        assert dumper.dump(values[0]) == {
+            "someName": "foo",
+            "inner": {"someValue": 1.5},
+        }
+
+        (specializing_dumper,) = {
+            type_dumper
+            for type_dumper in dumper._type_mappers.values()
+            if isinstance(type_dumper, SpecializingDumper)
+        }
+        assert {type_ for type_, _ in specializing_dumper._specializations.items()} == {
+            Outer,
+            Inner,
+        }
+
+        # Errors are the same as without specialization
+        invalid = Outer("foo", Inner(1.5, [object()]))  # type: ignore[list-item]
+        errors = []
+        for dumper_ in (dumper, generic_dumper):
+            with pytest.raises(TressedValueError) as exc_info:
+                dumper_.dump(invalid)
+            errors.append(str(exc_info.value))
+        assert errors[0] == errors[1]
+        assert "at path .inner.someTags " in errors[0]
@@ -19,6 +19,11 @@ if TYPE_CHECKING:
     from tressed import TypeForm, TypePath
     from tressed.loader import LoaderProtocol
 
+# Recursive type aliases have to be defined at module scope for type checkers.
+type Tree = int | list[Tree]
+type Loop = OtherLoop  # type: ignore[misc]
+type OtherLoop = Loop  # type: ignore[misc]
+
 
 def test_load_identity() -> None:
     loader = Loader()
@@ -186,6 +191,21 @@ def test_load_newtype() -> None:
     assert loaded == T(123)
 
 
+def test_load_newtype_chain() -> None:
+    UserId = NewType("UserId", int)
+    AdminId = NewType("AdminId", UserId)
+
+    # Handlers of intermediate NewTypes are used
+    loader = Loader(
+        extra_type_handlers={
+            UserId: lambda value, type_form, type_path, loader: int(value) * 100
+        }
+    )
+    assert loader.load("3", AdminId) == 300
+    assert loader.load("3", UserId) == 300
+    assert Loader().load(3, AdminId) == 3
+
+
 def test_load_ipaddress() -> None:
     import ipaddress
 
@@ -362,10 +382,10 @@ def test_load_dataclass(mocker: MockerFixture) -> None:
     assert loader.load(value, SomeDataclass) == expected
 
     assert loader._alias_resolver._cache == {
-        ("foo", SomeDataclass, ()): "foo",
-        ("bar", SomeDataclass, ()): "bar",
-        ("baz", SomeDataclass, ()): "baz",
-        ("bar_bar", SomeDataclass, ()): "barBar",
+        (SomeDataclass, "foo"): "foo",
+        (SomeDataclass, "bar"): "bar",
+        (SomeDataclass, "baz"): "baz",
+        (SomeDataclass, "bar_bar"): "barBar",
     }
 
 
@@ -471,12 +491,142 @@ def test_load_dataclass_alias_fn(mocker: MockerFixture) -> None:
     loader = Loader(alias_fn=to_camel)
     assert loader.load(value, SomeDataclass) == expected
     assert loader._alias_resolver._cache == {
-        ("foo_foo", SomeDataclass, ()): "fooFoo",
-        ("baz_baz", SomeDataclass, ()): "bazBaz",
-        ("bar_bar", SomeDataclass, ()): "BAR_BAR",
+        (SomeDataclass, "foo_foo"): "fooFoo",
+        (SomeDataclass, "baz_baz"): "bazBaz",
+        (SomeDataclass, "bar_bar"): "BAR_BAR",
     }
 
 
+def test_load_dataclass_plan(mocker: MockerFixture) -> None:
+    import typing
+    from dataclasses import dataclass, field
+
+    from tressed.loader.plans import make_dataclass_plan
+
+    @dataclass
+    class SomeDataclass:
+        foo: int
+        bar: str = field(default="bar", metadata={"alias": "BAR"})
+        baz: list[int] = field(default_factory=list, init=False)
+
+    get_type_hints = mocker.spy(typing, "get_type_hints")
+
+    loader = Loader()
+    assert loader.load(
+        [{"foo": i, "BAR": str(i)} for i in range(10)], list[SomeDataclass]
+    ) == [SomeDataclass(foo=i, bar=str(i)) for i in range(10)]
+    assert get_type_hints.call_count == 1
+
+    ((_, plan),) = loader._plans[make_dataclass_plan].items()
+    assert plan is loader._plan(SomeDataclass, make_dataclass_plan)
+    assert [(field.name, field.alias, field.type_form) for field in plan] == [
+        ("foo", "foo", int),
+        ("bar", "BAR", str),
+    ]
+
+    with pytest.raises(TressedValueError) as exc_info:
+        loader.load([{"foo": 1}, {"foo": "1"}], list[SomeDataclass])
+    assert str(exc_info.value) == (
+        "Failed to load value of type str at path .1.foo into type form int"
+    )
+
+
+def test_loader_caches() -> None:
+    import weakref
+    from dataclasses import make_dataclass
+
+    loader = Loader(max_cache_size=1)
+
+    def load_dynamic_dataclass(name: str) -> weakref.ref[type]:
+        SomeDataclass = make_dataclass(name, [("foo", int)])
+        assert loader.load({"foo": 1}, SomeDataclass) == SomeDataclass(foo=1)
+        assert loader._handler_cache.get(SomeDataclass) is not None
+        return weakref.ref(SomeDataclass)
+
+    refs = [load_dynamic_dataclass(f"SomeDataclass{i}") for i in range(3)]
+    gc.collect()
+    # Only the last dataclass is still referenced by the alias caches.
+    assert [ref() is None for ref in refs] == [True, True, False]
+
+    loader.clear_caches()
+    gc.collect()
+    assert refs[-1]() is None
+
+    assert loader.load([1, 2], list[int]) == [1, 2]
+    assert loader.load({"foo": [1]}, dict[str, list[int]]) == {"foo": [1]}
+    assert len(loader._handler_cache) == 1
+
+
+def test_loader_compile() -> None:
+    from dataclasses import dataclass
+
+    @dataclass
+    class Point:
+        x: int
+        y: int
+
+    @dataclass
+    class Shape:
+        name: str
+        points: list[Point]
+
+    loader = Loader()
+    load_shape = loader.compile(Shape)
+
+    # Everything is resolved when compiling, loading does not add any cache entry.
+    num_handlers = len(loader._handler_cache)
+    num_plans = sum(map(len, loader._plans.values()))
+    assert loader._handler_cache.get(list[Point]) is not None
+    assert loader._handler_cache.get(Point) is not None
+    assert num_plans == 2
+
+    assert load_shape(
+        {"name": "line", "points": [{"x": 0, "y": 0}, {"x": 1, "y": 1}]}
+    ) == Shape("line", [Point(0, 0), Point(1, 1)])
+    assert len(loader._handler_cache) == num_handlers
+    assert sum(map(len, loader._plans.values())) == num_plans
+
+    with pytest.raises(TressedValueError) as exc_info:
+        load_shape({"name": "line", "points": [{"x": 0, "y": "0"}]})
+    assert str(exc_info.value) == (
+        "Failed to load value of type str at path .points.0.y into type form int"
+    )
+
+    load_int = Loader(top_level_error_wrapping=True).compile(int)
+    assert load_int(1) == 1
+    with pytest.raises(TressedValueError):
+        load_int("1")
+
+
+def test_loader_compile_unhandled() -> None:
+    from tressed.exceptions import TressedTypeFormError
+
+    class Opaque:
+        pass
+
+    with pytest.raises(TressedTypeFormError) as exc_info:
+        Loader().compile(Opaque)
+    assert exc_info.value.type_form is Opaque
+
+
+def test_loader_compile_handler_changes() -> None:
+    def load_int_str(value, type_form, type_path, loader):
+        return int(value)
+
+    loader = Loader(enable_specialization=True)
+    load_int = loader.compile(int)
+    load_ints = loader.compile(list[int])
+    with pytest.raises(TressedValueError):
+        load_int("1")
+    with pytest.raises(TressedValueError):
+        load_ints(["1"])
+
+    # Compiled functions do not keep stale handlers nor specializations
+    loader.add_type_handlers({int: load_int_str})
+    assert load_int("1") == 1
+    assert load_ints(["1", 2]) == [1, 2]
+
+
 def test_load_dict() -> None:
     loader = Loader()
 
@@ -501,6 +651,24 @@ def test_load_legacy_dict() -> None:
     }
 
 
+def test_load_dict_str_keys() -> None:
+    def load_upper(value, type_form, type_path, loader):
+        return value.upper()
+
+    loader = Loader()
+    assert loader.load({"foo": 1.0, "bar": 2}, dict[str, float]) == {
+        "foo": 1.0,
+        "bar": 2.0,
+    }
+    with pytest.raises(TressedValueError) as exc_info:
+        loader.load({"foo": 1.0, 2: 2.0}, dict[str, float])
+    assert exc_info.value.type_path == (2,)
+
+    # Registered string handlers still apply to keys
+    loader = Loader(extra_type_handlers={str: load_upper})
+    assert loader.load({"foo": 1.0}, dict[str, float]) == {"FOO": 1.0}
+
+
 def test_load_typeddict() -> None:
     from typing import TypedDict
 
@@ -569,6 +737,56 @@ def test_load_typeddict_extra_items() -> None:
     assert loaded == {"foo": 123, "bar": "bar", "buz": "BUZ", "baz": "BAZ"}
 
 
+def test_load_typeddict_item_values() -> None:
+    from typing import NotRequired, TypedDict
+
+    from tressed.alias import to_camel
+    from tressed.loader.plans import make_typeddict_plan
+
+    class SomeTypedDict(TypedDict):
+        foo_bar: tuple[int, float]
+        baz: NotRequired[list[complex]]
+
+    loader = Loader(alias_fn=to_camel, alias_typeddict_keys=True)
+    loaded = loader.load({"fooBar": [1, 2], "baz": [[3, 4]]}, SomeTypedDict)
+    assert_type(loaded, SomeTypedDict)
+    assert loaded == {"foo_bar": (1, 2.0), "baz": [complex(3, 4)]}
+    assert type(loaded["foo_bar"][1]) is float
+
+    plan = loader._plan(SomeTypedDict, make_typeddict_plan)
+    assert plan is loader._plan(SomeTypedDict, make_typeddict_plan)
+    assert plan.required_aliases == frozenset({"fooBar"})
+
+    with pytest.raises(TressedValueError) as exc_info:
+        loader.load({"fooBar": [1, "two"]}, SomeTypedDict)
+    assert exc_info.value.type_path == ("fooBar", 1)
+
+    with pytest.raises(TressedValueError, match="missing required keys 'fooBar'"):
+        loader.load({"foo_bar": [1, 2]}, SomeTypedDict)
+
+
+def test_load_typeddict_keys_as_dumped() -> None:
+    from typing import TypedDict
+
+    from tressed.alias import to_camel
+    from tressed.dumper import Dumper
+
+    class SomeTypedDict(TypedDict):
+        foo_bar: int
+
+    # Typed dicts are plain dicts once loaded, dumped with their keys as is, so their
+    # keys are only aliased on demand.
+    value: SomeTypedDict = {"foo_bar": 1}
+    dumped = Dumper(alias_fn=to_camel).dump(value)
+    assert dumped == {"foo_bar": 1}
+    assert Loader(alias_fn=to_camel).load(dumped, SomeTypedDict) == value
+
+    loader = Loader(alias_fn=to_camel, alias_typeddict_keys=True)
+    assert loader.load({"fooBar": 1}, SomeTypedDict) == value
+    with pytest.raises(TressedValueError, match="missing required keys 'fooBar'"):
+        loader.load(dumped, SomeTypedDict)
+
+
 def test_load_namedtuple() -> None:
     from typing import NamedTuple
 
@@ -594,6 +812,59 @@ def test_load_namedtuple() -> None:
         )
 
 
+def test_load_namedtuple_from_array() -> None:
+    from typing import NamedTuple
+
+    class SomeNamedTuple(NamedTuple):
+        foo: tuple[int, float]
+        bar: str = "bar"
+
+    loader = Loader(namedtuple_from_array=True)
+    assert loader.load([[1, 1.1], "BAR!"], SomeNamedTuple) == SomeNamedTuple(
+        foo=(1, 1.1), bar="BAR!"
+    )
+    assert loader.load([[1, 1]], SomeNamedTuple) == SomeNamedTuple(
+        foo=(1, 1.0), bar="bar"
+    )
+    assert loader.load({"foo": [1, 1.1]}, SomeNamedTuple) == SomeNamedTuple(
+        foo=(1, 1.1), bar="bar"
+    )
+
+    with pytest.raises(TressedValueError) as exc_info:
+        loader.load([[1, "one"]], SomeNamedTuple)
+    assert exc_info.value.type_path == (0, 1)
+    with pytest.raises(TressedValueError, match="expected at most 2 items, got 3"):
+        loader.load([[1, 1.1], "BAR!", "BAZ!"], SomeNamedTuple)
+    with pytest.raises(TressedValueError, match="missing required item 'foo'"):
+        loader.load([], SomeNamedTuple)
+
+    # Arrays are only accepted when enabled
+    with pytest.raises(TressedValueError):
+        Loader().load([[1, 1.1], "BAR!"], SomeNamedTuple)
+
+
+def test_load_namedtuple_alias() -> None:
+    from typing import NamedTuple
+
+    from tressed.alias import to_camel
+
+    class SomeNamedTuple(NamedTuple):
+        foo_foo: int
+        bar_bar: str = "bar"
+
+    loader = Loader(alias_fn=to_camel)
+    assert loader.load({"fooFoo": 1, "barBar": "BAR!"}, SomeNamedTuple) == (
+        SomeNamedTuple(foo_foo=1, bar_bar="BAR!")
+    )
+
+    with pytest.raises(TressedValueError) as exc_info:
+        loader.load({"fooFoo": 1, "foo_foo": 1}, SomeNamedTuple)
+    assert str(exc_info.value) == (
+        "Failed to load value of type dict at path . into type form SomeNamedTuple: "
+        "unexpected keys 'foo_foo'"
+    )
+
+
 def test_load_from_argparse_namespace() -> None:
     from argparse import Namespace
     from typing import NamedTuple
@@ -718,6 +989,54 @@ def test_load_generic_type_alias() -> None:
     )
 
 
+def test_load_type_alias_plan() -> None:
+    from tressed.loader.loaders import load_simple_collection
+    from tressed.loader.plans import make_type_alias_plan
+
+    loader = Loader()
+
+    type IntList = list[int]
+    type Ints = IntList
+
+    assert loader.load([[1, 2], [3]], list[Ints]) == [[1, 2], [3]]
+    plan = loader._plan(Ints, make_type_alias_plan)
+    assert plan.type_form == list[int]
+    assert plan.handler is load_simple_collection
+    assert loader._plan(Ints, make_type_alias_plan) is plan
+
+    assert loader.load([1, [2, [3]]], Tree) == [1, [2, [3]]]
+
+    with pytest.raises(TressedValueError) as exc_info:
+        loader.load(1, Loop)
+    assert str(exc_info.value) == (
+        "Failed to load value of type int at path . into type form Loop: "
+        "type alias refers to itself"
+    )
+
+
+def test_load_type_alias_evaluation_error() -> None:
+    loader = Loader()
+
+    type Undefined = list[NotDefined]  # type: ignore[name-defined]  # noqa: F821
+    type Pair[T] = tuple[T, T]
+
+    # Type aliases failing to evaluate are reported at the type path of the value
+    with pytest.raises(TressedValueError) as exc_info:
+        loader.load({"foo": [1]}, dict[str, Undefined])
+    assert str(exc_info.value) == (
+        "Failed to load value of type list at path .foo into type form Undefined: "
+        "failed to evaluate type alias: <class 'NameError'>: "
+        "name 'NotDefined' is not defined"
+    )
+
+    with pytest.raises(TressedValueError) as exc_info:
+        loader.load([[1, 2]], list[Pair[int, int]])  # type: ignore[type-arg]
+    assert str(exc_info.value).startswith(
+        "Failed to load value of type list at path .0 into type form Pair[T=int, int]: "
+        "failed to evaluate type alias: <class 'TypeError'>: "
+    )
+
+
 def test_load_optional() -> None:
     loader = Loader()
 
@@ -770,6 +1089,192 @@ def test_load_union() -> None:
     ]
 
 
+def test_load_union_dispatch() -> None:
+    from dataclasses import dataclass
+    from typing import Literal
+
+    from tressed.loader.plans import make_union_plan
+
+    @dataclass
+    class SomeDataclass:
+        foo: int
+
+    loader = Loader()
+    type_form = int | str | list[int] | SomeDataclass
+    arms_by_type = loader._plan(type_form, make_union_plan).arms_by_type
+    assert arms_by_type[dict] == (list[int], SomeDataclass)
+    assert arms_by_type[list] == (list[int],)
+    assert arms_by_type[int] == (int,)
+    assert arms_by_type[bool] == ()
+
+    assert loader.load({"foo": 1}, type_form) == SomeDataclass(1)
+    assert loader.load([1, 2], type_form) == [1, 2]
+    assert loader.load("foo", type_form) == "foo"
+    with pytest.raises(TressedValueError) as exc_info:
+        loader.load(True, type_form)
+    # Every arm is reported
+    assert len(exc_info.value.exceptions) == 4
+
+    # Arms are only left out when they cannot load the value, strings are iterables
+    assert loader.load("ab", list[str] | str) == ["a", "b"]
+    # Literals are compared by equality
+    assert loader.load(1.0, str | Literal[1]) == 1.0
+
+
+def test_load_union_required_keys() -> None:
+    from dataclasses import dataclass, field
+    from typing import NotRequired, TypedDict
+
+    from tressed.loader.plans import make_union_plan
+
+    @dataclass
+    class User:
+        name: str
+        email: str = ""
+
+    @dataclass
+    class Group:
+        name: str
+        members: list[User] = field(metadata={"alias": "users"})
+
+    class Bot(TypedDict):
+        name: str
+        owner: NotRequired[User]
+        token: str
+
+    type_form = Group | Bot | User | dict[str, str]
+    loader = Loader()
+    plan = loader._plan(type_form, make_union_plan)
+    assert plan.required_keys == (
+        (Group, frozenset({"name", "users"})),
+        (Bot, frozenset({"name", "token"})),
+        (User, frozenset({"name"})),
+        (dict[str, str], None),
+    )
+    assert plan.arms({"name": "foo", "users": []}) == (Group, User, dict[str, str])
+    assert plan.arms({"name": "foo", "token": "bar"}) == (Bot, User, dict[str, str])
+    assert plan.arms({"users": []}) == (dict[str, str],)
+    assert plan.arms([]) == plan.arms_by_type[list]
+
+    assert loader.load({"name": "foo", "users": [{"name": "bar"}]}, type_form) == Group(
+        "foo", [User("bar")]
+    )
+    assert loader.load({"name": "foo", "token": "bar"}, type_form) == {
+        "name": "foo",
+        "token": "bar",
+    }
+    assert loader.load({"name": "foo"}, type_form) == User("foo")
+    assert loader.load({"foo": "bar"}, type_form) == {"foo": "bar"}
+    with pytest.raises(TressedValueError) as exc_info:
+        loader.load({"users": [1]}, type_form)
+    # Every arm is reported
+    assert len(exc_info.value.exceptions) == 4
+
+    # Unions without dataclasses or typed dicts are not narrowed down by keys
+    assert loader._plan(int | dict[str, int], make_union_plan).required_keys is None
+
+
+def test_load_union_trials() -> None:
+    from dataclasses import dataclass
+    from typing import Literal, TypedDict
+
+    from tressed.loader.loaders import load_simple_scalar
+    from tressed.loader.trials import FAILED
+
+    @dataclass
+    class Circle:
+        kind: Literal["circle"]
+        radius: float
+
+    @dataclass
+    class Square:
+        kind: Literal["square"]
+        side: float
+
+    class Point(TypedDict):
+        x: int
+        y: int
+
+    type_form = Circle | Square | Point
+    for loader in (Loader(), Loader(enable_specialization=True)):
+        for _ in range(5):
+            assert loader.load({"kind": "square", "side": 1}, type_form) == Square(
+                "square", 1.0
+            )
+            assert loader.load({"x": 1, "y": 2}, type_form) == {"x": 1, "y": 2}
+
+        # Trial handlers fail without raising
+        assert loader._try_load({"kind": "circle"}, Circle, ()) is FAILED
+        assert loader._try_load({"kind": "square", "side": 1}, Circle, ()) is FAILED
+        assert loader._try_load({"x": 1}, Point, ()) is FAILED
+        assert loader._try_load({"x": 1, "y": "2"}, Point, ()) is FAILED
+        assert loader._try_load(None, int | None, ()) is None
+        assert loader._try_load(1, float | None, ()) == 1.0
+        assert loader._try_load("1", float | None, ()) is FAILED
+
+        # Errors are only built once every arm failed, and report every arm
+        with pytest.raises(TressedValueError) as exc_info:
+            loader.load({"kind": "square"}, type_form)
+        assert len(exc_info.value.exceptions) == 3
+        assert [str(e) for e in exc_info.value.exceptions[:2]] == [
+            "Failed to load value of type str at path .kind into type form "
+            "Literal['circle']: got value 'square' but expected one of: 'circle'",
+            "Failed to load value of type dict at path . into type form Square",
+        ]
+
+    # Handlers without a trial handler fail on raising
+    from ipaddress import IPv4Address
+
+    loader = Loader()
+    assert loader._try_load("foo", IPv4Address, ()) is FAILED
+    assert loader.load("127.0.0.1", int | IPv4Address) == IPv4Address("127.0.0.1")
+
+    def try_load_ip(value, type_form, type_path, loader):
+        return FAILED if "." not in value else type_form(value)
+
+    loader = Loader(extra_trial_handlers={load_simple_scalar: try_load_ip})
+    assert loader._try_load("foo", IPv4Address, ()) is FAILED
+
+
+def test_load_union_trials_without_plan() -> None:
+    from dataclasses import dataclass
+
+    from tressed.loader.plans import (
+        make_dataclass_constructor_plan,
+        make_dataclass_trial_plan,
+    )
+
+    @dataclass(init=False)
+    class Custom:
+        foo: int
+
+        def __init__(self, foo: int) -> None:
+            self.foo = foo
+
+    @dataclass
+    class Other:
+        bar: int
+
+    loader = Loader()
+    for i in range(5):
+        assert loader.load({"foo": i}, Custom | Other) == Custom(i)
+
+    # Dataclasses without plans are planned once
+    for make_plan in (make_dataclass_trial_plan, make_dataclass_constructor_plan):
+        assert Custom in dict(loader._plans[make_plan].items())
+        assert loader._plan(Custom, make_plan) is None
+
+    planned = []
+
+    def make_no_plan(type_form, loader):
+        planned.append(type_form)
+        return None
+
+    for _ in range(3):
+        assert loader._plan(Custom, make_no_plan) is None
+    assert planned == [Custom]
+
+
 def test_load_legacy_union() -> None:
     from typing import Union
 
@@ -790,6 +1295,53 @@ def test_load_legacy_union() -> None:
     ]
 
 
+def test_load_top_level_error_wrapping() -> None:
+    from dataclasses import dataclass
+    from ipaddress import IPv4Address
+    from typing import Union
+    from uuid import UUID
+
+    @dataclass
+    class Host:
+        name: str
+        address: IPv4Address
+
+    for loader in (Loader(), Loader(top_level_error_wrapping=True)):
+        assert loader.load([{"name": "foo", "address": "127.0.0.1"}], list[Host]) == [
+            Host("foo", IPv4Address("127.0.0.1"))
+        ]
+
+        with pytest.raises(TressedValueError) as exc_info:
+            loader.load(
+                {
+                    "hosts": [
+                        {"name": "foo", "address": "127.0.0.1"},
+                        {"address": "bar"},
+                    ]
+                },
+                dict[str, list[Host]],
+            )
+        assert exc_info.value.type_path == ("hosts", 1, "address")
+        assert exc_info.value.value == "bar"
+        assert (
+            str(exc_info.value)
+            == "Failed to load value of type str at path .hosts.1.address into type form IPv4Address"
+        )
+
+        with pytest.raises(TressedValueError) as exc_info:
+            loader.load({"foo": ["127.0.0.1", "bar"]}, dict[str, list[IPv4Address]])
+        assert exc_info.value.type_path == ("foo", 1)
+        assert exc_info.value.type_form is IPv4Address
+
+        with pytest.raises(TressedValueError) as exc_info:
+            loader.load(["foo"], list[Union[IPv4Address, UUID]])
+        assert exc_info.value.type_path == (0,)
+        assert [str(e) for e in exc_info.value.exceptions] == [
+            "Failed to load value of type str at path .0 into type form IPv4Address",
+            "Failed to load value of type str at path .0 into type form UUID",
+        ]
+
+
 def test_load_path() -> None:
     from pathlib import Path, PurePosixPath, PureWindowsPath
 
@@ -925,3 +1477,192 @@ def test_load_discriminated_union_best_match() -> None:
         "Failed to load value of type dict at path . into type form Annotated[Foo | Bar]: "
         "value did not match discriminated union discriminant"
     )
+
+
+def test_load_discriminated_union_by_field() -> None:
+    from dataclasses import dataclass, field
+    from typing import Annotated, Literal, NamedTuple, TypedDict
+
+    from tressed.discriminated_union import Discriminator
+    from tressed.loader.plans import make_discriminated_union_plan
+
+    @dataclass
+    class Circle:
+        kind: Literal["circle"] = field(metadata={"alias": "type"})
+        radius: float = 1.0
+
+    class Square(TypedDict):
+        type: Literal["square", "SQUARE"]
+        side: float
+
+    class Point(NamedTuple):
+        type: Literal["point"]
+
+    assert Discriminator.by_field("kind") == Discriminator.by_field("kind")
+
+    Shape = Annotated[Circle | Square, Discriminator.by_field("kind")]
+    loader = Loader()
+    plan = loader._plan(Shape, make_discriminated_union_plan)
+    # Circle is tagged by the alias of its kind field, but square has no kind field
+    assert plan.tags is None
+
+    Shape2 = Annotated[Square | Point, Discriminator.by_field("type")]
+    plan = loader._plan(Shape2, make_discriminated_union_plan)
+    assert plan.tag_alias == "type"
+    assert plan.tags == {"square": Square, "SQUARE": Square, "point": Point}
+
+    assert loader.load({"type": "SQUARE", "side": 2}, Shape2) == {
+        "type": "SQUARE",
+        "side": 2.0,
+    }
+    assert loader.load({"type": "point"}, Shape2) == Point("point")
+    for value in ({"type": "circle"}, {"type": ["point"]}, {}, ["point"]):
+        with pytest.raises(TressedValueError) as exc_info:
+            loader.load(value, Shape2)
+        assert str(exc_info.value).endswith(
+            "value did not match discriminated union discriminant"
+        )
+
+    # The alias of the tag field is used, like every other field
+    loader = Loader(
+        alias_field=None,
+        alias_fn=lambda name: name.upper(),
+        alias_typeddict_keys=True,
+    )
+    plan = loader._plan(Shape2, make_discriminated_union_plan)
+    assert plan.tag_alias == "TYPE"
+    assert loader.load({"TYPE": "point"}, Shape2) == Point("point")
+
+    # Without a common alias the arms are matched using the alias in each arm
+    loader = Loader(alias_field=None, alias_fn=lambda name: name.upper())
+    plan = loader._plan(Shape2, make_discriminated_union_plan)
+    assert plan.tags is None
+    assert plan.arm_tag_aliases == ("type", "TYPE")
+    assert loader.load({"TYPE": "point"}, Shape2) == Point("point")
+    assert loader.load({"type": "square", "side": 1}, Shape2) == {
+        "type": "square",
+        "side": 1.0,
+    }
+    with pytest.raises(TressedValueError):
+        loader.load({"type": "point"}, Shape2)
+
+
+def test_load_discriminated_union_by_field_path_alias(mocker: MockerFixture) -> None:
+    import typing
+    from dataclasses import dataclass
+    from typing import Annotated, Literal
+
+    from tressed.alias import to_camel
+    from tressed.discriminated_union import Discriminator
+    from tressed.loader.plans import make_discriminated_union_plan
+
+    @dataclass
+    class Created:
+        event_type: Literal["created"]
+
+    @dataclass
+    class Deleted:
+        event_type: Literal["deleted"]
+
+    Event = Annotated[Created | Deleted, Discriminator.by_field("event_type")]
+
+    def alias_fn(name, type_form, type_path):
+        return to_camel(name)
+
+    get_type_hints = mocker.spy(typing, "get_type_hints")
+    # Aliases depending on the type path cannot be tabled
+    loader = Loader(alias_fn=alias_fn)
+    plan = loader._plan(Event, make_discriminated_union_plan)
+    assert plan.tags is None
+    assert plan.arm_tag_aliases == (None, None)
+
+    assert loader.load({"eventType": "deleted"}, Event) == Deleted("deleted")
+    num_calls = get_type_hints.call_count
+    assert loader.load({"eventType": "created"}, Event) == Created("created")
+    # The tags of each arm are computed once
+    assert get_type_hints.call_count == num_calls
+
+    # Called directly, the match function matches the field name
+    discriminator = Discriminator.by_field("event_type")
+    assert discriminator.match({"event_type": "created"}, Created, Deleted) is Created
+    assert discriminator.match({"eventType": "created"}, Created, Deleted) is None
+
+
+def test_load_union_infer_discriminators() -> None:
+    from dataclasses import dataclass
+    from typing import Literal, TypedDict
+
+    from tressed.loader.plans import make_inferred_discriminated_union_plan
+
+    @dataclass
+    class Created:
+        type: Literal["created"]
+        id: int
+
+    @dataclass
+    class Deleted:
+        type: Literal["deleted", "removed"]
+        id: int
+        reason: str = ""
+
+    class Renamed(TypedDict):
+        type: Literal["renamed"]
+        id: int
+        name: str
+
+    @dataclass
+    class Recreated:
+        type: Literal["created", "recreated"]
+        id: int
+
+    @dataclass
+    class Untagged:
+        id: int
+
+    type_form = Created | Deleted | Renamed
+    loader = Loader(infer_discriminators=True)
+    plan = loader._plan(type_form, make_inferred_discriminated_union_plan)
+    assert plan is not None
+    assert plan.tag_alias == "type"
+    assert plan.tags == {
+        "created": Created,
+        "deleted": Deleted,
+        "removed": Deleted,
+        "renamed": Renamed,
+    }
+    # Arms without the tag field, or sharing tags are not discriminated
+    assert (
+        loader._plan(Created | Untagged, make_inferred_discriminated_union_plan) is None
+    )
+    assert (
+        loader._plan(Created | Recreated, make_inferred_discriminated_union_plan)
+        is None
+    )
+
+    for loader in (Loader(), Loader(infer_discriminators=True)):
+        assert loader.load({"type": "removed", "id": 1}, type_form) == Deleted(
+            "removed", 1
+        )
+        assert loader.load({"type": "renamed", "id": 1, "name": "foo"}, type_form) == {
+            "type": "renamed",
+            "id": 1,
+            "name": "foo",
+        }
+        assert loader.load([{"type": "created", "id": 1}], list[type_form]) == [
+            Created("created", 1)
+        ]
+        assert loader.load({"id": 1}, Created | Untagged) == Untagged(1)
+
+        # Errors report every arm, like for any union
+        for value in ({"type": "created"}, {"type": "updated", "id": 1}, {"id": 1}):
+            with pytest.raises(TressedValueError) as exc_info:
+                loader.load(value, type_form)
+            assert len(exc_info.value.exceptions) == 3
+
+    # Unions without inferred discriminators are only planned once too
+    loader = Loader(infer_discriminators=True)
+    for _ in range(3):
+        assert loader.load({"id": 1}, Created | Untagged) == Untagged(1)
+        assert loader.load([{"id": 1}], list[Created | Untagged]) == [Untagged(1)]
+    plans = loader._plans[make_inferred_discriminated_union_plan]
+    assert [type_form for type_form, _ in plans.items()] == [Created | Untagged]
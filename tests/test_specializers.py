@@ -1,58 +1,652 @@
-def test_specialize_load_tuple() -> None:
+import pytest
+
+
+def test_specialize_load_tree() -> None:
+    from tressed.exceptions import TressedError
     from tressed.loader import Loader
-    from tressed.loader.specializers import specialize_load_tuple
+    from tressed.loader.loaders import load_tuple
+    from tressed.loader.specializers import load_generic, specialize_load_tree
 
-    code = specialize_load_tuple(tuple[int, float, str], ("foo", 1))
+    loader = Loader()
+    codegen = specialize_load_tree(tuple[int, float, str], loader)
+    assert codegen is not None
     assert (
-        code
+        codegen.code()
         == """\
-def __specialized_fn(value, loader):
-    _item_0, _item_1, _item_2 = value
+def __specialized_fn(value, type_path, loader):
     _load = loader._load
-    _item_0_loaded = _load(_item_0, int, ('foo', 1, 0))
-    _item_1_loaded = _load(_item_1, float, ('foo', 1, 1))
-    _item_2_loaded = _load(_item_2, str, ('foo', 1, 2))
-    return (
-        _item_0_loaded,
-        _item_1_loaded,
-        _item_2_loaded,
-    )
+    try:
+        return (((value[0] if type(value[0]) is _int else _load(value[0], _int, TypePathNode((type_path, 0)))), (value[1] if type(value[1]) is float else _float(value[1]) if type(value[1]) is int else _load(value[1], _float, TypePathNode((type_path, 1)))), (value[2] if type(value[2]) is _str else _load(value[2], _str, TypePathNode((type_path, 2))))) if (type(value) is list or type(value) is tuple) and len(value) == 3 else _fallback(value, _tuple, type_path, loader))
+    except _TressedError:
+        raise
+    except Exception:
+        return _load_generic(_fallback, value, _tuple, type_path, loader)
 
 """
     )
+    assert codegen.namespace == {
+        "_int": int,
+        "_float": float,
+        "_str": str,
+        "_tuple": tuple[int, float, str],
+        "_fallback": load_tuple,
+        "_TressedError": TressedError,
+        "_load_generic": load_generic,
+    }
+    specialized_fn = codegen.exec()
+    assert specialized_fn([1, 1.1, "foobar"], ("foo", 1), loader) == (1, 1.1, "foobar")
+    assert specialized_fn([1, 1, "foobar"], ("foo", 1), loader) == (1, 1.0, "foobar")
+    # Less common inputs go through the generic handler
+    assert specialized_fn(iter([1, 1.1, "foobar"]), ("foo", 1), loader) == (
+        1,
+        1.1,
+        "foobar",
+    )
+
+
+def test_specialize_load_tree_nested() -> None:
+    from typing import Any
+    from uuid import UUID
+
+    from tressed.exceptions import TressedValueError
+    from tressed.loader import Loader
+    from tressed.loader.specializers import specialize_load_tree
+
     loader = Loader()
-    globals_: dict = {}
-    locals_: dict = {}
-    exec(code, globals_, locals_)
-    specialized_fn = locals_["__specialized_fn"]
-    assert specialized_fn([1, 1.1, "foobar"], loader) == (1, 1.1, "foobar")
+    type_form = dict[str, list[tuple[UUID, frozenset[int]]]]
+    codegen = specialize_load_tree(type_form, loader)
+    assert codegen is not None
+    # Only the loader and the generic handler of the root are called on the slow path
+    assert "_load(_item_0, _tuple, " in codegen.code()
+    assert "_fallback(value, _dict, " in codegen.code()
+
+    specialized_fn = codegen.exec()
+    items: list[list[Any]] = [[str(UUID(int=i)), [i, i + 1]] for i in range(10)]
+    value = {"foo": items, "bar": []}
+    expected = loader.load(value, type_form)
+    assert specialized_fn(value, (), loader) == expected
+    assert specialized_fn(value, (), loader) == {
+        "foo": [(UUID(int=i), frozenset({i, i + 1})) for i in range(10)],
+        "bar": [],
+    }
+
+    # Errors are reported at the same type path as without inlining
+    items[3][1][1] = "not an int"
+    with pytest.raises(TressedValueError) as exc_info:
+        specialized_fn(value, ("root",), loader)
+    assert exc_info.value.type_path == ("root", "foo", 3, 1, 1)
+
+    # Foreign exceptions are raised again by the generic handler
+    items[3] = ["not an uuid", []]
+    with pytest.raises(TressedValueError) as exc_info:
+        specialized_fn(value, ("root",), loader)
+    assert exc_info.value.type_path == ("root", "foo", 3, 0)
 
 
-def test_specialize_load_simple_collection() -> None:
+def test_specialize_load_tree_opaque_handlers() -> None:
     from tressed.loader import Loader
-    from tressed.loader.specializers import specialize_load_simple_collection
+    from tressed.loader.specializers import specialize_load_tree
+
+    def load_int(value, type_form, type_path, loader):
+        return int(value)
+
+    # Registered handlers are never inlined
+    loader = Loader(extra_type_handlers={int: load_int})
+    codegen = specialize_load_tree(list[int], loader)
+    assert codegen is not None
+    assert "_load(_item, _int, " in codegen.code()
+    assert codegen.exec()(["1", "2"], (), loader) == [1, 2]
+
+    # Nor type forms which aren't collections
+    assert specialize_load_tree(int, loader) is None
+
+
+def test_codegen_allocate_and_bind() -> None:
+    from tressed.loader.specializers import Codegen
 
-    code = specialize_load_simple_collection(
-        set[tuple[int, str, float]], ("foo", 0, "bar")
+    codegen = Codegen()
+    # Arguments and globals of the generated function are never shadowed
+    assert codegen.allocate("value") == "_value"
+    assert codegen.allocate("value") == "_value_0"
+    assert codegen.allocate("_value") == "_value_1"
+    assert codegen.allocate("TypePathNode") == "_TypePathNode"
+
+    # Objects are bound once, under collision-free identifiers
+    int_ident = codegen.bind(int)
+    assert codegen.bind(int) == int_ident
+    assert codegen.bind(list[int]) != codegen.bind(list[str])
+    assert codegen.bind(object()) == "_object"
+    assert len(set(codegen.namespace)) == 4
+
+
+def test_specialize_load_arbitrary_type_forms() -> None:
+    import ipaddress
+    import uuid
+
+    from tressed.loader import Loader
+    from tressed.loader.loaders import load_simple_scalar
+
+    # Classes shadowed in the generated function namespace, or not reachable by name
+    class UUID(uuid.UUID):
+        pass
+
+    class item_0(ipaddress.IPv4Address):
+        pass
+
+    loader = Loader(
+        enable_specialization=True,
+        extra_type_handlers={UUID: load_simple_scalar, item_0: load_simple_scalar},
     )
-    assert (
-        code
-        == """\
-def __specialized_fn(value, loader):
-    _load = loader._load
-    return {
-        _load(item, tuple[int, str, float], ('foo', 0, 'bar', pos))
-        for pos, item
-        in enumerate(value)
+    type_form = list[tuple[UUID, uuid.UUID, item_0]]
+    value = [
+        [str(uuid.UUID(int=i)), str(uuid.UUID(int=i)), "127.0.0.1"] for i in range(10)
+    ]
+    loaded = loader.load(value, type_form)
+    assert loaded == [
+        (UUID(int=i), uuid.UUID(int=i), item_0("127.0.0.1")) for i in range(10)
+    ]
+    assert all(type(item[0]) is UUID for item in loaded)
+    assert all(type(item[2]) is item_0 for item in loaded)
+
+
+def test_specializing_loader_keyed_by_type_form() -> None:
+    from tressed.exceptions import TressedValueError
+    from tressed.loader import Loader
+    from tressed.loader.specializer import SpecializingLoader
+
+    loader = Loader(enable_specialization=True)
+    value = [[i, str(i)] for i in range(100)]
+    assert loader.load(value, list[tuple[int, str]]) == [
+        (i, str(i)) for i in range(100)
+    ]
+
+    specializing_loaders = {
+        type_loader
+        for type_loader in loader._type_mappers.values()
+        if isinstance(type_loader, SpecializingLoader)
     }
+    specialized_type_forms = {
+        type_form
+        for specializing_loader in specializing_loaders
+        for type_form, _ in specializing_loader._specializations.items()
+    }
+    # One entry per type form, not one per item path
+    assert specialized_type_forms == {list[tuple[int, str]], tuple[int, str]}
 
-"""
+    # The concrete type path is still reported by specialized functions
+    value[42][0] = "not an int"
+    with pytest.raises(TressedValueError) as exc_info:
+        loader.load(value, list[tuple[int, str]])
+    assert exc_info.value.type_path == (42, 0)
+
+
+def test_specializing_loader_max_cache_size() -> None:
+    from tressed.loader import Loader
+    from tressed.loader.specializer import SpecializingLoader
+
+    loader = Loader(enable_specialization=True, max_cache_size=2)
+    assert loader.load([1] * 5, list[int]) == [1] * 5
+    assert loader.load(["1"] * 5, list[str]) == ["1"] * 5
+    assert loader.load([1.0] * 5, list[float]) == [1.0] * 5
+
+    specializing_loader = loader._lookup_handler(list[int])
+    assert isinstance(specializing_loader, SpecializingLoader)
+    # The oldest type form was evicted
+    assert [
+        type_form for type_form, _ in specializing_loader._specializations.items()
+    ] == [list[str], list[float]]
+
+
+def test_loader_compile_specializes_eagerly() -> None:
+    from tressed.loader import Loader
+    from tressed.loader.specializer import SpecializingLoader
+
+    loader = Loader(enable_specialization=True)
+    load = loader.compile(list[tuple[int, str]])
+
+    specialized = {
+        type_form: entry.fn
+        for type_loader in loader._type_mappers.values()
+        if isinstance(type_loader, SpecializingLoader)
+        for type_form, entry in type_loader._specializations.items()
+    }
+    assert set(specialized) == {list[tuple[int, str]], tuple[int, str]}
+    assert all(
+        callable(specialized_loader) for specialized_loader in specialized.values()
     )
+
+    assert load([[1, "one"], [2, "two"]]) == [(1, "one"), (2, "two")]
+
+
+def test_specialize_load_dataclass() -> None:
+    from dataclasses import dataclass, field
+
+    from tressed.exceptions import TressedValueError
+    from tressed.loader import Loader
+    from tressed.loader.specializers import specialize_load_dataclass
+
+    @dataclass
+    class SomeDataclass:
+        foo: int
+        bar: float = 0.0
+        baz: list[str] = field(default_factory=list, metadata={"alias": "Baz"})
+        qux: str = field(default="qux", kw_only=True)
+
     loader = Loader()
-    globals_: dict = {}
-    locals_: dict = {}
-    exec(code, globals_, locals_)
-    specialized_fn = locals_["__specialized_fn"]
+    codegen = specialize_load_dataclass(SomeDataclass, loader)
+    assert codegen is not None
+    code = codegen.code()
+    assert "if type(value) is not dict or 'foo' not in value:\n" in code
+    assert "_baz = value['Baz']\n" in code
+    assert "_baz = _baz_factory()\n" in code
+    assert "return _SomeDataclass(_foo, _bar, _baz, qux=_qux)\n" in code
+
+    specialized_fn = codegen.exec()
+    assert specialized_fn({"foo": 1}, (), loader) == SomeDataclass(1)
     assert specialized_fn(
-        [[1, "two", 3.3], [4, "five", 5.5], [1, "two", 3.3]], loader
-    ) == {(1, "two", 3.3), (4, "five", 5.5)}
+        {"foo": 1, "bar": 2, "Baz": ["three"], "qux": "four", "extra": None},
+        (),
+        loader,
+    ) == SomeDataclass(1, 2.0, ["three"], qux="four")
+
+    # Errors are reported as by the generic handler
+    with pytest.raises(TressedValueError) as exc_info:
+        specialized_fn({"foo": 1, "Baz": ["three", 4]}, ("root",), loader)
+    assert exc_info.value.type_path == ("root", "Baz", 1)
+    with pytest.raises(TressedValueError) as exc_info:
+        specialized_fn({"bar": 2.0}, ("root",), loader)
+    assert exc_info.value.type_path == ("root",)
+    assert isinstance(exc_info.value.__cause__, TypeError)
+    assert "foo" in str(exc_info.value.__cause__)
+
+
+def test_specialized_dataclass_fallback_once(mocker) -> None:
+    from dataclasses import dataclass
+
+    from tressed.exceptions import TressedValueError
+    from tressed.loader import Loader, loaders
+    from tressed.loader.specializer import SpecializationPolicy
+
+    @dataclass
+    class SomeDataclass:
+        foo: int
+        bar: int = 0
+
+    load_dataclass = mocker.spy(loaders, "load_dataclass")
+
+    def check_fallback_once(loader: Loader) -> None:
+        assert loader.load({"foo": 1}, SomeDataclass) == SomeDataclass(1)
+        assert [report.state for report in loader.specialization_report()] == [
+            "compiled"
+        ]
+
+        # Missing required keys and other inputs than dicts
+        for value in ({"bar": 1}, [1]):
+            load_dataclass.reset_mock()
+            with pytest.raises(TressedValueError):
+                loader.load(value, SomeDataclass)
+            # The generic handler reports the error, and is not called again
+            assert load_dataclass.call_count == 1
+
+    policy = SpecializationPolicy("eager")
+    check_fallback_once(Loader(specialization_policy=policy))
+    check_fallback_once(
+        Loader(specialization_policy=policy, specialization_backend="closure")
+    )
+
+
+def test_specialize_load_dataclass_unsupported() -> None:
+    from dataclasses import dataclass
+
+    from tressed.loader import Loader
+    from tressed.loader.specializers import specialize_load_dataclass
+
+    @dataclass(init=False)
+    class CustomInit:
+        foo: int
+
+        def __init__(self, foo: int) -> None:
+            self.foo = foo
+
+    @dataclass
+    class SomeDataclass:
+        foo: int
+
+    assert specialize_load_dataclass(CustomInit, Loader()) is None
+    # Aliases depending on the type path are resolved on load
+    loader = Loader(alias_fn=lambda name, type_form, type_path: name)
+    assert specialize_load_dataclass(SomeDataclass, loader) is None
+    assert loader.load({"foo": 1}, SomeDataclass) == SomeDataclass(1)
+
+
+def test_loader_specialize_dataclass() -> None:
+    from dataclasses import dataclass, field
+
+    from tressed.exceptions import TressedValueError
+    from tressed.loader import Loader
+
+    @dataclass
+    class SomeDataclass:
+        foo: int
+        bar: list[tuple[int, str]]
+        baz: list[int] = field(default_factory=list)
+
+    def check_specialized(loader: Loader) -> None:
+        value = [{"foo": i, "bar": [[i, str(i)]]} for i in range(10)]
+        assert loader.load(value, list[SomeDataclass]) == [
+            SomeDataclass(i, [(i, str(i))]) for i in range(10)
+        ]
+        # The dataclass was loaded often enough to run its specialization
+        assert callable(_specialized(loader)[SomeDataclass])
+
+        # Default factories are called for each value
+        first, second = loader.load(
+            [{"foo": 1, "bar": []}, {"foo": 2, "bar": []}], list[SomeDataclass]
+        )
+        assert (first.baz, second.baz) == ([], [])
+        assert first.baz is not second.baz
+        assert loader.load(
+            {"foo": 1, "bar": [], "baz": [2]}, SomeDataclass
+        ) == SomeDataclass(1, [], [2])
+
+        # Missing required keys are reported by the generic handler
+        with pytest.raises(TressedValueError) as exc_info:
+            loader.load([{"foo": 1}], list[SomeDataclass])
+        assert exc_info.value.type_path == (0,)
+        assert isinstance(exc_info.value.__cause__, TypeError)
+
+        assert loader.compile(SomeDataclass)({"foo": 1, "bar": []}) == SomeDataclass(
+            1, []
+        )
+
+    check_specialized(Loader(enable_specialization=True))
+    check_specialized(
+        Loader(enable_specialization=True, specialization_backend="closure")
+    )
+
+
+def test_loader_specialize_dataclass_kw_only() -> None:
+    from dataclasses import dataclass, field
+
+    from tressed.loader import Loader
+
+    @dataclass
+    class SomeDataclass:
+        foo: int = field(kw_only=True)
+        bar: str
+        baz: int = field(default=0, kw_only=True)
+
+    for backend in ("exec", "closure"):
+        loader = Loader(enable_specialization=True, specialization_backend=backend)
+        value = [{"foo": i, "bar": str(i)} for i in range(10)]
+        assert loader.load(value, list[SomeDataclass]) == [
+            SomeDataclass(str(i), foo=i) for i in range(10)
+        ]
+        assert callable(_specialized(loader)[SomeDataclass])
+        assert loader.load(
+            {"foo": 1, "bar": "1", "baz": 2}, SomeDataclass
+        ) == SomeDataclass("1", foo=1, baz=2)
+
+
+def test_loader_specialize_dict() -> None:
+    from tressed.exceptions import TressedValueError
+    from tressed.loader import Loader
+    from tressed.loader.loaders import load_dict
+    from tressed.loader.specializer import SpecializingLoader
+
+    loader = Loader(enable_specialization=True)
+    type_form = dict[str, float]
+    assert isinstance(loader._lookup_handler(type_form), SpecializingLoader)
+
+    value = {f"metric_{i}": i / 2 if i % 2 else i for i in range(100)}
+    for _ in range(5):
+        loaded = loader.load(value, type_form)
+        assert loaded == {key: float(item) for key, item in value.items()}
+        assert all(type(item) is float for item in loaded.values())
+
+    # Keys of unexpected types go through the loader
+    with pytest.raises(TressedValueError) as exc_info:
+        loader.load({**value, 1: 1.0}, type_form)
+    assert exc_info.value.type_path == (1,)
+    assert load_dict({1: 1.0}, dict[int, float], (), loader) == {1: 1.0}
+
+
+def _specialized(loader) -> dict:
+    """
+    The specialized function of each type form, zero if it is not to be specialized,
+    or the number of calls so far.
+    """
+    from tressed.loader.specializer import SpecializingLoader
+
+    return {
+        type_form: entry.fn
+        if entry.fn is not None
+        else (0 if entry.reason is not None else entry.calls)
+        for type_loader in {
+            type_loader
+            for type_loader in loader._type_mappers.values()
+            if isinstance(type_loader, SpecializingLoader)
+        }
+        for type_form, entry in type_loader._specializations.items()
+    }
+
+
+def test_specialization_policy() -> None:
+    from tressed.loader import Loader, SpecializationPolicy
+
+    value = [[1, "one"], [2, "two"]]
+    type_form = list[tuple[int, str]]
+
+    loader = Loader(specialization_policy=SpecializationPolicy("eager"))
+    assert loader.load(value, type_form) == [(1, "one"), (2, "two")]
+    assert all(map(callable, _specialized(loader).values()))
+
+    loader = Loader(specialization_policy=SpecializationPolicy("never"))
+    loader.compile(type_form)
+    for _ in range(10):
+        assert loader.load(value, type_form) == [(1, "one"), (2, "two")]
+    assert _specialized(loader) == {type_form: 0, tuple[int, str]: 0}
+
+    loader = Loader(specialization_policy=SpecializationPolicy(threshold=5))
+    for _ in range(2):
+        loader.load(value, type_form)
+    assert _specialized(loader) == {type_form: 2, tuple[int, str]: 4}
+    loader.load(value, type_form)
+    assert callable(_specialized(loader)[tuple[int, str]])
+
+    loader = Loader(specialization_policy=SpecializationPolicy("eager", deny=[list]))
+    loader.load(value, type_form)
+    specialized = _specialized(loader)
+    assert specialized[type_form] == 0
+    assert callable(specialized[tuple[int, str]])
+
+    policy = SpecializationPolicy("eager", allow=[type_form])
+    loader = Loader(specialization_policy=policy)
+    loader.load(value, type_form)
+    specialized = _specialized(loader)
+    assert callable(specialized[type_form])
+    # Inlined
+    assert tuple[int, str] not in specialized
+    loader.load([1, "one"], tuple[int, str])
+    assert _specialized(loader)[tuple[int, str]] == 0
+
+
+def test_specialization_guards() -> None:
+    from tressed.loader import Loader, SpecializationPolicy
+
+    def load_int_str(value, type_form, type_path, loader):
+        return str(value)
+
+    loader = Loader(specialization_policy=SpecializationPolicy("eager"))
+    type_form = list[int]
+    assert loader.load([1, 2], type_form) == [1, 2]
+    assert callable(_specialized(loader)[type_form])
+
+    # Specializations inlining previous handlers are dropped
+    loader.add_type_handlers({int: load_int_str})
+    assert _specialized(loader) == {}
+    assert loader.load([1, 2], type_form) == ["1", "2"]
+
+
+def test_specialization_deoptimize() -> None:
+    from tressed.loader import Loader, SpecializationPolicy
+    from tressed.loader.specializer import SpecializingLoader
+
+    def broken_specialization(value, type_path, loader):
+        raise RuntimeError("broken")
+
+    loader = Loader(specialization_policy=SpecializationPolicy("eager"))
+    type_form = list[int]
+    loader.compile(type_form)
+    (entry,) = {
+        entry
+        for type_loader in loader._type_mappers.values()
+        if isinstance(type_loader, SpecializingLoader)
+        for key, entry in type_loader._specializations.items()
+        if key == type_form
+    }
+    entry.fn = broken_specialization
+
+    # The generic handler loads the value, and the specialization is dropped
+    assert loader.load([1, 2], type_form) == [1, 2]
+    assert _specialized(loader)[type_form] == 0
+    assert loader.load([1, 2], type_form) == [1, 2]
+
+    (report,) = loader.specialization_report()
+    assert (report.state, report.reason, report.calls) == (
+        "unspecializable",
+        "deoptimized",
+        2,
+    )
+
+
+def test_specialization_compile_failure() -> None:
+    from tressed.loader import Loader, SpecializationPolicy
+    from tressed.loader.loaders import load_simple_collection
+    from tressed.loader.specializer import SpecializingLoader
+    from tressed.loader.specializers import Codegen
+
+    def broken_specializer(type_form, loader):
+        raise RuntimeError("broken")
+
+    def broken_codegen(type_form, loader):
+        codegen = Codegen()
+        codegen._emit_line("return (")
+        return codegen
+
+    loader = Loader()
+    for specializer in (broken_specializer, broken_codegen):
+        specializing_loader = SpecializingLoader(
+            load_simple_collection, specializer, SpecializationPolicy("eager")
+        )
+        # The generic handler loads the value, and the type form is not specialized
+        for _ in range(2):
+            assert specializing_loader([1, 2], list[int], (), loader) == [1, 2]
+        (report,) = specializing_loader.report()
+        assert (report.state, report.reason) == ("unspecializable", "unsupported")
+
+
+def test_loader_closure_backend() -> None:
+    from dataclasses import dataclass, field
+
+    from tressed.exceptions import TressedValueError
+    from tressed.loader import Loader
+
+    @dataclass
+    class SomeDataclass:
+        foo: int
+        bar: list[tuple[int, str]]
+        baz: float = 0.0
+        tags: set[str] = field(default_factory=set)
+
+    loader = Loader(specialization_backend="closure", enable_specialization=True)
+    generic_loader = Loader()
+    type_form = dict[str, list[SomeDataclass]]
+    value = {
+        str(i): [{"foo": i, "bar": [[i, "a"], (i, "b")], "baz": i, "tags": ["x"]}]
+        for i in range(10)
+    }
+    for _ in range(5):
+        assert loader.load(value, type_form) == generic_loader.load(value, type_form)
+
+    specialized = _specialized(loader)
+    assert {type_form, list[SomeDataclass], SomeDataclass} <= specialized.keys()
+    assert all(
+        specialized_loader.__module__ == "tressed.loader.composers"
+        for specialized_loader in specialized.values()
+        if specialized_loader != 0 and type(specialized_loader) is not int
+    )
+
+    # Errors are reported at the same type path as without specialization
+    invalid = {**value, "0": [{"foo": 0, "bar": [[0, "a"], ["b", 0]]}]}
+    for loader_ in (loader, generic_loader):
+        with pytest.raises(TressedValueError) as exc_info:
+            loader_.load(invalid, type_form)
+        assert exc_info.value.type_path == ("0", 0, "bar", 1, 0)
+
+
+def test_specialization_report() -> None:
+    from dataclasses import dataclass
+
+    from tressed.dumper import Dumper
+    from tressed.loader import Loader, SpecializationPolicy
+
+    @dataclass
+    class SomeDataclass:
+        foo: int
+
+    policy = SpecializationPolicy(threshold=2, deny=[set])
+    loader = Loader(specialization_policy=policy)
+    for _ in range(3):
+        loader.load([1, 2], list[int])
+    loader.load([{"foo": 1}], tuple[SomeDataclass, ...])
+    loader.load([1], set[int])
+
+    reports = {report.key: report for report in loader.specialization_report()}
+    assert reports.keys() == {
+        list[int],
+        tuple[SomeDataclass, ...],
+        SomeDataclass,
+        set[int],
+    }
+
+    compiled = reports[list[int]]
+    assert compiled.handler == "load_simple_collection"
+    assert (compiled.state, compiled.calls, compiled.reason) == ("compiled", 3, None)
+    assert compiled.compile_time is not None and compiled.compile_time > 0
+    assert compiled.source is not None
+    assert compiled.source.startswith("def __specialized_fn(value, type_path, loader):")
+
+    counting = reports[SomeDataclass]
+    assert counting.handler == "load_dataclass"
+    assert (counting.state, counting.calls) == ("counting", 1)
+    assert counting.compile_time is None and counting.source is None
+
+    denied = reports[set[int]]
+    assert (denied.state, denied.calls, denied.reason) == (
+        "unspecializable",
+        1,
+        "denied",
+    )
+
+    # Specialized calls keep being counted
+    loader.load([1, 2], list[int])
+    (compiled,) = [
+        report for report in loader.specialization_report() if report.key == list[int]
+    ]
+    assert compiled.calls == 4
+
+    # Closures have no source
+    loader = Loader(specialization_policy=policy, specialization_backend="closure")
+    for _ in range(3):
+        loader.load([1, 2], list[int])
+    (compiled,) = loader.specialization_report()
+    assert (compiled.state, compiled.source) == ("compiled", None)
+
+    dumper = Dumper(specialization_policy=SpecializationPolicy("eager"))
+    dumper.dump([SomeDataclass(1), SomeDataclass(2)])
+    (compiled,) = dumper.specialization_report()
+    assert (compiled.key, compiled.handler) == (SomeDataclass, "dump_dataclass")
+    assert (compiled.state, compiled.calls) == ("compiled", 2)
+    assert compiled.source is not None
+    assert compiled.source.startswith("def __specialized_fn(value, type_path, dumper):")
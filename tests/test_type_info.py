@@ -0,0 +1,91 @@
+from tressed.type_info import get_type_info
+
+
+def test_type_info_generic() -> None:
+    from typing import List
+
+    type_info = get_type_info(list[int])
+    assert type_info.kind == "generic"
+    assert type_info.origin is list
+    assert type_info.args == (int,)
+    assert get_type_info(list[int]) is type_info
+
+    assert get_type_info(List[int]).origin is list
+    assert get_type_info(tuple[()]).args == ()
+
+
+def test_type_info_class() -> None:
+    type_info = get_type_info(int)
+    assert type_info.kind == "class"
+    assert type_info.origin is None
+    assert type_info.args == ()
+    assert type_info.inner is None
+
+
+def test_type_info_union_and_literal() -> None:
+    from typing import Literal, Optional, Union
+
+    assert get_type_info(int | str).kind == "union"
+    assert get_type_info(int | str).args == (int, str)
+    assert get_type_info(Union[int, str]).kind == "union"
+    assert get_type_info(Optional[int]).args == (int, type(None))
+    assert get_type_info(Literal[1, "foo"]).kind == "literal"
+    assert get_type_info(Literal[1, "foo"]).args == (1, "foo")
+
+
+def test_type_info_annotated() -> None:
+    from typing import Annotated
+
+    type_info = get_type_info(Annotated[list[int], "foo", "bar"])
+    assert type_info.kind == "annotated"
+    assert type_info.inner == list[int]
+    assert type_info.metadata == ("foo", "bar")
+
+
+def test_type_info_newtype() -> None:
+    from typing import NewType
+
+    UserId = NewType("UserId", int)
+    AdminId = NewType("AdminId", UserId)
+
+    type_info = get_type_info(AdminId)
+    assert type_info.kind == "newtype"
+    assert type_info.inner is int
+    assert type_info.supertype is UserId
+
+
+def test_type_info_type_alias() -> None:
+    type Pair[T] = tuple[T, T]
+    type IntPair = Pair[int]
+
+    assert get_type_info(IntPair).kind == "type_alias"
+    assert get_type_info(IntPair).inner == Pair[int]
+    assert get_type_info(Pair[str]).inner == tuple[str, str]
+    assert get_type_info(Pair).inner is None
+
+    # Type aliases failing to evaluate are left to loading to report
+    type Undefined = list[NotDefined]  # type: ignore[name-defined]  # noqa: F821
+    assert get_type_info(Undefined).kind == "type_alias"
+    assert get_type_info(Undefined).inner is None
+    assert get_type_info(Pair[int, int]).inner is None  # type: ignore[arg-type]
+
+
+def test_type_info_cache_size() -> None:
+    from tressed import type_info as type_info_module
+    from tressed.type_info import set_type_info_cache_size
+
+    type_infos = type_info_module._type_infos
+    try:
+        set_type_info_cache_size(1)
+        assert len(type_infos) <= 1
+
+        get_type_info(list[int])
+        get_type_info(list[str])
+        assert list(type_infos) == [list[str]]
+
+        set_type_info_cache_size(0)
+        assert not type_infos
+        assert get_type_info(list[int]).args == (int,)
+        assert not type_infos
+    finally:
+        set_type_info_cache_size(4096)
@@ -0,0 +1,56 @@
+def test_type_path_node() -> None:
+    import pickle
+
+    from tressed.type_path import TypePathNode, materialize_type_path
+
+    type_path = TypePathNode((TypePathNode((("foo",), 1)), "bar"))
+
+    assert type_path.materialize() == ("foo", 1, "bar")
+    assert type(materialize_type_path(type_path)) is tuple
+    assert materialize_type_path(("foo",)) == ("foo",)
+
+    assert type_path == ("foo", 1, "bar")
+    assert hash(type_path) == hash(("foo", 1, "bar"))
+    assert len(type_path) == 3
+    assert list(type_path) == ["foo", 1, "bar"]
+    assert (*type_path, 2) == ("foo", 1, "bar", 2)
+    assert type_path[-1] == "bar"
+    assert type_path[:2] == ("foo", 1)
+    assert "bar" in type_path
+    assert repr(type_path) == "('foo', 1, 'bar')"
+    assert pickle.loads(pickle.dumps(type_path)) == ("foo", 1, "bar")
+
+    assert TypePathNode(((), 0)) == (0,)
+
+
+def test_type_path_node_operators() -> None:
+    from tressed.type_path import TypePathNode
+
+    type_path = TypePathNode((TypePathNode((("x",), 1)), "y"))
+
+    assert TypePathNode((TypePathNode(((), "x")), 1)) < ("x", 2)
+    assert type_path > ("x", 1)
+    assert type_path >= ("x", 1, "y")
+    assert type_path <= ("x", 1, "y")
+    assert ("x", 1) < type_path
+    assert not TypePathNode(((), "x")) < TypePathNode(((), "x"))
+    assert sorted([type_path, ("x", 0)]) == [("x", 0), ("x", 1, "y")]
+
+    assert type_path * 2 == ("x", 1, "y", "x", 1, "y")
+    assert 2 * type_path == ("x", 1, "y", "x", 1, "y")
+    assert type_path.index("y") == 2
+    assert type_path.count(1) == 1
+
+
+def test_type_path_materialized_on_error() -> None:
+    import pytest
+
+    from tressed.exceptions import TressedValueError
+    from tressed.loader import Loader
+
+    loader = Loader()
+    with pytest.raises(TressedValueError) as exc_info:
+        loader.load({"foo": [[1], [2, "3"]]}, dict[str, list[list[int]]])
+
+    assert type(exc_info.value.type_path) is tuple
+    assert exc_info.value.type_path == ("foo", 1, 1)